@@ -11,10 +11,34 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Imported at module level (not inside the factory) so `gunicorn --preload`
+# pays for them once in the master instead of in every fresh worker.
+from fragment_cache import init_fragment_cache
+from assets import init_assets
+from compression import init_compression
+from json_provider import init_json
+from startup import configure_templates, start_background_workers
+from db import init_read_routing
+from sharding import init_sharding
+from rate_limit import init_rate_limits
+from routes.auth_routes import auth_bp
+from routes.board_routes import boards_bp
+from routes.dashboard_routes import dashboard_bp
+from routes.export_routes import exports_bp
+from routes.import_routes import imports_bp
+from routes.avatar_routes import avatars_bp, avatar_url
+from routes.me_routes import me_bp
+from routes.calendar_routes import calendar_bp
+from routes.jobs_routes import jobs_bp
+
 # ================================
 # CREATE APP (Factory Pattern)
 # ================================
-def create_app():
+def create_app(start_background=True):
+    """
+    start_background=False leaves background threads to the caller; wsgi.py
+    uses it so nothing threaded runs in the gunicorn master before fork.
+    """
     app = Flask(__name__, template_folder="templates", static_folder="static")
 
     # -----------------------------
@@ -29,6 +53,11 @@ def create_app():
         DEBUG=os.getenv("FLASK_ENV") == "development"
     )
 
+    # -----------------------------
+    # JSON (row objects from models/rows.py; orjson when available)
+    # -----------------------------
+    init_json(app)
+
     # -----------------------------
     # TEMPLATE FILTERS
     # -----------------------------
@@ -37,8 +66,8 @@ def create_app():
         return value.strftime(fmt) if value else ""
 
     @app.template_filter("avatar")
-    def avatar_url(username):
-        return f"https://ui-avatars.com/api/?name={username}&background=random&bold=true"
+    def avatar_filter(username):
+        return avatar_url(username)
 
     # -----------------------------
     # CONTEXT PROCESSORS
@@ -60,18 +89,49 @@ def create_app():
         return render_template("errors/500.html"), 500
 
     # -----------------------------
-    # BLUEPRINTS
+    # FRAGMENT CACHE (rendered board columns)
     # -----------------------------
-    from routes.auth_routes import auth_bp
-    from routes.board_routes import boards_bp
+    init_fragment_cache(app)
 
-    app.register_blueprint(boards_bp, url_prefix="/boards")
+    # -----------------------------
+    # READ REPLICAS (pin a user's reads to the primary right after a write)
+    # -----------------------------
+    init_read_routing(app)
+    init_sharding(app)
 
-    from routes.dashboard_routes import dashboard_bp
-    from routes.board_routes import boards_bp
+    # -----------------------------
+    # RATE LIMITS (token buckets shared by all workers)
+    # -----------------------------
+    init_rate_limits(app)
 
+    # -----------------------------
+    # BLUEPRINTS
+    # -----------------------------
+    app.register_blueprint(boards_bp, url_prefix="/boards")
     app.register_blueprint(auth_bp, url_prefix="/auth")
     app.register_blueprint(dashboard_bp, url_prefix="/dashboard")
+    app.register_blueprint(exports_bp, url_prefix="/exports")
+    app.register_blueprint(imports_bp, url_prefix="/imports")
+    app.register_blueprint(avatars_bp, url_prefix="/avatars")
+    app.register_blueprint(me_bp, url_prefix="/me")
+    app.register_blueprint(calendar_bp, url_prefix="/calendar")
+    app.register_blueprint(jobs_bp, url_prefix="/jobs")
+
+    # -----------------------------
+    # STATIC ASSETS (hashed names, precompressed, immutable)
+    # -----------------------------
+    init_assets(app)
+
+    # -----------------------------
+    # RESPONSE COMPRESSION (HTML / JSON / exports)
+    # -----------------------------
+    init_compression(app)
+
+    # -----------------------------
+    # TEMPLATES (bytecode cache on disk + eager compile)
+    # -----------------------------
+    # After blueprints, so their template folders are included
+    configure_templates(app)
 
     # -----------------------------
     # ROOT ROUTE
@@ -109,6 +169,13 @@ def create_app():
 
     app.login_required = login_required  # ← Make available globally
 
+    # -----------------------------
+    # BACKGROUND WORKERS
+    # -----------------------------
+    # Deleted boards/projects are removed in small batches off the request path
+    if start_background:
+        start_background_workers()
+
     return app
 
 
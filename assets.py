@@ -0,0 +1,183 @@
+# ==============================================================
+# FILE: assets.py
+# PURPOSE: Static asset pipeline – vendor, fingerprint, precompress, serve
+# ==============================================================
+#   python assets.py             -> vendor libraries (if missing) + build static/dist
+#   python assets.py --refresh   -> re-download vendored libraries too
+#
+# The build copies every file under static/ to static/dist/ with a content
+# hash in its name (css/style.css -> css/style.3f9c1a2b7e.css), writes .gz
+# (and .br when the `brotli` package is installed) next to it, and records
+# the mapping in static/dist/manifest.json. At runtime url_for('static', ...)
+# emits the hashed name, and hashed files are served with far-future
+# immutable caching and Accept-Encoding negotiation.
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import sys
+import urllib.request
+
+from flask import request, send_from_directory, url_for
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+
+# Third-party libraries served from our own origin instead of a CDN
+VENDOR = {
+    "vendor/Sortable.min.js": "https://cdn.jsdelivr.net/npm/sortablejs@1.15.0/Sortable.min.js",
+}
+
+COMPRESSIBLE = {".css", ".js", ".svg", ".json", ".html", ".txt", ".map"}
+MIN_COMPRESS_SIZE = 512
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+# ================================
+# BUILD
+# ================================
+def vendor_libraries(refresh=False):
+    for rel_path, src in VENDOR.items():
+        target = os.path.join(STATIC_DIR, rel_path)
+        if os.path.exists(target) and not refresh:
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        print(f"Downloading {src}")
+        try:
+            with urllib.request.urlopen(src, timeout=30) as resp:
+                data = resp.read()
+        except OSError as err:
+            print(f"⚠️  Could not vendor {rel_path} ({err}); templates keep using the CDN URL")
+            continue
+        with open(target, "wb") as out:
+            out.write(data)
+
+
+def _hashed_name(rel_path, data):
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    root, ext = os.path.splitext(rel_path)
+    return f"{root}.{digest}{ext}"
+
+
+def _write_variants(path, data):
+    if os.path.splitext(path)[1] not in COMPRESSIBLE or len(data) < MIN_COMPRESS_SIZE:
+        return
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(path + ".gz", "wb") as f:
+            f.write(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            with open(path + ".br", "wb") as f:
+                f.write(br)
+
+
+def build_assets():
+    """
+    Rebuilds static/dist from scratch. Returns the manifest.
+    """
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    manifest = {}
+
+    for dirpath, dirnames, filenames in os.walk(STATIC_DIR):
+        if os.path.abspath(dirpath).startswith(DIST_DIR):
+            continue
+        dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) != DIST_DIR]
+        for filename in filenames:
+            src = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(src, STATIC_DIR).replace(os.sep, "/")
+            with open(src, "rb") as f:
+                data = f.read()
+            if not data:
+                continue
+
+            hashed = _hashed_name(rel_path, data)
+            target = os.path.join(DIST_DIR, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(data)
+            _write_variants(target, data)
+            manifest[rel_path] = hashed
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+# ================================
+# RUNTIME
+# ================================
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _pick_encoding(path):
+    """
+    Returns (suffix, content-encoding) of the best precompressed variant the
+    client accepts, or ("", None) for the plain file.
+    """
+    accepted = request.accept_encodings
+    for suffix, encoding in ((".br", "br"), (".gz", "gzip")):
+        if accepted[encoding] > 0 and os.path.isfile(os.path.join(DIST_DIR, path + suffix)):
+            return suffix, encoding
+    return "", None
+
+
+def init_assets(app):
+    manifest = load_manifest()
+    app.extensions["asset_manifest"] = manifest
+
+    # url_for('static', filename='css/style.css') -> /static/dist/css/style.<hash>.css
+    @app.url_defaults
+    def hashed_static_urls(endpoint, values):
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = "dist/" + manifest[values["filename"]]
+
+    default_static = app.view_functions["static"]
+
+    def static(filename):
+        if not filename.startswith("dist/"):
+            return default_static(filename=filename)
+
+        path = filename[len("dist/"):]
+        suffix, encoding = _pick_encoding(path)
+        mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        response = send_from_directory(DIST_DIR, path + suffix, mimetype=mimetype, max_age=31536000)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Cache-Control"] = IMMUTABLE
+        response.vary.add("Accept-Encoding")
+        return response
+
+    app.view_functions["static"] = static
+
+    @app.template_global()
+    def asset_url(path):
+        """
+        URL for a static asset; vendored libraries fall back to their CDN
+        until `python assets.py` has downloaded them.
+        """
+        if path not in manifest and path in VENDOR and not os.path.isfile(os.path.join(STATIC_DIR, path)):
+            return VENDOR[path]
+        return url_for("static", filename=path)
+
+
+if __name__ == "__main__":
+    vendor_libraries(refresh="--refresh" in sys.argv)
+    result = build_assets()
+    print(f"✅ Built {len(result)} assets into {os.path.relpath(DIST_DIR)} "
+          f"(brotli {'on' if brotli else 'off – pip install Brotli'})")
@@ -0,0 +1,130 @@
+# ==============================================================
+# FILE: benchmarks/backend_benchmark.py
+# PURPOSE: Compare the hot model-layer operations across storage backends
+# ==============================================================
+#   python benchmarks/backend_benchmark.py                       (sqlite only)
+#   python benchmarks/backend_benchmark.py --backends sqlite,mysql --tasks 20000
+#
+# Each backend gets its own fixture (user, project, board) and then runs the
+# same workload through the real model functions: bulk import, board reads
+# with and without filters, status updates, the My Tasks feed, a full export
+# and comments. SQLite runs against a throwaway file; the MySQL run WRITES
+# into the configured database (use a scratch schema).
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from werkzeug.datastructures import MultiDict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import Config
+from db import get_db
+from models.boards_model import get_tasks_by_board, update_task_status
+from models.comments_model import add_comment, list_comments
+from models.export_model import iter_project_tasks
+from models.import_model import import_tasks
+from models.my_tasks_model import get_my_tasks
+from models.task_query import compile_task_filters, PRIORITIES, STATUSES
+
+WORDS = ["login", "payment", "report", "search", "upload", "cache", "email", "invoice"]
+
+
+def fixture():
+    """A fresh user, project, membership and board; returns (user_id, project_id, board_id, username)."""
+    tag = uuid.uuid4().hex[:10]
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
+                (f"bench_{tag}", f"bench_{tag}@example.com", "x")
+            )
+            user_id = cur.lastrowid
+            cur.execute("INSERT INTO projects (name, owner_id) VALUES (%s, %s)", (f"Bench {tag}", user_id))
+            project_id = cur.lastrowid
+            cur.execute(
+                "INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, 'owner')",
+                (project_id, user_id)
+            )
+            cur.execute("INSERT INTO boards (project_id, name) VALUES (%s, %s)", (project_id, "Bench"))
+            board_id = cur.lastrowid
+            conn.commit()
+    return user_id, project_id, board_id, f"bench_{tag}"
+
+
+def records(count, username):
+    today = date.today()
+    for i in range(count):
+        yield i + 1, {
+            'title': f"{WORDS[i % len(WORDS)]} task {i}",
+            'description': f"Fix the {WORDS[(i * 3) % len(WORDS)]} flow",
+            'status': STATUSES[i % len(STATUSES)],
+            'priority': PRIORITIES[i % len(PRIORITIES)],
+            'assignee': username if i % 2 else None,
+            'due_date': (today + timedelta(days=i % 60)).isoformat(),
+            'labels': None,
+        }
+
+
+def timed(name, ops, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = ops / elapsed if elapsed else 0
+    print(f"  {name:<22} ops={ops:<7} time={elapsed:7.3f}s  {rate:>11,.0f} ops/sec")
+
+
+def run_backend(backend, tasks, repeat):
+    Config.DB_BACKEND = backend
+    print(f"\n[{backend}]" + (f" {Config.SQLITE_PATH}" if backend == "sqlite" else ""))
+    user_id, project_id, board_id, username = fixture()
+
+    timed("import (rows)", tasks, lambda: import_tasks(board_id, records(tasks, username), user_id))
+
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM tasks WHERE board_id = %s ORDER BY id", (board_id,))
+            task_ids = [row[0] for row in cur.fetchall()]
+
+    timed("board read", repeat, lambda: [get_tasks_by_board(board_id) for _ in range(repeat)])
+    filters = compile_task_filters(MultiDict({"q": "login", "sort": "priority"}), current_user_id=user_id)
+    timed("board read (q, sort)", repeat,
+          lambda: [get_tasks_by_board(board_id, filters=filters) for _ in range(repeat)])
+
+    updates = min(len(task_ids), repeat * 10)
+    timed("status update", updates,
+          lambda: [update_task_status(task_id, STATUSES[n % len(STATUSES)])
+                   for n, task_id in enumerate(task_ids[:updates])])
+
+    def my_tasks_pages():
+        cursor = None
+        for _ in range(repeat):
+            # Walk the feed, starting over after the last page
+            _, cursor = get_my_tasks(user_id, sort='due', cursor=cursor, limit=50)
+    timed("my tasks page", repeat, my_tasks_pages)
+
+    timed("export (rows)", len(task_ids), lambda: sum(1 for _ in iter_project_tasks(project_id)))
+
+    comments = repeat * 10
+    timed("add comment", comments,
+          lambda: [add_comment(task_ids[0], user_id, f"comment {n}") for n in range(comments)])
+    timed("list comments page", repeat, lambda: [list_comments(task_ids[0]) for _ in range(repeat)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Storage backend benchmark")
+    parser.add_argument("--backends", default="sqlite", help="comma-separated: sqlite,mysql")
+    parser.add_argument("--tasks", type=int, default=10000, help="tasks imported per backend")
+    parser.add_argument("--repeat", type=int, default=50, help="iterations of each read")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.SQLITE_PATH = os.path.join(tmp, "bench.db")
+        for backend in args.backends.split(","):
+            if backend.strip() == "mysql":
+                print("\nWARNING: the mysql run writes a bench project into", Config.MYSQL_DB)
+            run_backend(backend.strip(), args.tasks, args.repeat)
@@ -0,0 +1,88 @@
+# ==============================================================
+# FILE: benchmarks/compression_benchmark.py
+# PURPOSE: CPU cost vs bytes saved when compressing board pages
+# ==============================================================
+#   python benchmarks/compression_benchmark.py --cards 400
+#   python benchmarks/compression_benchmark.py --url http://localhost:5000/boards/boards/1 --cookie "session=..."
+#
+# Without --url the real board_view.html / _column.html templates are
+# rendered with generated cards (no database needed).
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+from datetime import date
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("JOB_WORKER_THREADS", "0")
+
+from flask import render_template
+from markupsafe import Markup
+from app import create_app
+from compression import compress, brotli
+
+STATUSES = ['To Do', 'In Progress', 'Review', 'Done']
+
+
+def render_board_page(cards):
+    app = create_app(start_background=False)
+    per_column = cards // len(STATUSES)
+    tasks = {
+        status: [
+            {'id': i, 'title': f"Task {i}: implement feature {i % 37}", 'due_date': date(2025, 11, 1 + i % 28),
+             'assigned_to': i % 9 or None, 'assigned_username': f"user{i % 9}"}
+            for i in range(per_column)
+        ]
+        for status in STATUSES
+    }
+    board = {'id': 1, 'name': "Sprint 1", 'project_id': 1, 'task_version': 1}
+    with app.test_request_context("/boards/boards/1"):
+        columns = {
+            s: Markup(render_template("boards/_column.html", status=s, tasks=tasks, board=board, can_edit=True))
+            for s in STATUSES
+        }
+        html = render_template("boards/board_view.html", board=board, columns=columns,
+                               project={'name': "GitBoard MVP"}, user_role='owner', can_edit=True)
+    json_body = json.dumps([t for s in STATUSES for t in tasks[s]], default=str)
+    return html.encode("utf-8"), json_body.encode("utf-8")
+
+
+def fetch(url, cookie):
+    req = urllib.request.Request(url, headers={"Cookie": cookie or "", "Accept-Encoding": "identity"})
+    with urllib.request.urlopen(req) as resp:
+        return resp.read()
+
+
+def bench(label, data, repeat):
+    print(f"\n{label}: {len(data) / 1024:.1f} KB uncompressed")
+    variants = [("gzip", level, None) for level in (1, 3, 6, 9)]
+    if brotli is not None:
+        variants += [("br", None, q) for q in (1, 4, 6, 11)]
+    for encoding, level, quality in variants:
+        start = time.process_time()
+        for _ in range(repeat):
+            out = compress(data, encoding, level=level, br_quality=quality)
+        cpu_ms = (time.process_time() - start) / repeat * 1000
+        saved = 100 * (1 - len(out) / len(data))
+        setting = f"level={level}" if encoding == "gzip" else f"q={quality}"
+        print(f"  {encoding:<4} {setting:<9} cpu={cpu_ms:7.3f} ms  size={len(out) / 1024:7.1f} KB  "
+              f"saved={saved:5.1f}%  KB saved per CPU ms={(len(data) - len(out)) / 1024 / max(cpu_ms, 1e-6):8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response compression benchmark")
+    parser.add_argument("--cards", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url", help="fetch a live page instead of rendering one")
+    parser.add_argument("--cookie", help="session cookie for --url")
+    args = parser.parse_args()
+
+    if args.url:
+        bench(args.url, fetch(args.url, args.cookie), args.repeat)
+    else:
+        html, json_body = render_board_page(args.cards)
+        bench(f"board page ({args.cards} cards)", html, args.repeat)
+        bench(f"task JSON ({args.cards} tasks)", json_body, args.repeat)
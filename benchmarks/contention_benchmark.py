@@ -0,0 +1,113 @@
+# ==============================================================
+# FILE: benchmarks/contention_benchmark.py
+# PURPOSE: Throughput and lost updates with concurrent editors on hot cards
+# ==============================================================
+#   python benchmarks/contention_benchmark.py                          (DB_BACKEND)
+#   python benchmarks/contention_benchmark.py --editors 16 --cards 2 --seconds 10
+#   DB_BACKEND=sqlite python benchmarks/contention_benchmark.py --mode blind
+#
+# Every editor loops read -> increment the counter in the title -> write.
+#   cas    update_task(expected_version=...) and re-read + retry on conflict
+#   blind  the old unconditional UPDATE (last writer wins)
+# At the end the counters are compared with the number of successful
+# writes: blind mode shows how many increments were silently lost, cas mode
+# should lose none and reports how many retries that cost. Writes go into
+# the configured database (a throwaway board per run).
+
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from db import get_db
+from models.boards_model import ConflictError, get_task, update_task
+
+
+def fixture(cards):
+    """A throwaway board with `cards` tasks titled 'counter 0'; returns their ids."""
+    tag = uuid.uuid4().hex[:10]
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
+                (f"bench_{tag}", f"bench_{tag}@example.com", "x")
+            )
+            user_id = cur.lastrowid
+            cur.execute("INSERT INTO projects (name, owner_id) VALUES (%s, %s)", (f"Bench {tag}", user_id))
+            cur.execute("INSERT INTO boards (project_id, name) VALUES (%s, %s)", (cur.lastrowid, "Contention"))
+            board_id = cur.lastrowid
+            task_ids = []
+            for _ in range(cards):
+                cur.execute(
+                    "INSERT INTO tasks (board_id, title, created_by) VALUES (%s, %s, %s)",
+                    (board_id, "counter 0", user_id)
+                )
+                task_ids.append(cur.lastrowid)
+            conn.commit()
+    return task_ids
+
+
+def counter(task):
+    return int(task['title'].split()[-1])
+
+
+def editor(mode, task_ids, deadline, stats, lock, index):
+    writes = conflicts = 0
+    n = index
+    while time.perf_counter() < deadline:
+        task_id = task_ids[n % len(task_ids)]
+        n += 1
+        task = get_task(task_id)
+        while True:
+            title = f"counter {counter(task) + 1}"
+            if mode == "blind":
+                update_task(task_id, title=title)
+                break
+            try:
+                update_task(task_id, expected_version=task['version'], title=title)
+                break
+            except ConflictError as e:
+                conflicts += 1
+                task = e.current  # the 409 body: retry on top of it, no extra read
+        writes += 1
+    with lock:
+        stats['writes'] += writes
+        stats['conflicts'] += conflicts
+
+
+def run(mode, editors, cards, seconds):
+    task_ids = fixture(cards)
+    stats = {'writes': 0, 'conflicts': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    threads = [
+        threading.Thread(target=editor, args=(mode, task_ids, deadline, stats, lock, i))
+        for i in range(editors)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    applied = sum(counter(get_task(task_id)) for task_id in task_ids)
+    lost = stats['writes'] - applied
+    print(f"{mode:<6} editors={editors:<3} cards={cards:<3} writes={stats['writes']:<7} "
+          f"{stats['writes'] / elapsed:>9,.0f} writes/sec  conflicts={stats['conflicts']:<6} "
+          f"lost={lost} ({lost / max(stats['writes'], 1):.1%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent editor contention benchmark")
+    parser.add_argument("--mode", choices=["cas", "blind", "both"], default="both")
+    parser.add_argument("--editors", type=int, default=8, help="concurrent editor threads")
+    parser.add_argument("--cards", type=int, default=1, help="hot tasks they share")
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    for mode in (["blind", "cas"] if args.mode == "both" else [args.mode]):
+        run(mode, args.editors, args.cards, args.seconds)
@@ -0,0 +1,88 @@
+# ==============================================================
+# FILE: benchmarks/driver_benchmark.py
+# PURPOSE: MySQL driver modes: pure Python vs C extension, text vs prepared
+# ==============================================================
+#   python benchmarks/driver_benchmark.py
+#   python benchmarks/driver_benchmark.py --tasks 20000 --lookups 20000
+#
+# Runs the same reads through the real model functions once per mode
+# (MYSQL_USE_PURE x MYSQL_PREPARED_STATEMENTS, rebuilding the pool each
+# time):
+#   get_task          primary-key lookup, latency p50 / p99
+#   get_board_tasks   full board, rows/sec
+# The C extension modes are skipped when it isn't installed. MySQL only:
+# WRITES a bench project into the configured database (use a scratch schema).
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import mysql.connector
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import db
+from config import Config
+from models.boards_model import get_board_tasks, get_task
+from models.import_model import import_tasks
+
+from backend_benchmark import fixture, records
+
+
+def reset_pool():
+    db._pool = None
+    db._pool_pid = None
+
+
+def lookups(task_ids, count):
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        get_task(task_ids[i % len(task_ids)])
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99)]
+
+
+def board_reads(board_id, repeat):
+    start = time.perf_counter()
+    total = sum(len(get_board_tasks(board_id)) for _ in range(repeat))
+    return total / (time.perf_counter() - start)
+
+
+def run(pure, prepared, task_ids, board_id, args):
+    Config.MYSQL_USE_PURE = pure
+    Config.MYSQL_PREPARED_STATEMENTS = prepared
+    reset_pool()
+    lookups(task_ids, 100)  # connect the pool and prepare
+    p50, p99 = lookups(task_ids, args.lookups)
+    rate = board_reads(board_id, args.repeat)
+    name = f"{'pure' if pure else 'cext'} / {'prepared' if prepared else 'text'}"
+    print(f"{name:<16} get_task p50={p50 * 1e6:7.0f} us  p99={p99 * 1e6:7.0f} us   "
+          f"get_board_tasks {rate:>11,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MySQL driver mode benchmark")
+    parser.add_argument("--tasks", type=int, default=5000, help="cards on the bench board")
+    parser.add_argument("--lookups", type=int, default=5000, help="get_task calls per mode")
+    parser.add_argument("--repeat", type=int, default=20, help="full board reads per mode")
+    args = parser.parse_args()
+
+    Config.DB_BACKEND = "mysql"
+    print("WARNING: writes a bench project into", Config.MYSQL_DB)
+    user_id, project_id, board_id, username = fixture()
+    import_tasks(board_id, records(args.tasks, username), user_id)
+    with db.get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM tasks WHERE board_id = %s", (board_id,))
+            task_ids = [task_id for (task_id,) in cur.fetchall()]
+
+    modes = [(True, False), (True, True)]
+    if mysql.connector.HAVE_CEXT:
+        modes += [(False, False), (False, True)]
+    else:
+        print("C extension not installed: pure Python modes only")
+    for pure, prepared in modes:
+        run(pure, prepared, task_ids, board_id, args)
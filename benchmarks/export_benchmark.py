@@ -0,0 +1,68 @@
+# ==============================================================
+# FILE: benchmarks/export_benchmark.py
+# PURPOSE: Measure streaming export throughput (rows/sec) and peak memory
+# ==============================================================
+#   python benchmarks/export_benchmark.py --project 1          (real MySQL)
+#   python benchmarks/export_benchmark.py --synthetic 200000   (encoders only)
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, date
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from models.export_model import iter_project_tasks, iter_csv, iter_ndjson
+
+
+def synthetic_rows(count):
+    now = datetime.now()
+    for i in range(count):
+        yield {
+            'id': i, 'board_id': i % 20, 'board_name': f"Board {i % 20}",
+            'title': f"Task {i}", 'description': "Lorem ipsum dolor sit amet " * 4,
+            'status': 'To Do', 'priority': 'Medium', 'assigned_to': i % 50,
+            'assignee': f"user{i % 50}", 'due_date': date(2025, 11, 1 + i % 28),
+            'labels': 'bug|feature', 'comment_count': i % 7,
+            'created_at': now, 'updated_at': now,
+        }
+
+
+def run(name, encoder, rows_factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = 0
+    out_bytes = 0
+
+    def counted():
+        nonlocal rows
+        for row in rows_factory():
+            rows += 1
+            yield row
+
+    for chunk in encoder(counted()):
+        out_bytes += len(chunk)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rate = rows / elapsed if elapsed else 0
+    print(f"{name:<7} rows={rows:<9} time={elapsed:7.2f}s  {rate:>10,.0f} rows/sec  "
+          f"out={out_bytes / 1e6:8.1f} MB  peak_mem={peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming export benchmark")
+    parser.add_argument("--project", type=int, help="project id to export from MySQL")
+    parser.add_argument("--synthetic", type=int, help="number of generated rows (no database)")
+    args = parser.parse_args()
+
+    if args.project:
+        factory = lambda: iter_project_tasks(args.project)
+    else:
+        factory = lambda: synthetic_rows(args.synthetic or 100_000)
+
+    run("csv", iter_csv, factory)
+    run("ndjson", iter_ndjson, factory)
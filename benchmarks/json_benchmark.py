@@ -0,0 +1,82 @@
+# ==============================================================
+# FILE: benchmarks/json_benchmark.py
+# PURPOSE: Serialization throughput of large task lists per JSON provider
+# ==============================================================
+#   python benchmarks/json_benchmark.py
+#   python benchmarks/json_benchmark.py --tasks 50000 --repeat 10
+#
+# Encodes the body of GET /boards/<id>/tasks for a board of --tasks cards
+# (TaskCard rows with labels, dates and usernames, built in memory: no
+# database needed) through app.json.response(), i.e. exactly what jsonify
+# does, with:
+#   json    AppJSONProvider (the json module)
+#   orjson  OrjsonProvider, when orjson is installed
+# for full rows with HTTP dates (the default) and ISO dates (JSON_DATES=iso),
+# and for ?fields=id,title,status.
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from flask import Flask
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import Config
+from json_provider import AppJSONProvider, OrjsonProvider, orjson
+from models.rows import TaskCard, parse_fields
+from models.task_query import PRIORITIES, STATUSES
+
+LABELS = [{'id': 1, 'name': 'bug', 'color': '#EF4444'}, {'id': 2, 'name': 'ui', 'color': '#3B82F6'}]
+
+
+def board(count):
+    today = date.today()
+    now = datetime.now().replace(microsecond=0)
+    tasks = []
+    for i in range(count):
+        task = TaskCard(
+            i + 1, f"Task number {i}", i % 7 or None, f"user{i % 7}" if i % 7 else None,
+            PRIORITIES[i % len(PRIORITIES)], today + timedelta(days=i % 60), STATUSES[i % len(STATUSES)],
+            i % 5, 1 + i % 3, now - timedelta(minutes=i), now
+        )
+        task.labels = LABELS[:i % 3]
+        tasks.append(task)
+    return tasks
+
+
+def run(name, provider_class, tasks, fields, dates, repeat):
+    Config.JSON_DATES = dates
+    app = Flask(__name__)
+    app.json = provider_class(app)
+    times = []
+    with app.app_context():
+        for _ in range(repeat):
+            start = time.perf_counter()
+            body = tasks if fields is None else [task.to_dict(fields) for task in tasks]
+            response = app.json.response(tasks=body, count=len(tasks))
+            times.append(time.perf_counter() - start)
+    elapsed = statistics.median(times)
+    size = len(response.get_data())
+    print(f"{name:<8} dates={dates:<5} fields={'all' if fields is None else ','.join(fields):<16} "
+          f"{elapsed * 1000:8.1f} ms  {len(tasks) / elapsed:>11,.0f} rows/sec  "
+          f"{size / elapsed / 1e6:7.1f} MB/s  body={size / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON provider benchmark")
+    parser.add_argument("--tasks", type=int, default=10000, help="cards in the list")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tasks = board(args.tasks)
+    providers = [("json", AppJSONProvider)]
+    if orjson is not None:
+        providers.append(("orjson", OrjsonProvider))
+    else:
+        print("orjson not installed: json module only")
+    for fields, dates in ((None, "http"), (None, "iso"), (parse_fields("id,title,status", TaskCard), "http")):
+        for name, provider_class in providers:
+            run(name, provider_class, tasks, fields, dates, args.repeat)
@@ -0,0 +1,98 @@
+# ==============================================================
+# FILE: benchmarks/rate_limit_benchmark.py
+# PURPOSE: Per-request cost of the rate limiter, and that workers share buckets
+# ==============================================================
+#   python benchmarks/rate_limit_benchmark.py
+#   python benchmarks/rate_limit_benchmark.py --calls 200000 --processes 8
+#
+# 1. store.take() for the shared (mmap) and the per-process store, over
+#    many distinct users, in microseconds per call.
+# 2. The Flask before_request hook on a limited endpoint (rule lookup,
+#    session, key hashing, take) inside a request context.
+# 3. N processes hammer ONE bucket (count/period) for a few seconds: the
+#    admitted total must stay near count + rate * seconds, not N times that.
+#
+# No database needed; the shared file goes to a temporary directory.
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from flask import Flask, session
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import Config
+from rate_limit import LocalBuckets, SharedBuckets, bucket_key, init_rate_limits
+
+
+def per_call(name, store, calls, users):
+    keys = [bucket_key(f"boards.move_task_route|*|u:{i}") for i in range(users)]
+    start = time.perf_counter()
+    for i in range(calls):
+        store.take(keys[i % users], 1000.0, 1000)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<18} calls={calls:<8} {elapsed / calls * 1e6:7.2f} us/call")
+
+
+def hook_cost(path, calls):
+    Config.RATE_LIMIT_PATH = path
+    Config.RATE_LIMITS = "bench.limited=1000000/1:user"
+    app = Flask(__name__)
+    app.secret_key = "bench"
+    app.add_url_rule("/limited", "bench.limited", lambda: "ok")
+    init_rate_limits(app)
+    hook = app.before_request_funcs[None][-1]
+
+    with app.test_request_context("/limited", method="POST"):
+        session["user_id"] = 42
+        start = time.perf_counter()
+        for _ in range(calls):
+            hook()
+        elapsed = time.perf_counter() - start
+    print(f"{'before_request':<18} calls={calls:<8} {elapsed / calls * 1e6:7.2f} us/call")
+
+
+def _hammer(path, count, period, seconds, results):
+    store = SharedBuckets(path, Config.RATE_LIMIT_SLOTS)
+    key = bucket_key("auth.login|POST|ip:203.0.113.7")
+    admitted = 0
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        if not store.take(key, count / period, count):
+            admitted += 1
+    results.put(admitted)
+
+
+def shared_check(path, processes, count, period, seconds):
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_hammer, args=(path, count, period, seconds, results))
+        for _ in range(processes)
+    ]
+    for w in workers:
+        w.start()
+    admitted = [results.get() for _ in workers]
+    for w in workers:
+        w.join()
+    expected = count + count / period * seconds
+    print(f"{processes} processes x {seconds}s on one {count}/{period}s bucket: admitted {sum(admitted)} "
+          f"(expected ~{expected:.0f}, per process {admitted})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rate limiter benchmark")
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=5000, help="distinct buckets touched")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ratelimit.bin")
+        per_call("shared (mmap)", SharedBuckets(path, Config.RATE_LIMIT_SLOTS), args.calls, args.users)
+        per_call("local (per worker)", LocalBuckets(Config.RATE_LIMIT_SLOTS), args.calls, args.users)
+        hook_cost(path, args.calls)
+        shared_check(path, args.processes, 100, 10, args.seconds)
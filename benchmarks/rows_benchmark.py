@@ -0,0 +1,120 @@
+# ==============================================================
+# FILE: benchmarks/rows_benchmark.py
+# PURPOSE: Per-row dicts vs slotted row objects on a large board
+# ==============================================================
+#   python benchmarks/rows_benchmark.py                     (sqlite temp file)
+#   DB_BACKEND=mysql python benchmarks/rows_benchmark.py --tasks 20000
+#
+# Loads every card of one board two ways:
+#   dicts  the old dictionary cursor over SELECT t.*, u.username
+#   rows   a tuple cursor over TaskCard.COLUMNS -> rows(cur, TaskCard)
+# and reports fetch + build time, the memory the result list keeps alive
+# (tracemalloc) and the time to encode it with the app's JSON provider.
+# SQLite runs against a throwaway file; a MySQL run WRITES into the
+# configured database.
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from flask import Flask
+
+from config import Config
+from db import get_db
+from json_provider import init_json
+from models.rows import TaskCard, rows
+
+from contention_benchmark import fixture
+
+DICT_QUERY = """
+    SELECT t.*, u.username AS assigned_username
+    FROM tasks t
+    LEFT JOIN users u ON u.id = t.assigned_to
+    WHERE t.board_id = %s AND t.is_deleted = FALSE
+"""
+ROW_QUERY = f"""
+    SELECT {TaskCard.COLUMNS}
+    FROM tasks t
+    LEFT JOIN users u ON u.id = t.assigned_to
+    WHERE t.board_id = %s AND t.is_deleted = FALSE
+"""
+
+
+def board_with(tasks):
+    task_ids = fixture(1)
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT board_id, created_by FROM tasks WHERE id = %s", (task_ids[0],))
+            board_id, user_id = cur.fetchone()
+            cur.executemany(
+                "INSERT INTO tasks (board_id, title, description, assigned_to, created_by) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                [(board_id, f"task {i}", "A description of a few words " * 4, user_id, user_id)
+                 for i in range(tasks - 1)]
+            )
+            conn.commit()
+    return board_id
+
+
+def load_dicts(board_id):
+    with get_db() as conn:
+        with conn.cursor(dictionary=True) as cur:
+            cur.execute(DICT_QUERY, (board_id,))
+            return cur.fetchall()
+
+
+def load_rows(board_id):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(ROW_QUERY, (board_id,))
+            return rows(cur, TaskCard)
+
+
+def retained(load, board_id):
+    gc.collect()
+    tracemalloc.start()
+    result = load(board_id)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def run(name, load, serialize, board_id, repeat):
+    load(board_id)  # warm the page cache / statement cache
+    load_times, json_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = load(board_id)
+        load_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        serialize(result)
+        json_times.append(time.perf_counter() - start)
+    size = retained(load, board_id)
+    print(f"{name:<6} rows={len(result):<7} load={statistics.median(load_times) * 1000:8.2f} ms  "
+          f"json={statistics.median(json_times) * 1000:7.2f} ms  "
+          f"retained={size / 1024 / 1024:7.2f} MiB ({size / len(result):6.0f} B/row)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Row dict vs row object benchmark")
+    parser.add_argument("--tasks", type=int, default=10000, help="cards on the board")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if Config.DB_BACKEND == "sqlite":
+            Config.SQLITE_PATH = os.path.join(tmp, "bench.db")
+        else:
+            print("WARNING: writes a bench board into", Config.MYSQL_DB)
+        board_id = board_with(args.tasks)
+        app = Flask(__name__)
+        init_json(app)
+        run("dicts", load_dicts, app.json.dumps, board_id, args.repeat)
+        run("rows", load_rows, app.json.dumps, board_id, args.repeat)
@@ -0,0 +1,133 @@
+# ==============================================================
+# FILE: benchmarks/shard_benchmark.py
+# PURPOSE: Project shards: routing overhead, scatter-gather reads, online moves
+# ==============================================================
+#   python benchmarks/shard_benchmark.py                     (SQLite files in a temp dir)
+#   python benchmarks/shard_benchmark.py --shards 4 --projects 8 --tasks 5000
+#   SHARDS=1=127.0.0.1:3307,2=127.0.0.1:3308 python benchmarks/shard_benchmark.py --mysql
+#
+# Builds --projects projects on shard 0, all sharing one member who is
+# assigned half of every project's tasks, then spreads them over the shards
+# with move_project (the online move, with a 0 s directory TTL), checking
+# that every board, the dashboard counts and the My Tasks feed read back
+# exactly as before. Timed, before and after the moves:
+#   board read   get_board_tasks (after: routed through the cached directory)
+#   dashboard    get_user_projects + get_user_task_counts (scatter-gather)
+#   my tasks     first page of the merged feed
+# The MySQL run WRITES into every configured shard (use scratch schemas);
+# each shard's database must exist.
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import Config
+from db import get_db
+from models.boards_model import get_board_tasks
+from models.import_model import import_tasks
+from models.my_tasks_model import get_my_tasks
+from models.project_model import get_user_projects, get_user_task_counts
+from sharding import init_shard, move_project, on_board, shard_ids
+
+from backend_benchmark import fixture, records
+
+
+def build(projects, tasks):
+    """(member user id, [(project_id, board_id)]) on shard 0."""
+    user_id, project_id, board_id, username = fixture()
+    boards = [(project_id, board_id)]
+    for _ in range(projects - 1):
+        _, project_id, board_id, _ = fixture()
+        with get_db() as conn:
+            with conn.cursor() as cur:
+                cur.execute("INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, 'editor')",
+                            (project_id, user_id))
+                conn.commit()
+        boards.append((project_id, board_id))
+    for _, board_id in boards:
+        import_tasks(board_id, records(tasks, username), user_id)
+    return user_id, boards
+
+
+def snapshot(user_id, boards):
+    state = {}
+    for _, board_id in boards:
+        with on_board(board_id):
+            state[board_id] = sorted((t.id, t.status, t.version) for t in get_board_tasks(board_id))
+    feed = [task['id'] for task in get_my_tasks(user_id, sort='priority', limit=200)[0]]
+    return state, get_user_task_counts(user_id), feed
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def measure(label, user_id, boards, repeat):
+    board_id = boards[-1][1]
+
+    def board_read():
+        with on_board(board_id):
+            get_board_tasks(board_id)
+
+    def dashboard():
+        get_user_projects(user_id)
+        get_user_task_counts(user_id)
+
+    print(f"{label:<28} board read {median_ms(board_read, repeat):7.2f} ms   "
+          f"dashboard {median_ms(dashboard, repeat):7.2f} ms   "
+          f"my tasks {median_ms(lambda: get_my_tasks(user_id, limit=50), repeat):7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project shard benchmark")
+    parser.add_argument("--shards", type=int, default=3, help="SQLite: shards including shard 0")
+    parser.add_argument("--projects", type=int, default=6)
+    parser.add_argument("--tasks", type=int, default=2000, help="tasks per project")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mysql", action="store_true", help="use MYSQL_HOST + SHARDS instead of SQLite files")
+    args = parser.parse_args()
+
+    if args.mysql:
+        Config.DB_BACKEND = "mysql"
+        print("WARNING: writes into", Config.MYSQL_DB, "on every shard:", Config.SHARDS)
+    else:
+        directory = tempfile.mkdtemp(prefix="gitboard-shards-")
+        Config.DB_BACKEND = "sqlite"
+        Config.SQLITE_PATH = os.path.join(directory, "shard0.db")
+        Config.SHARDS = {n: os.path.join(directory, f"shard{n}.db") for n in range(1, args.shards)}
+    Config.SHARD_DIRECTORY_TTL = 0  # moves wait TTL + 1 s for other processes; there are none
+    Config.PURGE_PAUSE_SECONDS = 0
+    shards = Config.SHARDS
+
+    Config.SHARDS = {}
+    user_id, boards = build(args.projects, args.tasks)
+    measure("one database", user_id, boards, args.repeat)
+
+    Config.SHARDS = shards
+    for shard in shard_ids():
+        init_shard(shard)
+    before = snapshot(user_id, boards)
+    measure(f"{len(shard_ids())} shards, all on 0", user_id, boards, args.repeat)
+
+    for i, (project_id, _) in enumerate(boards):
+        target = shard_ids()[i % len(shard_ids())]
+        start = time.perf_counter()
+        result = move_project(project_id, target, log=lambda message: None)
+        if result['moved']:
+            elapsed = time.perf_counter() - start - 2 * (Config.SHARD_DIRECTORY_TTL + 1)
+            print(f"moved project {project_id} -> shard {target}: {args.tasks} tasks, "
+                  f"{elapsed:.2f}s copying and cleaning up ({args.tasks / elapsed:,.0f} tasks/sec)")
+
+    after = snapshot(user_id, boards)
+    for name, old, new in zip(("boards", "dashboard counts", "my tasks feed"), before, after):
+        print(f"{name:<18} {'identical' if old == new else 'DIFFERENT'}")
+    measure(f"{len(shard_ids())} shards, spread", user_id, boards, args.repeat)
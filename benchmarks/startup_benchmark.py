@@ -0,0 +1,67 @@
+# ==============================================================
+# FILE: benchmarks/startup_benchmark.py
+# PURPOSE: Measure cold-start cost: imports, create_app, first requests
+# ==============================================================
+#   python benchmarks/startup_benchmark.py            (cold + warm bytecode cache)
+#   python benchmarks/startup_benchmark.py --runs 5
+#
+# Every run is a fresh interpreter, like a newly spawned gunicorn worker.
+# The first request renders /auth/login (no database needed).
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+import app as app_module
+t1 = time.perf_counter()
+app = app_module.create_app(start_background=False)
+t2 = time.perf_counter()
+client = app.test_client()
+client.get("/auth/login")
+t3 = time.perf_counter()
+client.get("/auth/login")
+t4 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "factory": t2 - t1, "first_request": t3 - t2, "second_request": t4 - t3}))
+"""
+
+
+def run_probe(env):
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def report(label, samples):
+    keys = ["import", "factory", "first_request", "second_request"]
+    best = {k: min(s[k] for s in samples) * 1000 for k in keys}
+    print(f"{label:<28}" + "  ".join(f"{k}={best[k]:7.1f}ms" for k in keys))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup timing benchmark")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix="gitboard-jinja-")
+    base = dict(os.environ, JOB_WORKER_THREADS="0", MYSQL_POOL_SIZE="0")
+    try:
+        lazy = dict(base, JINJA_CACHE_DIR="", PRECOMPILE_TEMPLATES="false")
+        report("lazy (old behaviour)", [run_probe(lazy) for _ in range(args.runs)])
+
+        eager = dict(base, JINJA_CACHE_DIR="", PRECOMPILE_TEMPLATES="true")
+        report("precompile, no disk cache", [run_probe(eager) for _ in range(args.runs)])
+
+        cached = dict(base, JINJA_CACHE_DIR=cache_dir, PRECOMPILE_TEMPLATES="true")
+        run_probe(cached)  # populate the bytecode cache
+        report("precompile + bytecode cache", [run_probe(cached) for _ in range(args.runs)])
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
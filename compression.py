@@ -0,0 +1,104 @@
+# ==============================================================
+# FILE: compression.py
+# PURPOSE: gzip / brotli compression of dynamic responses
+# ==============================================================
+# Buffered responses are compressed in one go when they are big enough;
+# streamed responses (exports) are compressed chunk by chunk with a sync
+# flush, so the client keeps receiving data as it is produced. Responses
+# that already carry a Content-Encoding (precompressed static assets) and
+# file responses are left alone.
+
+import zlib
+
+from flask import request
+
+from config import Config
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+
+def choose_encoding(accept_encodings):
+    """Best supported encoding the client accepts, or None."""
+    candidates = [("gzip", accept_encodings["gzip"])]
+    if brotli is not None:
+        candidates.insert(0, ("br", accept_encodings["br"]))
+    encoding, quality = max(candidates, key=lambda c: c[1])
+    return encoding if quality > 0 else None
+
+
+# ================================
+# COMPRESSORS
+# ================================
+def compress(data, encoding, level=None, br_quality=None):
+    level = Config.COMPRESS_LEVEL if level is None else level
+    br_quality = Config.COMPRESS_BR_QUALITY if br_quality is None else br_quality
+    if encoding == "br":
+        return brotli.compress(data, quality=br_quality)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _stream_compressor(encoding):
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=Config.COMPRESS_BR_QUALITY)
+        return compressor.process, compressor.flush, compressor.finish
+    compressor = zlib.compressobj(Config.COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return (compressor.compress,
+            lambda: compressor.flush(zlib.Z_SYNC_FLUSH),
+            lambda: compressor.flush(zlib.Z_FINISH))
+
+
+def compress_stream(chunks, encoding):
+    process, flush, finish = _stream_compressor(encoding)
+    try:
+        for chunk in chunks:
+            if chunk:
+                yield process(chunk) + flush()
+        yield finish()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+
+
+# ================================
+# FLASK HOOK
+# ================================
+def init_compression(app):
+    if not Config.COMPRESS_ENABLED:
+        return
+
+    mimetypes = set(Config.COMPRESS_MIMETYPES)
+
+    @app.after_request
+    def compress_response(response):
+        if (response.mimetype not in mimetypes
+                or response.status_code < 200
+                or response.status_code in (204, 206, 304)
+                or "Content-Encoding" in response.headers
+                or response.direct_passthrough):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = choose_encoding(request.accept_encodings)
+        if not encoding:
+            return response
+
+        if response.is_streamed:
+            response.response = compress_stream(response.iter_encoded(), encoding)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < Config.COMPRESS_MIN_SIZE:
+                return response
+            response.set_data(compress(data, encoding))
+
+        response.headers["Content-Encoding"] = encoding
+        # The bytes differ from the identity representation
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -11,3 +11,110 @@ class Config:
     MYSQL_DB = os.getenv("MYSQL_DB", "todo_app")
     MYSQL_PORT = int(os.getenv("MYSQL_PORT", 3306))
     SECRET_KEY = os.getenv("SECRET_KEY", "supersecretkey123")
+
+    # Storage backend: "mysql" (server above) or "sqlite" (embedded file,
+    # schema created on first use; for small installs, dev and benchmarks)
+    DB_BACKEND = os.getenv("DB_BACKEND", "mysql").lower()
+    SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(os.path.dirname(__file__), "instance", "gitboard.db"))
+
+    # Background jobs (models/jobs_model.py): worker threads per app process
+    # (0 = none; run `python jobs.py` instead), poll interval, lease length
+    # (a job whose worker stops heartbeating this long is taken again), and
+    # retries with exponential backoff between BASE and MAX seconds
+    JOB_WORKER_THREADS = int(os.getenv("JOB_WORKER_THREADS", 2))
+    JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", 2))
+    JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", 120))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 5))
+    JOB_RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", 10))
+    JOB_RETRY_MAX_SECONDS = int(os.getenv("JOB_RETRY_MAX_SECONDS", 3600))
+
+    # Purge of soft-deleted boards / projects (a background job): rows per
+    # transaction and pause between batches
+    PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", 500))
+    PURGE_PAUSE_SECONDS = float(os.getenv("PURGE_PAUSE_SECONDS", 0.2))
+
+    # Rendered board column cache (per worker process)
+    FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("FRAGMENT_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+    # Connection pool (per worker process); 0 disables pooling
+    MYSQL_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", 5))
+
+    # MySQL driver: the C extension unless MYSQL_USE_PURE=true (or it isn't
+    # installed), and server-side prepared statements for the hot reads,
+    # kept per pooled connection (see db.statement_cursor)
+    MYSQL_USE_PURE = os.getenv("MYSQL_USE_PURE", "false").lower() == "true"
+    MYSQL_PREPARED_STATEMENTS = os.getenv("MYSQL_PREPARED_STATEMENTS", "true").lower() == "true"
+
+    # Startup: Jinja bytecode cache directory ("" disables) and eager compile
+    JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR", os.path.join(os.path.dirname(__file__), "instance", "jinja_cache"))
+    PRECOMPILE_TEMPLATES = os.getenv("PRECOMPILE_TEMPLATES", "true").lower() == "true"
+
+    # Response compression (HTML / JSON from the app, not static files)
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", 6))          # gzip 1-9
+    COMPRESS_BR_QUALITY = int(os.getenv("COMPRESS_BR_QUALITY", 4))  # brotli 0-11, if installed
+    COMPRESS_MIMETYPES = os.getenv(
+        "COMPRESS_MIMETYPES",
+        "text/html,application/json,text/csv,application/x-ndjson,text/plain,image/svg+xml"
+    ).split(",")
+
+    # JSON responses: "orjson" (if installed, else the json module) or "json";
+    # dates as HTTP dates (Flask's format) or "iso" (ISO 8601, cheaper)
+    JSON_LIBRARY = os.getenv("JSON_LIBRARY", "orjson").lower()
+    JSON_DATES = os.getenv("JSON_DATES", "http").lower()
+
+    # Locally rendered avatars (LRU entries per worker)
+    AVATAR_CACHE_SIZE = int(os.getenv("AVATAR_CACHE_SIZE", 2048))
+
+    # Due-date calendar: tasks listed per day, cached months per worker
+    CALENDAR_TASKS_PER_DAY = int(os.getenv("CALENDAR_TASKS_PER_DAY", 3))
+    CALENDAR_CACHE_SIZE = int(os.getenv("CALENDAR_CACHE_SIZE", 512))
+    CALENDAR_CACHE_TTL = float(os.getenv("CALENDAR_CACHE_TTL", 300))
+
+    # Online migrations (migrate.py): backfill chunk size, pause between
+    # chunks, and the per-chunk time above which the chunk is halved
+    MIGRATE_CHUNK_SIZE = int(os.getenv("MIGRATE_CHUNK_SIZE", 5000))
+    MIGRATE_PAUSE_SECONDS = float(os.getenv("MIGRATE_PAUSE_SECONDS", 0.05))
+    MIGRATE_MAX_CHUNK_SECONDS = float(os.getenv("MIGRATE_MAX_CHUNK_SECONDS", 0.5))
+
+    # Read replicas: "host:port,host:port" (same user / password / database).
+    # Reads fall back to the primary when a replica lags or is down, and a
+    # user's reads stay on the primary for a few seconds after they write.
+    MYSQL_REPLICAS = [
+        (host, int(port or 3306))
+        for host, _, port in (r.strip().partition(":") for r in os.getenv("MYSQL_REPLICAS", "").split(",") if r.strip())
+    ]
+    REPLICA_MAX_LAG_SECONDS = int(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
+    REPLICA_CHECK_SECONDS = float(os.getenv("REPLICA_CHECK_SECONDS", 5))
+    READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", 5))
+
+    # Project shards (sharding.py): more databases, each holding whole
+    # projects. "1=host:port,2=host:port" with MySQL (same user / password /
+    # database name) or "1=/data/shard1.db,2=..." with SQLite. Shard 0 is the
+    # database above, which also keeps the directory and the global tables.
+    # Unset = one database and no directory lookups at all. Ids are handed
+    # out in per-shard ranges of SHARD_ID_STRIDE; processes re-read a
+    # project's location after SHARD_DIRECTORY_TTL seconds.
+    SHARDS = {
+        int(shard): target.strip()
+        for shard, _, target in (s.strip().partition("=") for s in os.getenv("SHARDS", "").split(",") if s.strip())
+    }
+    SHARD_ID_STRIDE = int(os.getenv("SHARD_ID_STRIDE", 100_000_000))
+    SHARD_DIRECTORY_TTL = float(os.getenv("SHARD_DIRECTORY_TTL", 5))
+
+    # Rate limits: "endpoint[:METHOD]=count/seconds:user|ip", comma separated.
+    # Buckets are shared by all workers through RATE_LIMIT_PATH (memory-mapped;
+    # put it on tmpfs such as /dev/shm if you like, "" = per worker).
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMITS = os.getenv(
+        "RATE_LIMITS",
+        "auth.login:POST=10/60:ip,"
+        "auth.register:POST=5/300:ip,"
+        "boards.move_task_route=60/10:user,"
+        "boards.update_task_route=30/10:user,"
+        "boards.create_task_route=30/10:user,"
+        "boards.add_comment_route=20/10:user"
+    )
+    RATE_LIMIT_PATH = os.getenv("RATE_LIMIT_PATH", os.path.join(os.path.dirname(__file__), "instance", "ratelimit.bin"))
+    RATE_LIMIT_SLOTS = int(os.getenv("RATE_LIMIT_SLOTS", 65536))
@@ -1,17 +1,364 @@
-import mysql.connector
+import os
+import threading
 import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import mysql.connector
+from flask import g, has_request_context, request, session
+from mysql.connector import pooling, errors
+
+from config import Config
+import sqlite_backend
+
+# One pool per process. Gunicorn forks workers from a preloaded master, and
+# MySQL sockets must never be shared across a fork, so the pool remembers the
+# pid that created it and is rebuilt lazily in each child.
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+# Read replicas (Config.MYSQL_REPLICAS): one pool each, same fork rule, plus
+# a cached health / lag check per replica.
+_replica_pools = {}
+_replica_pid = None
+_replica_health = {}  # index -> (checked_at, usable, lag_seconds)
+_replica_next = 0
+
+# Project shards (Config.SHARDS, see sharding.py): shard 0 is the database
+# above; the others get a pool each, built lazily per process.
+HOME_SHARD = 0
+_current_shard = ContextVar("shard", default=HOME_SHARD)
+_shard_pools = {}
+_shard_pid = None
+
+
+def use_pure():
+    """
+    False (C extension: protocol parsing and row conversion in C) unless
+    MYSQL_USE_PURE is set or the extension isn't installed.
+    """
+    return Config.MYSQL_USE_PURE or not mysql.connector.HAVE_CEXT
+
+
+def _connect_args(host=None, port=None):
+    return dict(
+        host=host or Config.MYSQL_HOST,
+        user=Config.MYSQL_USER,
+        password=Config.MYSQL_PASSWORD,
+        database=Config.MYSQL_DB,
+        port=port or Config.MYSQL_PORT,
+        use_pure=use_pure()
+    )
+
+
+class _Pool(pooling.MySQLConnectionPool):
+    """
+    With prepared statements on, a returned connection is not reset
+    (COM_RESET_CONNECTION would deallocate its statements); the only
+    session state the app leaves behind is an open transaction, so that
+    is rolled back instead.
+    """
+
+    def add_connection(self, cnx=None):
+        if cnx is not None and not self.reset_session:
+            try:
+                if cnx.in_transaction:
+                    cnx.rollback()
+            except errors.Error:
+                cnx.disconnect()  # reconnected (fresh session) on next checkout
+        super().add_connection(cnx)
+
 
-def get_db():
-    """Return a new database connection."""
-    connection = mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="",  # add your MySQL password if any
-        database="todo_app",
-        port=3306,
-        use_pure=True
+def _new_pool(name, **kwargs):
+    return _Pool(
+        pool_name=name,
+        pool_size=Config.MYSQL_POOL_SIZE,
+        pool_reset_session=not Config.MYSQL_PREPARED_STATEMENTS,
+        **kwargs
     )
-    return connection
+
+
+def _get_pool():
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = _new_pool(f"gitboard-{os.getpid()}", **_connect_args())
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def get_db(shard=None):
+    """
+    Return a database connection (pooled; close() hands it back), to the
+    current shard unless `shard` is given (see use_shard).
+    """
+    if shard is None:
+        shard = _current_shard.get()
+    if shard != HOME_SHARD:
+        return _shard_connect(shard)
+    if Config.DB_BACKEND == "sqlite":
+        return sqlite_backend.connect()
+    if Config.MYSQL_POOL_SIZE <= 0:
+        return mysql.connector.connect(**_connect_args())
+    try:
+        return _get_pool().get_connection()
+    except errors.PoolError:
+        # Pool exhausted (e.g. long export + background purge): don't fail
+        # the request, just open a one-off connection.
+        return mysql.connector.connect(**_connect_args())
+
+
+# ================================
+# SHARDS
+# ================================
+# Every connection goes to the shard set for the current context: a request
+# routed by sharding.init_sharding, or a `with use_shard(n):` block. Without
+# Config.SHARDS that is always shard 0, i.e. the code path above.
+def current_shard():
+    return _current_shard.get()
+
+
+@contextmanager
+def use_shard(shard):
+    token = _current_shard.set(shard)
+    try:
+        yield shard
+    finally:
+        _current_shard.reset(token)
+
+
+def shard_target(shard):
+    """SQLite path or (host, port) of a configured shard; KeyError if unknown."""
+    target = Config.SHARDS[shard]
+    if Config.DB_BACKEND == "sqlite":
+        return target
+    host, _, port = target.partition(":")
+    return host, int(port or Config.MYSQL_PORT)
+
+
+def _shard_connect(shard):
+    global _shard_pid
+    if Config.DB_BACKEND == "sqlite":
+        return sqlite_backend.connect(shard_target(shard))
+    host, port = shard_target(shard)
+    if Config.MYSQL_POOL_SIZE <= 0:
+        return mysql.connector.connect(**_connect_args(host, port))
+    with _pool_lock:
+        if _shard_pid != os.getpid():
+            _shard_pools.clear()
+            _shard_pid = os.getpid()
+        pool = _shard_pools.get(shard)
+        if pool is None:
+            pool = _shard_pools[shard] = _new_pool(f"gitboard-shard{shard}-{os.getpid()}", **_connect_args(host, port))
+    try:
+        return pool.get_connection()
+    except errors.PoolError:
+        return mysql.connector.connect(**_connect_args(host, port))
+
+
+# ================================
+# PREPARED STATEMENTS
+# ================================
+# Hot read queries are registered once at import (hot_statement) and run
+# through statement_cursor(): on a pooled MySQL connection that is a
+# server-side prepared statement, prepared the first time the physical
+# connection runs it and then only executed (binary protocol, no SQL
+# parsing on either side). Cursors are cached per physical connection and
+# per server session, so a reconnect simply prepares again.
+#     TASK_BY_ID = hot_statement("SELECT ... WHERE t.id = %s")
+#     with statement_cursor(conn, TASK_BY_ID) as cur:
+#         cur.execute(TASK_BY_ID, (task_id,))
+# Pass the registered string itself to execute(): the driver recognises
+# its prepared statement by identity. Anything else (SQLite, one-off
+# connections, MYSQL_PREPARED_STATEMENTS=false) gets a plain cursor.
+_hot_statements = set()
+_statements = weakref.WeakKeyDictionary()  # raw connection -> (session id, {sql: cursor})
+
+
+def hot_statement(sql):
+    _hot_statements.add(sql)
+    return sql
+
+
+@contextmanager
+def statement_cursor(conn, sql):
+    if (not Config.MYSQL_PREPARED_STATEMENTS or sql not in _hot_statements
+            or not isinstance(conn, pooling.PooledMySQLConnection)):
+        with conn.cursor() as cur:
+            yield cur
+        return
+
+    raw = conn._cnx
+    session_id = raw.connection_id
+    cached = _statements.get(raw)
+    if cached is None or cached[0] != session_id:
+        cached = _statements[raw] = (session_id, {})
+    cursors = cached[1]
+    cur = cursors.get(sql)
+    if cur is None:
+        cur = cursors[sql] = raw.cursor(prepared=True)
+    try:
+        yield cur
+        if raw.unread_result:
+            cur.fetchall()  # the cursor stays open: leave the connection readable
+    except BaseException:
+        del cursors[sql]
+        try:
+            cur.close()
+        except errors.Error:
+            pass
+        raise
+
+
+# ================================
+# READ REPLICAS
+# ================================
+def _replica_connect(index):
+    global _replica_pid
+    host, port = Config.MYSQL_REPLICAS[index]
+    if Config.MYSQL_POOL_SIZE <= 0:
+        return mysql.connector.connect(connection_timeout=3, **_connect_args(host, port))
+    with _pool_lock:
+        if _replica_pid != os.getpid():
+            _replica_pools.clear()
+            _replica_health.clear()
+            _replica_pid = os.getpid()
+        pool = _replica_pools.get(index)
+        if pool is None:
+            pool = _replica_pools[index] = _new_pool(
+                f"gitboard-replica{index}-{os.getpid()}",
+                connection_timeout=3,
+                **_connect_args(host, port)
+            )
+    try:
+        return pool.get_connection()
+    except errors.PoolError:
+        return mysql.connector.connect(connection_timeout=3, **_connect_args(host, port))
+
+
+def replica_lag(conn):
+    """Seconds behind the primary, or None if replication isn't running."""
+    with conn.cursor(dictionary=True) as cur:
+        try:
+            cur.execute("SHOW REPLICA STATUS")  # MySQL 8.0.22+
+        except mysql.connector.Error:
+            cur.execute("SHOW SLAVE STATUS")
+        status = cur.fetchone()
+    if not status:
+        return None
+    lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+    return None if lag is None else int(lag)
+
+
+def _replica_usable(index):
+    """Cached for REPLICA_CHECK_SECONDS: reachable and lag <= REPLICA_MAX_LAG_SECONDS."""
+    checked = _replica_health.get(index)
+    if checked and time.monotonic() - checked[0] < Config.REPLICA_CHECK_SECONDS:
+        return checked[1]
+    try:
+        conn = _replica_connect(index)
+        try:
+            lag = replica_lag(conn)
+        finally:
+            conn.close()
+        usable = lag is not None and lag <= Config.REPLICA_MAX_LAG_SECONDS
+    except mysql.connector.Error as err:
+        print(f"Replica {index} unavailable: {err}")
+        lag, usable = None, False
+    _replica_health[index] = (time.monotonic(), usable, lag)
+    return usable
+
+
+def _pinned_to_primary():
+    """
+    Inside a request: writes (non-GET) read from the primary, and so do the
+    next READ_YOUR_WRITES_SECONDS of that user's requests (see mark_write).
+    """
+    if not has_request_context():
+        return False
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        return True
+    last_write = session.get("_last_write")
+    return bool(last_write) and time.time() - last_write < Config.READ_YOUR_WRITES_SECONDS
+
+
+def _pick_replica():
+    """Index of the next healthy replica (round robin), or None."""
+    global _replica_next
+    count = len(Config.MYSQL_REPLICAS)
+    start = _replica_next
+    _replica_next = (_replica_next + 1) % count
+    for offset in range(count):
+        index = (start + offset) % count
+        if _replica_usable(index):
+            return index
+    return None
+
+
+def get_read_db(shard=None):
+    """
+    Connection for reads that may lag slightly: a healthy replica when one
+    is configured, otherwise (or when pinned, see above) the primary.
+    Replicas belong to shard 0; other shards are always read directly.
+    A request reads from one replica throughout (kept in flask.g), so the
+    state it checks (versions, ETags) and the rows it renders come from
+    the same point in replication.
+    """
+    if shard is None:
+        shard = _current_shard.get()
+    if (shard != HOME_SHARD or Config.DB_BACKEND != "mysql" or not Config.MYSQL_REPLICAS
+            or _pinned_to_primary()):
+        return get_db(shard)
+    in_request = has_request_context()
+    if in_request and "_read_replica" in g:
+        index = g._read_replica
+    else:
+        index = _pick_replica()
+        if in_request:
+            g._read_replica = index
+    if index is not None:
+        try:
+            return _replica_connect(index)
+        except mysql.connector.Error:
+            _replica_health[index] = (time.monotonic(), False, None)
+            if in_request:
+                g._read_replica = None  # the rest of the request reads the primary
+    return get_db()
+
+
+def mark_write():
+    """Pin the current user's reads to the primary for a little while."""
+    if has_request_context():
+        session["_last_write"] = time.time()
+
+
+def init_read_routing(app):
+    if Config.DB_BACKEND != "mysql" or not Config.MYSQL_REPLICAS:
+        return
+
+    @app.after_request
+    def pin_after_write(response):
+        if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            mark_write()
+        return response
+
+
+def warm_pool():
+    """
+    Open the pool up front (MySQLConnectionPool connects all `pool_size`
+    connections when it is built) so the first requests served by a fresh
+    worker don't pay for TCP + auth handshakes. Call after fork.
+    """
+    if Config.DB_BACKEND != "mysql" or Config.MYSQL_POOL_SIZE <= 0:
+        return 0
+    try:
+        return _get_pool().pool_size
+    except mysql.connector.Error as err:
+        print(f"Pool warm-up failed: {err}")
+        return 0
 
 
 # Optional: run a test when executing this file directly
@@ -28,6 +375,18 @@ if __name__ == "__main__":
         print("Server Info:", conn.get_server_info())
         conn.close()
 
+        # Replicas: MYSQL_REPLICAS=127.0.0.1:3307 python db.py
+        for index, (host, port) in enumerate(Config.MYSQL_REPLICAS):
+            try:
+                replica = _replica_connect(index)
+                lag = replica_lag(replica)
+                replica.close()
+                state = "replication stopped" if lag is None else f"{lag}s behind"
+                usable = _replica_usable(index)
+                print(f"Replica {host}:{port}: {state} ({'used for reads' if usable else 'skipped'})")
+            except mysql.connector.Error as err:
+                print(f"❌ Replica {host}:{port}: {err}")
+
     except mysql.connector.Error as err:
         print(f"❌ Error: {err}")
     except Exception as e:
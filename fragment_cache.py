@@ -0,0 +1,112 @@
+# ==============================================================
+# FILE: fragment_cache.py
+# PURPOSE: In-process LRU cache for rendered template fragments
+# ==============================================================
+# Keys carry a version (e.g. boards.task_version), so a write never has to
+# find and delete cached HTML: the next request simply asks for a new key and
+# the stale entries age out. Memory is bounded by total HTML size.
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+from flask import g
+from markupsafe import Markup
+
+from config import Config
+
+
+class FragmentCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (html, render_seconds)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[Markup, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: Hashable, html: Markup, render_seconds: float) -> None:
+        size = len(html)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = (html, render_seconds)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def render(self, key: Hashable, render: Callable[[], str]) -> Markup:
+        """
+        Returns the cached fragment for `key`, or renders and stores it.
+        Time saved by hits is added up per request (see init_fragment_cache).
+        """
+        entry = self.get(key)
+        if entry is not None:
+            html, render_seconds = entry
+            g.fragment_hits = g.get("fragment_hits", 0) + 1
+            g.fragment_saved = g.get("fragment_saved", 0.0) + render_seconds
+            return html
+
+        start = time.perf_counter()
+        html = Markup(render())
+        elapsed = time.perf_counter() - start
+        self.set(key, html, elapsed)
+
+        g.fragment_misses = g.get("fragment_misses", 0) + 1
+        g.fragment_render = g.get("fragment_render", 0.0) + elapsed
+        return html
+
+
+fragment_cache = FragmentCache(Config.FRAGMENT_CACHE_MAX_BYTES)
+
+
+def init_fragment_cache(app):
+    """
+    Reports per-request cache use in a Server-Timing header, e.g.
+    Server-Timing: frag-saved;dur=12.4;desc="4 hits", frag-render;dur=0.0;desc="0 misses"
+    """
+    @app.after_request
+    def fragment_timing(response):
+        hits = g.get("fragment_hits", 0)
+        misses = g.get("fragment_misses", 0)
+        if hits or misses:
+            saved_ms = g.get("fragment_saved", 0.0) * 1000
+            render_ms = g.get("fragment_render", 0.0) * 1000
+            response.headers.add(
+                "Server-Timing",
+                f'frag-saved;dur={saved_ms:.1f};desc="{hits} hits", '
+                f'frag-render;dur={render_ms:.1f};desc="{misses} misses"'
+            )
+        return response
+
+    app.extensions["fragment_cache"] = fragment_cache
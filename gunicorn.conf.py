@@ -0,0 +1,25 @@
+# ==============================================================
+# FILE: gunicorn.conf.py
+# PURPOSE: Gunicorn settings for wsgi:app (preload + per-worker warm-up)
+# ==============================================================
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 2))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+
+# Import + build the app once in the master; workers inherit it via fork
+preload_app = True
+
+# Recycle workers to bound memory growth; jitter avoids recycling all at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 5000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 500))
+
+
+def post_fork(server, worker):
+    from startup import warm_worker
+    opened = warm_worker()
+    server.log.info(f"Worker {worker.pid} warmed ({opened} DB connections)")
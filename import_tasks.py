@@ -0,0 +1,49 @@
+# ==============================================================
+# FILE: import_tasks.py
+# PURPOSE: Bulk import tasks into a board from CSV / JSON (CLI)
+# ==============================================================
+#   python import_tasks.py tasks.csv --board 3 --user 1
+#   python import_tasks.py trello.json --board 3 --user 1 --map '{"name": "title", "desc": "description"}'
+
+import argparse
+import json
+import time
+from models.import_model import iter_csv_records, iter_json_records, import_tasks
+from sharding import on_board
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import tasks into a GitBoard board")
+    parser.add_argument("file")
+    parser.add_argument("--board", type=int, required=True, help="target board id")
+    parser.add_argument("--user", type=int, required=True, help="user id recorded as created_by")
+    parser.add_argument("--format", choices=["csv", "json"], help="default: from file extension")
+    parser.add_argument("--map", help="JSON column mapping, e.g. '{\"Summary\": \"title\"}'")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.file.lower().endswith(".csv") else "json")
+    reader = iter_csv_records if fmt == "csv" else iter_json_records
+    mapping = json.loads(args.map) if args.map else None
+    start = time.time()
+
+    def progress(report):
+        elapsed = time.time() - start
+        rate = report['processed'] / elapsed if elapsed else 0
+        print(f"\rprocessed={report['processed']:,} imported={report['imported']:,} "
+              f"failed={report['failed']:,} ({rate:,.0f} rows/sec)", end="", flush=True)
+
+    with open(args.file, "r", encoding="utf-8-sig", newline="") as f, on_board(args.board, write=True):
+        report = import_tasks(args.board, reader(f, mapping), args.user,
+                              chunk_size=args.chunk_size, progress=progress)
+
+    print()
+    for line, message in report['errors'][:20]:
+        print(f"  line {line}: {message}")
+    if report['failed'] > 20:
+        print(f"  ... {report['failed'] - 20} more errors")
+    print(f"✅ Imported {report['imported']:,} tasks in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ==============================================================
+# FILE: jobs.py
+# PURPOSE: Run / inspect background jobs outside the web processes
+# ==============================================================
+#   python jobs.py                          -> worker: JOB_WORKER_THREADS threads, until Ctrl+C
+#   python jobs.py --threads 4 --processes 2
+#   python jobs.py --kind purge             -> only jobs of that kind (repeatable)
+#   python jobs.py --once                   -> run what is due now, then exit
+#   python jobs.py --status                 -> recent jobs and their progress
+#
+# Any number of these can run next to the app's own worker threads (set
+# JOB_WORKER_THREADS=0 on the web processes to keep heavy work off them):
+# jobs are leased, so each one runs in exactly one place at a time.
+
+import argparse
+import multiprocessing
+import threading
+
+from config import Config
+from models.jobs_model import list_jobs, run_pending, start_job_workers
+
+
+def print_status(kinds=None):
+    jobs = [job for kind in (kinds or [None]) for job in list_jobs(kind=kind)]
+    if not jobs:
+        print("No jobs.")
+        return
+    for job in jobs:
+        print(f"#{job.id:<6} {job.kind:<10} {job.status:<8} prio={job.priority:<4} "
+              f"attempt={job.attempts}/{job.max_attempts:<3} progress={job.progress:<10} "
+              f"{job.last_error or ''}")
+
+
+def serve(threads, kinds=None):
+    """Runs worker threads in this process until interrupted."""
+    stop_event = threading.Event()
+    start_job_workers(threads, kinds, stop_event)
+    try:
+        stop_event.wait()
+    except KeyboardInterrupt:
+        stop_event.set()
+
+
+def main(argv=None, kinds_default=None):
+    parser = argparse.ArgumentParser(description="Background job worker")
+    parser.add_argument("--threads", type=int, default=max(1, Config.JOB_WORKER_THREADS),
+                        help="worker threads per process")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes")
+    parser.add_argument("--kind", action="append", dest="kinds", help="only run jobs of this kind")
+    parser.add_argument("--once", action="store_true", help="run the due jobs, then exit")
+    parser.add_argument("--status", action="store_true", help="show recent jobs")
+    args = parser.parse_args(argv)
+    kinds = args.kinds or kinds_default
+
+    if args.status:
+        print_status(kinds)
+    elif args.once:
+        print(f"Ran {run_pending(kinds)} job(s).")
+    else:
+        print(f"Job worker: {args.processes} process(es) x {args.threads} thread(s) "
+              f"{'(' + ', '.join(kinds) + ') ' if kinds else ''}(Ctrl+C to stop)...")
+        workers = [multiprocessing.Process(target=serve, args=(args.threads, kinds))
+                   for _ in range(args.processes - 1)]
+        for worker in workers:
+            worker.start()
+        serve(args.threads, kinds)
+        for worker in workers:
+            worker.join()
+        print("Stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# ==============================================================
+# FILE: json_provider.py
+# PURPOSE: Flask JSON providers that know the app's row objects
+# ==============================================================
+# jsonify() serializes models.rows objects through their to_dict() (only
+# public fields; dataclasses.asdict would deep-copy every row and include
+# internal ones such as label_mask). Everything else is Flask's default.
+#
+# With JSON_LIBRARY=orjson (default) and orjson installed, encoding and
+# decoding run in orjson instead of the json module. The output is the same
+# document either way: sorted keys, compact unless in debug mode, and dates
+# as Flask writes them (HTTP dates) or, with JSON_DATES=iso, as ISO 8601,
+# which orjson formats natively (see benchmarks/json_benchmark.py).
+
+from datetime import date, datetime, timezone
+
+from flask.json.provider import DefaultJSONProvider
+
+from config import Config
+from models.rows import Row
+
+try:
+    import orjson
+except ImportError:  # optional: the json module is used instead
+    orjson = None
+
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _http_date(o):
+    """werkzeug.http.http_date for date / datetime (naive = UTC), a few times faster."""
+    if isinstance(o, datetime):
+        if o.tzinfo is not None:
+            o = o.astimezone(timezone.utc)
+        clock = f"{o.hour:02d}:{o.minute:02d}:{o.second:02d}"
+    else:
+        clock = "00:00:00"
+    return f"{_DAYS[o.weekday()]}, {o.day:02d} {_MONTHS[o.month - 1]} {o.year:04d} {clock} GMT"
+
+
+def _default(o):
+    if isinstance(o, Row):
+        return o.to_dict()
+    if isinstance(o, date):
+        return o.isoformat() if Config.JSON_DATES == "iso" else _http_date(o)
+    return DefaultJSONProvider.default(o)
+
+
+class AppJSONProvider(DefaultJSONProvider):
+    default = staticmethod(_default)
+
+
+class OrjsonProvider(AppJSONProvider):
+    # Dataclasses (rows) always go through _default, datetimes unless ISO
+    option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson else 0
+
+    def _encode(self, obj, indent=None, default=None, **_):
+        option = self.option | (orjson.OPT_INDENT_2 if indent else 0)
+        if Config.JSON_DATES != "iso":
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._encode(obj, indent=indent) + b"\n", mimetype=self.mimetype)
+
+
+def init_json(app):
+    if Config.JSON_LIBRARY == "orjson" and orjson is not None:
+        app.json = OrjsonProvider(app)
+    else:
+        app.json = AppJSONProvider(app)
@@ -1,41 +1,338 @@
+# ==============================================================
+# FILE: migrate.py
+# PURPOSE: Versioned, online schema migrations
+# ==============================================================
+#   python migrate.py              -> apply pending migrations, in order
+#   python migrate.py --status     -> list applied / pending migrations and backfills
+#   python migrate.py --baseline   -> record every migration as applied without
+#                                     running it (schema built by migrations/create_tables.py)
+#
+# Migrations live in migrations/versions/NNNN_description.py and define
+# `upgrade(m)`, where `m` is a Migrator. Applied versions are recorded in
+# `schema_migrations`. Every helper checks information_schema first, so a
+# migration that died halfway can simply be run again.
+#
+# Nothing here takes a table offline: columns are added with
+# ALGORITHM=INSTANT (INPLACE as a fallback), indexes with ALGORITHM=INPLACE,
+# LOCK=NONE, and data is backfilled in primary-key chunks with a pause in
+# between, recording progress in `migration_backfills` so it resumes where
+# it stopped.
+
+import importlib.util
+import os
+import re
+import sys
+import time
+
 import mysql.connector
+from mysql.connector import errorcode
+
 from config import Config
-import os
 
-def run_migration():
-    print("🚀 Running migration...")
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations", "versions")
+_FILENAME = re.compile(r"^(\d{4})_(\w+)\.py$")
+
+# A waiting ALTER queues every later query on the table behind its metadata
+# lock, so give up quickly and retry instead of stalling traffic.
+DDL_LOCK_WAIT_SECONDS = 5
+DDL_RETRIES = 10
+
+
+# ================================
+# CONNECTION / BOOKKEEPING
+# ================================
+def connect():
+    conn = mysql.connector.connect(
+        host=Config.MYSQL_HOST,
+        user=Config.MYSQL_USER,
+        password=Config.MYSQL_PASSWORD,
+        port=Config.MYSQL_PORT,
+        autocommit=True
+    )
+    cur = conn.cursor()
+    cur.execute(f"CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DB} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+    cur.execute(f"USE {Config.MYSQL_DB}")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version VARCHAR(10) PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            duration_ms INT DEFAULT 0,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB
+    """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS migration_backfills (
+            name VARCHAR(150) PRIMARY KEY,
+            table_name VARCHAR(64) NOT NULL,
+            last_id BIGINT NOT NULL DEFAULT 0,
+            max_id BIGINT NOT NULL DEFAULT 0,
+            rows_updated BIGINT NOT NULL DEFAULT 0,
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP NULL
+        ) ENGINE=InnoDB
+    """)
+    cur.close()
+    return conn
+
+
+def discover():
+    """[(version, name, path)] sorted by version."""
+    found = []
+    for filename in sorted(os.listdir(VERSIONS_DIR)):
+        match = _FILENAME.match(filename)
+        if match:
+            found.append((match.group(1), match.group(2), os.path.join(VERSIONS_DIR, filename)))
+    versions = [v for v, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise SystemExit("Duplicate migration version numbers in migrations/versions")
+    return found
+
+
+def applied_versions(conn):
+    cur = conn.cursor()
+    cur.execute("SELECT version FROM schema_migrations")
+    versions = {row[0] for row in cur.fetchall()}
+    cur.close()
+    return versions
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location(f"migration_{os.path.basename(path)[:-3]}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ================================
+# MIGRATOR (passed to upgrade())
+# ================================
+class Migrator:
+    def __init__(self, conn, chunk_size=None, pause=None):
+        self.conn = conn
+        self.chunk_size = chunk_size or Config.MIGRATE_CHUNK_SIZE
+        self.pause = Config.MIGRATE_PAUSE_SECONDS if pause is None else pause
+
+    def execute(self, sql, params=None):
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, params)
+            return cur.rowcount
+        finally:
+            cur.close()
+
+    def _scalar(self, sql, params):
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, params)
+            row = cur.fetchone()
+            return row[0] if row else None
+        finally:
+            cur.close()
+
+    # -- introspection ------------------------------------------------
+    def table_exists(self, table):
+        return bool(self._scalar(
+            "SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            (table,)
+        ))
+
+    def column_exists(self, table, column):
+        return bool(self._scalar(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+            (table, column)
+        ))
+
+    def index_exists(self, table, index):
+        return bool(self._scalar(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+            (table, index)
+        ))
+
+    # -- online DDL ---------------------------------------------------
+    def alter(self, sql):
+        """Runs an ALTER with a short metadata-lock wait, retrying on timeout."""
+        self.execute("SET SESSION lock_wait_timeout = %s", (DDL_LOCK_WAIT_SECONDS,))
+        for attempt in range(1, DDL_RETRIES + 1):
+            try:
+                started = time.time()
+                self.execute(sql)
+                print(f"   {sql}  ({time.time() - started:.1f}s)")
+                return
+            except mysql.connector.Error as err:
+                if err.errno != errorcode.ER_LOCK_WAIT_TIMEOUT or attempt == DDL_RETRIES:
+                    raise
+                print(f"   metadata lock busy, retry {attempt}/{DDL_RETRIES}...")
+                time.sleep(min(2 ** attempt, 30))
 
+    def create_table(self, name, sql):
+        if self.table_exists(name):
+            print(f"   table {name} exists, skipped")
+            return
+        self.execute(sql)
+        print(f"   created table {name}")
+
+    def add_column(self, table, column, definition):
+        if self.column_exists(table, column):
+            print(f"   {table}.{column} exists, skipped")
+            return
+        base = f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+        try:
+            self.alter(f"{base}, ALGORITHM=INSTANT")
+        except mysql.connector.Error as err:
+            if err.errno not in (errorcode.ER_ALTER_OPERATION_NOT_SUPPORTED,
+                                 errorcode.ER_ALTER_OPERATION_NOT_SUPPORTED_REASON):
+                raise
+            self.alter(f"{base}, ALGORITHM=INPLACE, LOCK=NONE")
+
+    def add_index(self, table, name, columns, unique=False, fulltext=False):
+        if self.index_exists(table, name):
+            print(f"   index {table}.{name} exists, skipped")
+            return
+        kind = "FULLTEXT INDEX" if fulltext else "UNIQUE INDEX" if unique else "INDEX"
+        # InnoDB can't build a FULLTEXT index with concurrent writes; reads go on
+        lock = "SHARED" if fulltext else "NONE"
+        self.alter(f"ALTER TABLE {table} ADD {kind} {name} ({columns}), ALGORITHM=INPLACE, LOCK={lock}")
+
+    def drop_index(self, table, name):
+        if not self.index_exists(table, name):
+            print(f"   index {table}.{name} absent, skipped")
+            return
+        self.alter(f"ALTER TABLE {table} DROP INDEX {name}, ALGORITHM=INPLACE, LOCK=NONE")
+
+    # -- data ---------------------------------------------------------
+    def backfill(self, name, table, set_sql, where="TRUE", chunk_size=None, pause=None):
+        """
+        UPDATE {table} SET {set_sql} WHERE {where}, one primary-key range at
+        a time, each chunk its own transaction. Progress is stored under
+        `name`, so re-running continues after the last finished chunk. The
+        chunk shrinks when a chunk runs slow and grows back when it's fast.
+        """
+        chunk = max_chunk = chunk_size or self.chunk_size
+        pause = self.pause if pause is None else pause
+
+        cur = self.conn.cursor(dictionary=True)
+        cur.execute("SELECT last_id, max_id, rows_updated, finished_at FROM migration_backfills WHERE name = %s",
+                    (name,))
+        state = cur.fetchone()
+        if state and state['finished_at']:
+            print(f"   backfill {name} already finished, skipped")
+            cur.close()
+            return
+        if state is None:
+            cur.execute(f"SELECT COALESCE(MIN(id), 1) - 1 AS low, COALESCE(MAX(id), 0) AS high FROM {table}")
+            bounds = cur.fetchone()
+            # Rows inserted after this point are written by code that already
+            # maintains the new column, so the range is fixed up front.
+            state = {'last_id': bounds['low'], 'max_id': bounds['high'], 'rows_updated': 0}
+            cur.execute(
+                "INSERT INTO migration_backfills (name, table_name, last_id, max_id) VALUES (%s, %s, %s, %s)",
+                (name, table, state['last_id'], state['max_id'])
+            )
+        cur.close()
+
+        last_id, max_id, rows = state['last_id'], state['max_id'], state['rows_updated']
+        first_id, started, reported = last_id, time.time(), 0.0
+        sql = f"UPDATE {table} SET {set_sql} WHERE id > %s AND id <= %s AND ({where})"
+
+        while last_id < max_id:
+            upper = min(last_id + chunk, max_id)
+            chunk_started = time.time()
+            rows += self.execute(sql, (last_id, upper))
+            last_id = upper
+            self.execute(
+                "UPDATE migration_backfills SET last_id = %s, rows_updated = %s WHERE name = %s",
+                (last_id, rows, name)
+            )
+
+            took = time.time() - chunk_started
+            if took > Config.MIGRATE_MAX_CHUNK_SECONDS and chunk > 100:
+                chunk //= 2
+            elif took < Config.MIGRATE_MAX_CHUNK_SECONDS / 4 and chunk < max_chunk:
+                chunk = min(chunk * 2, max_chunk)
+
+            now = time.time()
+            if now - reported >= 2 or last_id >= max_id:
+                done = (last_id - first_id) / max(max_id - first_id, 1)
+                rate = (last_id - first_id) / max(now - started, 1e-6)
+                eta = (max_id - last_id) / rate if rate else 0
+                print(f"   {name}: id {last_id}/{max_id} ({done:.0%}), {rows} rows updated, "
+                      f"chunk {chunk}, eta {eta:.0f}s")
+                reported = now
+            if pause:
+                time.sleep(pause)
+
+        self.execute("UPDATE migration_backfills SET finished_at = NOW() WHERE name = %s", (name,))
+
+
+# ================================
+# COMMANDS
+# ================================
+def run_migrations():
+    conn = connect()
+    try:
+        done = applied_versions(conn)
+        pending = [m for m in discover() if m[0] not in done]
+        if not pending:
+            print("✅ Schema is up to date.")
+            return 0
+
+        migrator = Migrator(conn)
+        for version, name, path in pending:
+            print(f"🚀 {version} {name}")
+            started = time.time()
+            try:
+                _load(path).upgrade(migrator)
+            except mysql.connector.Error as err:
+                print(f"❌ {version} failed: {err}\n   Fix the cause and re-run; finished steps are skipped.")
+                return 1
+            duration_ms = int((time.time() - started) * 1000)
+            migrator.execute(
+                "INSERT INTO schema_migrations (version, name, duration_ms) VALUES (%s, %s, %s)",
+                (version, name, duration_ms)
+            )
+            print(f"✅ {version} applied in {duration_ms / 1000:.1f}s")
+        return 0
+    finally:
+        conn.close()
+
+
+def print_status():
+    conn = connect()
     try:
-        # Connect to MySQL server (without selecting DB yet)
-        conn = mysql.connector.connect(
-            host=Config.MYSQL_HOST,
-            user=Config.MYSQL_USER,
-            password=Config.MYSQL_PASSWORD
-        )
-        cursor = conn.cursor()
-
-        # Create database if not exists
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DB}")
-        cursor.execute(f"USE {Config.MYSQL_DB}")
-
-        # Run the migration SQL
-        sql_path = os.path.join(os.path.dirname(__file__), 'migrations', 'init_db.sql')
-        with open(sql_path, 'r', encoding='utf-8') as f:
-            sql_commands = f.read().split(';')
-
-            for command in sql_commands:
-                command = command.strip()
-                if command:
-                    cursor.execute(command)
-
-        conn.commit()
-        print("✅ Migration completed successfully!")
-    except mysql.connector.Error as err:
-        print(f"❌ Error: {err}")
+        done = applied_versions(conn)
+        for version, name, _ in discover():
+            print(f"{'applied' if version in done else 'pending':<8} {version} {name}")
+        cur = conn.cursor(dictionary=True)
+        cur.execute("SELECT * FROM migration_backfills ORDER BY started_at")
+        for row in cur.fetchall():
+            state = "finished" if row['finished_at'] else f"at id {row['last_id']}/{row['max_id']}"
+            print(f"backfill {row['name']:<30} {state}, {row['rows_updated']} rows updated")
+        cur.close()
     finally:
-        if conn.is_connected():
-            cursor.close()
-            conn.close()
+        conn.close()
+
+
+def baseline():
+    conn = connect()
+    try:
+        done = applied_versions(conn)
+        cur = conn.cursor()
+        for version, name, _ in discover():
+            if version not in done:
+                cur.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+                print(f"recorded {version} {name}")
+        cur.close()
+    finally:
+        conn.close()
+
 
 if __name__ == "__main__":
-    run_migration()
+    if "--status" in sys.argv:
+        print_status()
+    elif "--baseline" in sys.argv:
+        baseline()
+    else:
+        sys.exit(run_migrations())
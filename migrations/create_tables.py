@@ -11,6 +11,8 @@ from mysql.connector import Error
 # Import config
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from config import Config
+from db import use_pure
+from schema import TABLES, DROP_ORDER
 
 
 def create_tables():
@@ -27,7 +29,7 @@ def create_tables():
             password=Config.MYSQL_PASSWORD,
             port=Config.MYSQL_PORT,
             connection_timeout=10,
-            use_pure=True
+            use_pure=use_pure()
         )
         cursor = conn.cursor()
         cursor.execute(f"CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DB} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
@@ -43,7 +45,7 @@ def create_tables():
             database=Config.MYSQL_DB,
             port=Config.MYSQL_PORT,
             connection_timeout=10,
-            use_pure=True
+            use_pure=use_pure()
         )
         cursor = conn.cursor()
         print("Connected to MySQL!")
@@ -53,14 +55,7 @@ def create_tables():
         # ==================================================
         print("Dropping old tables...")
         cursor.execute("SET FOREIGN_KEY_CHECKS = 0;")
-        tables_to_drop = [
-            'project_members',        # <-- ADDED
-            'task_labels', 'labels',
-            'task_history', 'audit_logs',
-            'task_comments', 'tasks',
-            'boards', 'projects', 'users'
-        ]
-        for table in tables_to_drop:
+        for table in DROP_ORDER:
             cursor.execute(f"DROP TABLE IF EXISTS {table}")
         cursor.execute("SET FOREIGN_KEY_CHECKS = 1;")
         print("Old schema cleared.")
@@ -70,121 +65,10 @@ def create_tables():
         # ==================================================
         print("Creating full GitBoard schema...")
 
-        # 1. Users
-        cursor.execute("""
-        CREATE TABLE users (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            username VARCHAR(100) NOT NULL UNIQUE,
-            email VARCHAR(150) NOT NULL UNIQUE,
-            password_hash VARCHAR(255) NOT NULL,
-            role ENUM('admin', 'manager', 'member') DEFAULT 'member',
-            avatar_url VARCHAR(500),
-            is_active BOOLEAN DEFAULT TRUE,
-            is_deleted BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            INDEX idx_username (username),
-            INDEX idx_email (email)
-        ) ENGINE=InnoDB;
-        """)
-
-        # 2. Projects
-        cursor.execute("""
-        CREATE TABLE projects (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            name VARCHAR(150) NOT NULL,
-            description TEXT,
-            owner_id INT NOT NULL,
-            status ENUM('active', 'archived', 'completed') DEFAULT 'active',
-            start_date DATE,
-            end_date DATE,
-            color VARCHAR(7) DEFAULT '#3B82F6',
-            is_deleted BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE RESTRICT,
-            INDEX idx_owner (owner_id),
-            INDEX idx_status (status)
-        ) ENGINE=InnoDB;
-        """)
-
-        # 3. Project Members (NEW)
-        cursor.execute("""
-        CREATE TABLE project_members (
-            project_id INT NOT NULL,
-            user_id INT NOT NULL,
-            role ENUM('owner', 'editor', 'viewer') DEFAULT 'viewer',
-            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            PRIMARY KEY (project_id, user_id),
-            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
-            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-            INDEX idx_user (user_id)
-        ) ENGINE=InnoDB;
-        """)
-        print("Created project_members table")
-
-        # 4. Boards
-        cursor.execute("""
-        CREATE TABLE boards (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            project_id INT NOT NULL,
-            name VARCHAR(150) NOT NULL,
-            description TEXT,
-            icon VARCHAR(50) DEFAULT 'clipboard-check',
-            is_archived BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
-            INDEX idx_project (project_id)
-        ) ENGINE=InnoDB;
-        """)
-
-        # ... [rest of your tables: labels, tasks, task_labels, etc.] ...
-        # (Keep all your existing tables below — unchanged)
-
-        # 5. Labels
-        cursor.execute("""
-        CREATE TABLE labels (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            name VARCHAR(50) NOT NULL,
-            color VARCHAR(7) DEFAULT '#10B981',
-            project_id INT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
-            UNIQUE KEY uniq_label_project (name, project_id),
-            INDEX idx_project (project_id)
-        ) ENGINE=InnoDB;
-        """)
-
-        # 6. Tasks
-        cursor.execute("""
-        CREATE TABLE tasks (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            board_id INT NOT NULL,
-            title VARCHAR(255) NOT NULL,
-            description TEXT,
-            assigned_to INT,
-            priority ENUM('Low', 'Medium', 'High', 'Critical') DEFAULT 'Medium',
-            status ENUM('To Do', 'In Progress', 'Review', 'Done') DEFAULT 'To Do',
-            due_date DATE,
-            completed_at TIMESTAMP NULL,
-            order_index INT DEFAULT 0,
-            is_deleted BOOLEAN DEFAULT FALSE,
-            created_by INT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-            FOREIGN KEY (board_id) REFERENCES boards(id) ON DELETE CASCADE,
-            FOREIGN KEY (assigned_to) REFERENCES users(id) ON DELETE SET NULL,
-            FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE RESTRICT,
-            INDEX idx_board_status (board_id, status),
-            INDEX idx_assigned (assigned_to),
-            INDEX idx_due_date (due_date),
-            INDEX idx_priority (priority)
-        ) ENGINE=InnoDB;
-        """)
-
-        # ... [task_labels, task_comments, task_history, audit_logs] ...
-        # (Keep unchanged)
+        # Table definitions live in schema.py (shared with the SQLite backend)
+        for number, (table, ddl) in enumerate(TABLES, 1):
+            cursor.execute(ddl)
+            print(f"{number}. Created {table}")
 
         # ==================================================
         # SEED DATA
@@ -243,6 +127,7 @@ def create_tables():
 
         print("ALL TABLES CREATED SUCCESSFULLY!")
         print("project_members table added for team collaboration")
+        print("Next: `python migrate.py --baseline` so later migrations start from this schema")
 
     except Error as e:
         print(f"MySQL Error: {e}")
@@ -0,0 +1,23 @@
+"""Soft-deleted boards and the background purge queue."""
+
+
+def upgrade(m):
+    m.add_column("boards", "is_deleted", "BOOLEAN DEFAULT FALSE")
+    m.add_column("boards", "deleted_at", "TIMESTAMP NULL")
+    m.create_table("purge_queue", """
+        CREATE TABLE purge_queue (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            entity_type ENUM('board', 'project') NOT NULL,
+            entity_id INT NOT NULL,
+            status ENUM('pending', 'running', 'done', 'failed') DEFAULT 'pending',
+            rows_deleted INT DEFAULT 0,
+            batches INT DEFAULT 0,
+            claimed_by VARCHAR(100),
+            heartbeat_at TIMESTAMP NULL,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            UNIQUE KEY uniq_entity (entity_type, entity_id),
+            INDEX idx_status (status)
+        ) ENGINE=InnoDB
+    """)
@@ -0,0 +1,5 @@
+"""boards.task_version: key of the rendered-column and calendar caches."""
+
+
+def upgrade(m):
+    m.add_column("boards", "task_version", "INT NOT NULL DEFAULT 0")
@@ -0,0 +1,8 @@
+"""Indexes behind the board filter / sort engine (models/task_query.py)."""
+
+
+def upgrade(m):
+    m.add_index("tasks", "idx_board_assignee", "board_id, assigned_to")
+    m.add_index("tasks", "idx_board_priority", "board_id, priority")
+    m.add_index("tasks", "idx_board_due", "board_id, due_date")
+    m.add_index("tasks", "ft_title_description", "title, description", fulltext=True)
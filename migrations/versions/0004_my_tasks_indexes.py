@@ -0,0 +1,9 @@
+"""Indexes for /me/tasks; (assigned_to, status, due_date) replaces idx_assigned."""
+
+
+def upgrade(m):
+    m.add_index("tasks", "idx_assignee_status_due", "assigned_to, status, due_date")
+    m.add_index("tasks", "idx_assignee_priority", "assigned_to, priority")
+    m.add_index("tasks", "idx_assignee_updated", "assigned_to, updated_at")
+    # Only after the replacement exists: the assigned_to foreign key needs an index
+    m.drop_index("tasks", "idx_assigned")
@@ -0,0 +1,12 @@
+"""tasks.comment_count (backfilled in chunks) and the comment pagination index."""
+
+
+def upgrade(m):
+    m.add_index("task_comments", "idx_task_id", "task_id, id")
+    m.drop_index("task_comments", "idx_task")
+    m.add_column("tasks", "comment_count", "INT NOT NULL DEFAULT 0")
+    m.backfill(
+        "tasks.comment_count",
+        "tasks",
+        "comment_count = (SELECT COUNT(*) FROM task_comments c WHERE c.task_id = tasks.id)",
+    )
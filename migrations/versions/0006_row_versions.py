@@ -0,0 +1,6 @@
+"""tasks.version / boards.version for optimistic (compare-and-swap) updates."""
+
+
+def upgrade(m):
+    m.add_column("tasks", "version", "INT NOT NULL DEFAULT 1")
+    m.add_column("boards", "version", "INT NOT NULL DEFAULT 1")
@@ -0,0 +1,40 @@
+"""Generic background jobs table; queued purges move over from purge_queue."""
+
+
+def upgrade(m):
+    m.create_table("jobs", """
+        CREATE TABLE jobs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            kind VARCHAR(50) NOT NULL,
+            payload TEXT,
+            dedupe_key VARCHAR(150),
+            priority INT NOT NULL DEFAULT 0,
+            status ENUM('queued', 'running', 'done', 'failed') NOT NULL DEFAULT 'queued',
+            attempts INT NOT NULL DEFAULT 0,
+            max_attempts INT NOT NULL DEFAULT 5,
+            run_after TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            leased_by VARCHAR(150),
+            heartbeat_at TIMESTAMP NULL,
+            progress INT NOT NULL DEFAULT 0,
+            result TEXT,
+            last_error TEXT,
+            created_by INT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP NULL,
+            finished_at TIMESTAMP NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            UNIQUE KEY uniq_dedupe (dedupe_key),
+            INDEX idx_claim (status, priority),
+            INDEX idx_created_by (created_by, id)
+        ) ENGINE=InnoDB
+    """)
+    # Unfinished purges continue as jobs (same batched deletes, resumable).
+    # purge_queue itself is left in place for the old rows' history.
+    if m.table_exists("purge_queue"):
+        moved = m.execute("""
+            INSERT IGNORE INTO jobs (kind, payload, dedupe_key, priority)
+            SELECT 'purge', JSON_OBJECT('entity_type', entity_type, 'entity_id', entity_id),
+                   CONCAT('purge:', entity_type, ':', entity_id), 10
+            FROM purge_queue WHERE status <> 'done'
+        """)
+        print(f"   moved {moved} unfinished purge(s) to jobs")
@@ -0,0 +1,21 @@
+"""Shard directory: project -> shard and board -> project (see sharding.py)."""
+
+
+def upgrade(m):
+    m.create_table("project_shards", """
+        CREATE TABLE project_shards (
+            project_id INT PRIMARY KEY,
+            shard_id INT NOT NULL,
+            status ENUM('active', 'moving') NOT NULL DEFAULT 'active',
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_shard (shard_id)
+        ) ENGINE=InnoDB
+    """)
+    # Nothing to backfill: projects without a row live on shard 0
+    m.create_table("board_projects", """
+        CREATE TABLE board_projects (
+            board_id INT PRIMARY KEY,
+            project_id INT NOT NULL,
+            INDEX idx_project (project_id)
+        ) ENGINE=InnoDB
+    """)
@@ -1,22 +1,160 @@
 # models/boards_model.py
-from db import get_db
-from typing import List, Dict, Optional, Any
+from db import get_db, get_read_db, hot_statement, statement_cursor
+from typing import List, Dict, Optional, Any, Tuple
+from models.purge_model import soft_delete_board
+from models.label_filter import LabelIndex, filter_by_labels
+from models.task_query import TaskFilter
+from models.rows import Board, Task, TaskCard, row, rows
+from sharding import register_board
+
+
+EDITABLE_TASK_FIELDS = ['title', 'assigned_to', 'due_date', 'status']
+MEMBER_ROLES = ('owner', 'editor', 'viewer')
+EDIT_ROLES = ('owner', 'editor')
+
+# Hot reads: prepared once per pooled connection (see db.statement_cursor)
+BOARD_BY_ID = hot_statement(f"SELECT {Board.COLUMNS} FROM boards b WHERE b.id = %s AND b.is_deleted = FALSE")
+TASK_BY_ID = hot_statement(
+    f"SELECT {Task.COLUMNS} FROM tasks t LEFT JOIN users u ON u.id = t.assigned_to WHERE t.id = %s"
+)
+BOARD_TASKS = hot_statement(f"""
+        SELECT {TaskCard.COLUMNS}
+        FROM tasks t
+        LEFT JOIN users u ON u.id = t.assigned_to
+        WHERE t.board_id = %s
+        ORDER BY t.created_at DESC
+    """)
+BOARD_LABELS = hot_statement("""
+        SELECT l.id, l.name, l.color, tl.task_id
+        FROM labels l
+        LEFT JOIN (task_labels tl JOIN tasks t ON t.id = tl.task_id AND t.board_id = %s)
+               ON tl.label_id = l.id
+        WHERE l.project_id = (SELECT project_id FROM boards WHERE id = %s)
+        ORDER BY l.id
+    """)
+TASK_STATE = hot_statement("""
+        SELECT t.version, t.comment_count, pm.role
+        FROM tasks t
+        JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+        LEFT JOIN project_members pm ON pm.project_id = b.project_id AND pm.user_id = %s
+        WHERE t.id = %s AND t.board_id = %s
+    """)
+BOARD_STATE = hot_statement("""
+        SELECT b.version, b.task_version, p.updated_at AS project_updated_at, pm.role,
+               (SELECT COUNT(*) FROM project_members m
+                WHERE m.project_id = b.project_id) AS members,
+               (SELECT SUM(m.user_id) FROM project_members m
+                WHERE m.project_id = b.project_id) AS member_ids,
+               (SELECT MAX(u.updated_at) FROM project_members m JOIN users u ON u.id = m.user_id
+                WHERE m.project_id = b.project_id) AS members_updated_at
+        FROM boards b
+        JOIN projects p ON p.id = b.project_id AND p.is_deleted = FALSE
+        LEFT JOIN project_members pm ON pm.project_id = b.project_id AND pm.user_id = %s
+        WHERE b.id = %s AND b.is_deleted = FALSE
+    """)
+
+
+class ConflictError(Exception):
+    """
+    A compare-and-swap update lost: the row changed since the caller read
+    `expected` version. `current` is the row as it is now.
+    """
+
+    def __init__(self, current: Dict[str, Any]):
+        super().__init__(f"version {current['version']} is current")
+        self.current = current
+
+
+class PermissionDenied(Exception):
+    """The user is not a member of the task's project with one of the required roles."""
+
+
+def _swap(cur, table: str, row_id: int, set_clause: str, values: List[Any],
+          expected_version: Optional[int], guard: str = "", guard_params=()) -> Optional[int]:
+    """
+    UPDATE ... SET <set_clause>, version = version + 1, only if the row is
+    still at expected_version (None = unconditional) and `guard` holds. One
+    statement, no row lock held between read and write. Returns the new
+    version, or None if nothing matched (the caller finds out why).
+    """
+    sql = f"UPDATE {table} SET {set_clause}, version = version + 1 WHERE id = %s{guard}"
+    params = [*values, row_id, *guard_params]
+    if expected_version is not None:
+        sql += " AND version = %s"
+        params.append(expected_version)
+    cur.execute(sql, params)
+    if cur.rowcount == 0:
+        return None
+    if expected_version is not None:
+        return expected_version + 1
+    cur.execute(f"SELECT version FROM {table} WHERE id = %s", (row_id,))
+    return cur.fetchone()['version']
+
+
+def _current(cur, table: str, row_id: int, expected_version: Optional[int]) -> None:
+    """After a swap that matched nothing: ConflictError if the row exists."""
+    cur.execute(f"SELECT * FROM {table} WHERE id = %s", (row_id,))
+    row = cur.fetchone()
+    if row is not None and expected_version is not None:
+        raise ConflictError(row)
+
+
+# Task writes with the permission check inside the statement: the task must
+# be on the given (live) board and the user a member of its project with one
+# of the roles. EXISTS rather than UPDATE ... JOIN keeps it valid on SQLite.
+# The EXISTS share-locks the board row on InnoDB, so callers take that row
+# exclusively first (bump_task_version) and concurrent writes queue on it.
+_TASK_GUARD = """
+    AND board_id = %s AND EXISTS (
+        SELECT 1 FROM boards b
+        JOIN project_members pm ON pm.project_id = b.project_id
+        WHERE b.id = tasks.board_id AND b.is_deleted = FALSE
+          AND pm.user_id = %s AND pm.role IN ({roles})
+    )"""
+
+
+def _task_guard(board_id: int, user_id: int, roles) -> tuple:
+    return _TASK_GUARD.format(roles=", ".join(["%s"] * len(roles))), (board_id, user_id, *roles)
+
+
+def _explain_miss(cur, task_id: int, board_id: int, user_id: int, roles,
+                  expected_version: Optional[int]) -> None:
+    """
+    The one follow-up query after a guarded write matched nothing: returns
+    if the task isn't on that board (not found), raises PermissionDenied or
+    ConflictError otherwise.
+    """
+    cur.execute("""
+        SELECT t.*, pm.role AS member_role
+        FROM tasks t
+        JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+        LEFT JOIN project_members pm ON pm.project_id = b.project_id AND pm.user_id = %s
+        WHERE t.id = %s AND t.board_id = %s
+    """, (user_id, task_id, board_id))
+    row = cur.fetchone()
+    if row is None:
+        return
+    if row.pop('member_role') not in roles:
+        raise PermissionDenied()
+    if expected_version is not None:
+        raise ConflictError(row)
 
 
 # ===============================
 # Get all boards for a project
 # ===============================
-def get_boards_by_project(project_id: int) -> List[Dict[str, Any]]:
+def get_boards_by_project(project_id: int) -> List[Board]:
     """
     Returns list of boards with task counts per status.
     """
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
+    with get_read_db() as conn:
+        with conn.cursor() as cur:
             cur.execute(
-                "SELECT * FROM boards WHERE project_id = %s ORDER BY created_at DESC",
+                f"SELECT {Board.COLUMNS} FROM boards b "
+                "WHERE b.project_id = %s AND b.is_deleted = FALSE ORDER BY b.created_at DESC",
                 (project_id,)
             )
-            boards = cur.fetchall()
+            boards = rows(cur, Board)
 
             for board in boards:
                 cur.execute("""
@@ -27,13 +165,13 @@ def get_boards_by_project(project_id: int) -> List[Dict[str, Any]]:
                         SUM(CASE WHEN status = 'Done' THEN 1 ELSE 0 END) AS done
                     FROM tasks
                     WHERE board_id = %s
-                """, (board['id'],))
-                counts = cur.fetchone()
-                board['task_counts'] = {
-                    'To Do': counts['todo'] or 0,
-                    'In Progress': counts['in_progress'] or 0,
-                    'Review': counts['review'] or 0,
-                    'Done': counts['done'] or 0
+                """, (board.id,))
+                todo, in_progress, review, done = cur.fetchone()
+                board.task_counts = {
+                    'To Do': todo or 0,
+                    'In Progress': in_progress or 0,
+                    'Review': review or 0,
+                    'Done': done or 0
                 }
     return boards
 
@@ -41,14 +179,14 @@ def get_boards_by_project(project_id: int) -> List[Dict[str, Any]]:
 # ===============================
 # Get single board by ID
 # ===============================
-def get_board(board_id: int) -> Optional[Dict[str, Any]]:
+def get_board(board_id: int) -> Optional[Board]:
     """
     Returns a single board or None.
     """
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
-            cur.execute("SELECT * FROM boards WHERE id = %s", (board_id,))
-            return cur.fetchone()
+    with get_read_db() as conn:
+        with statement_cursor(conn, BOARD_BY_ID) as cur:
+            cur.execute(BOARD_BY_ID, (board_id,))
+            return row(cur, Board)
 
 
 # ===============================
@@ -66,75 +204,200 @@ def create_board(name: str, description: str, project_id: int) -> Optional[int]:
                 (name, description, project_id)
             )
             conn.commit()
-            return cur.lastrowid
+            board_id = cur.lastrowid
+    register_board(board_id, project_id)  # shard directory
+    return board_id
 
 
 # ===============================
 # Update an existing board
 # ===============================
-def update_board(board_id: int, name: str, description: str) -> bool:
+def update_board(board_id: int, name: str, description: str,
+                 expected_version: Optional[int] = None) -> Optional[int]:
     """
-    Returns True if updated.
+    Returns the new version, or None if the board doesn't exist. With
+    expected_version, raises ConflictError if someone else saved first.
     """
     with get_db() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                "UPDATE boards SET name = %s, description = %s WHERE id = %s",
-                (name, description, board_id)
-            )
+        with conn.cursor(dictionary=True) as cur:
+            version = _swap(cur, "boards", board_id, "name = %s, description = %s",
+                            [name, description], expected_version)
+            if version is None:
+                _current(cur, "boards", board_id, expected_version)
             conn.commit()
-            return cur.rowcount > 0
+            return version
 
 
 # ===============================
-# Delete a board (cascade)
+# Delete a board (soft delete + background purge)
 # ===============================
-def delete_board(board_id: int) -> bool:
+def delete_board(board_id: int, user_id: Optional[int] = None) -> Optional[int]:
     """
-    Deletes board + all tasks.
+    Hides the board right away; its tasks, comments and label links are
+    purged in small batches by a background job (see models/purge_model.py).
+    Returns the purge job id, or None if the board does not exist.
     """
-    with get_db() as conn:
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM tasks WHERE board_id = %s", (board_id,))
-            cur.execute("DELETE FROM boards WHERE id = %s", (board_id,))
-            conn.commit()
-            return cur.rowcount > 0
+    return soft_delete_board(board_id, user_id)
+
+
+# ===============================
+# Board version (fragment cache key)
+# ===============================
+def bump_task_version(cur, board_id: Optional[int] = None, task_id: Optional[int] = None) -> bool:
+    """
+    Marks the board's task list as changed, inside the caller's transaction.
+    Cached board columns are keyed on boards.task_version, so this is what
+    invalidates them (across all workers). False if there is no such board
+    (or task).
+
+    Call it FIRST in every transaction that writes a board's tasks: the
+    board row is then the lock all of them take before any task row. Taken
+    later, it deadlocks on InnoDB against another writer holding the
+    shared lock a foreign key check or a guard subquery put on the same
+    board row (both wait to upgrade it; one gets error 1213).
+    """
+    if board_id is None:
+        # Plain read (no lock on the task row); tasks never change board
+        cur.execute("SELECT board_id FROM tasks WHERE id = %s", (task_id,))
+        row = cur.fetchone()
+        if row is None:
+            return False
+        board_id = row['board_id'] if isinstance(row, dict) else row[0]
+    cur.execute("UPDATE boards SET task_version = task_version + 1 WHERE id = %s", (board_id,))
+    return cur.rowcount > 0
 
 
 # ===============================
 # Get tasks grouped by status
 # ===============================
-def get_tasks_by_board(board_id: int) -> Dict[str, List[Dict[str, Any]]]:
+def get_tasks_by_board(
+    board_id: int,
+    label_filter: Optional[str] = None,
+    filters: Optional[TaskFilter] = None
+) -> Dict[str, List[TaskCard]]:
     """
-    Returns tasks grouped by status.
+    Returns tasks grouped by status, each with its labels attached.
+    Two queries in total (tasks, then labels), however big the board is.
+    `label_filter` ("bug AND NOT wontfix") is applied in memory; raises
+    ValueError if it doesn't parse. `filters` (see models/task_query.py)
+    narrows and orders the task query itself.
     """
     statuses = ['To Do', 'In Progress', 'Review', 'Done']
     grouped = {s: [] for s in statuses}
 
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
-            for status in statuses:
-                cur.execute(
-                    """
-                    SELECT id, title, assigned_to, due_date, status, created_at
-                    FROM tasks
-                    WHERE board_id = %s AND status = %s
-                    ORDER BY created_at DESC
-                    """,
-                    (board_id, status)
-                )
-                grouped[status] = cur.fetchall()
+    for task in get_board_tasks(board_id, label_filter=label_filter, filters=filters):
+        grouped[task.status].append(task)
     return grouped
 
 
+def get_board_tasks(
+    board_id: int,
+    label_filter: Optional[str] = None,
+    filters: Optional[TaskFilter] = None,
+    fields: Optional[Tuple[str, ...]] = None
+) -> List[TaskCard]:
+    """
+    Flat, ordered list behind get_tasks_by_board (used by the JSON API).
+    fields: only read these columns (see rows.parse_fields); labels are
+    only loaded when asked for or filtered on.
+    """
+    sql, params = board_tasks_query(board_id, filters, fields)
+    with get_read_db() as conn:
+        with statement_cursor(conn, sql) as cur:
+            cur.execute(sql, params)
+            tasks = rows(cur, TaskCard)
+        if fields is None or 'labels' in fields or label_filter:
+            with statement_cursor(conn, BOARD_LABELS) as cur:
+                index = _attach_labels(cur, board_id, tasks)
+
+    if label_filter:
+        tasks = filter_by_labels(tasks, label_filter, index)
+    return tasks
+
+
+def board_tasks_query(board_id: int, filters: Optional[TaskFilter] = None,
+                      fields: Optional[Tuple[str, ...]] = None):
+    """(sql, params) of the board task query; also EXPLAINed by tests/test_task_filter_plans.py."""
+    if filters is None and fields is None:
+        return BOARD_TASKS, (board_id,)
+    where, params, order_by = "", [], "t.created_at DESC"
+    if filters is not None:
+        where, params = filters.sql(), filters.params
+        order_by = filters.order_by or order_by
+    sql = f"""
+        SELECT {TaskCard.columns(fields and (*fields, 'id'))}
+        FROM tasks t
+        LEFT JOIN users u ON u.id = t.assigned_to
+        WHERE t.board_id = %s{where}
+        ORDER BY {order_by}
+    """
+    return sql, (board_id, *params)
+
+
+def _attach_labels(cur, board_id: int, tasks: List[TaskCard]) -> LabelIndex:
+    """
+    One joined query: every label of the board's project (so the bitset
+    index covers labels no card uses yet) plus the links to this board's
+    tasks. Sets task.labels and task.label_mask in a single pass.
+    """
+    cur.execute(BOARD_LABELS, (board_id, board_id))
+    index = LabelIndex()
+    by_task = {task.id: task for task in tasks}
+    for task in tasks:
+        task.labels = []
+
+    for label_id, name, color, task_id in cur.fetchall():
+        index.add(label_id, name)
+        task = by_task.get(task_id)
+        if task is not None:
+            task.labels.append({'id': label_id, 'name': name, 'color': color})
+            task.label_mask |= index.bits[label_id]
+    return index
+
+
 # ===============================
 # Get a single task
 # ===============================
-def get_task(task_id: int) -> Optional[Dict[str, Any]]:
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
-            cur.execute("SELECT * FROM tasks WHERE id = %s", (task_id,))
-            return cur.fetchone()
+def get_task(task_id: int, fields: Optional[Tuple[str, ...]] = None) -> Optional[Task]:
+    """fields: only read these columns (plus what routes check: board, version, comment count)."""
+    sql = TASK_BY_ID
+    if fields is not None:
+        sql = (f"SELECT {Task.columns((*fields, 'id', 'board_id', 'version', 'comment_count'))} "
+               "FROM tasks t LEFT JOIN users u ON u.id = t.assigned_to WHERE t.id = %s")
+    with get_read_db() as conn:
+        with statement_cursor(conn, sql) as cur:
+            cur.execute(sql, (task_id,))
+            return row(cur, Task)
+
+
+# ===============================
+# Validator state (ETags / conditional GET)
+# ===============================
+def get_task_state(task_id: int, board_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    {version, comment_count, role} for the task on that live board, in one
+    primary-key lookup; role is None if the user is not a project member.
+    None if the task isn't on the board.
+    """
+    with get_read_db() as conn:
+        with statement_cursor(conn, TASK_STATE) as cur:
+            cur.execute(TASK_STATE, (user_id, task_id, board_id))
+            state = cur.fetchone()
+            # column_names is gone once the cursor is closed (pure-Python driver)
+            return dict(zip(cur.column_names, state)) if state else None
+
+
+def get_board_state(board_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Everything the board page depends on, as version-like values: board
+    row and task list versions, project row, the member list (count, ids,
+    last profile change) and the user's role. None if there's no live board.
+    """
+    with get_read_db() as conn:
+        with statement_cursor(conn, BOARD_STATE) as cur:
+            cur.execute(BOARD_STATE, (user_id, board_id))
+            state = cur.fetchone()
+            return dict(zip(cur.column_names, state)) if state else None
 
 
 # ===============================
@@ -152,6 +415,7 @@ def create_task(
     """
     with get_db() as conn:
         with conn.cursor() as cur:
+            bump_task_version(cur, board_id=board_id)
             cur.execute(
                 """
                 INSERT INTO tasks (board_id, title, assigned_to, due_date, status, created_at)
@@ -159,8 +423,8 @@ def create_task(
                 """,
                 (board_id, title, assigned_to, due_date, status)
             )
-            conn.commit()
             task_id = cur.lastrowid
+            conn.commit()
             cur.execute("SELECT * FROM tasks WHERE id = %s", (task_id,))
             return cur.fetchone()
 
@@ -168,60 +432,77 @@ def create_task(
 # ===============================
 # Update task (any field)
 # ===============================
-def update_task(task_id: int, **kwargs) -> bool:
+def update_task(
+    task_id: int,
+    expected_version: Optional[int] = None,
+    user_id: Optional[int] = None,
+    board_id: Optional[int] = None,
+    roles=EDIT_ROLES,
+    **kwargs
+) -> Optional[int]:
     """
-    Allowed: title, assigned_to, due_date, status
+    Allowed: title, assigned_to, due_date, status (ValueError if none given)
+    Returns the new version, or None if the task doesn't exist.
+    - expected_version (from If-Match): ConflictError carrying the current
+      task if it changed in the meantime.
+    - user_id + board_id: the role check is part of the UPDATE itself;
+      PermissionDenied if the user lacks one of `roles`.
     """
-    allowed = ['title', 'assigned_to', 'due_date', 'status']
-    updates = {k: v for k, v in kwargs.items() if k in allowed}
+    updates = {k: v for k, v in kwargs.items() if k in EDITABLE_TASK_FIELDS}
     if not updates:
-        return False
+        raise ValueError(f"Nothing to update (fields: {', '.join(EDITABLE_TASK_FIELDS)})")
 
     set_clause = ", ".join(f"{k} = %s" for k in updates)
-    values = list(updates.values()) + [task_id]
+    guard, guard_params = _task_guard(board_id, user_id, roles) if user_id is not None else ("", ())
 
     with get_db() as conn:
-        with conn.cursor() as cur:
-            cur.execute(f"UPDATE tasks SET {set_clause} WHERE id = %s", values)
+        with conn.cursor(dictionary=True) as cur:
+            # Board row first (see bump_task_version); undone if nothing matches
+            version = None
+            if bump_task_version(cur, board_id=board_id, task_id=task_id):
+                version = _swap(cur, "tasks", task_id, set_clause, list(updates.values()),
+                                expected_version, guard, guard_params)
+            if version is None:
+                conn.rollback()
+                if user_id is not None:
+                    _explain_miss(cur, task_id, board_id, user_id, roles, expected_version)
+                else:
+                    _current(cur, "tasks", task_id, expected_version)
+                return None
             conn.commit()
-            return cur.rowcount > 0
+            return version
 
 
 # ===============================
 # Update task status (drag & drop)
 # ===============================
-def update_task_status(task_id: int, new_status: str) -> bool:
-    return update_task(task_id, status=new_status)
-
-# ... your existing functions ...
-
-def delete_board(board_id: int) -> bool:
-    """
-    Deletes a board and ALL its tasks (cascading).
-    Returns True on success, False on failure.
-    """
-    with get_db() as conn:
-        try:
-            with conn.cursor() as cur:
-                # Step 1: Delete all tasks (optional — CASCADE does this)
-                # cur.execute("DELETE FROM tasks WHERE board_id = %s", (board_id,))
-
-                # Step 2: Delete the board
-                cur.execute("DELETE FROM boards WHERE id = %s", (board_id,))
-                deleted = cur.rowcount > 0
-                conn.commit()
-                return deleted
-        except Exception as e:
-            print(f"Error deleting board {board_id}: {e}")
-            conn.rollback()
-            return False
+def update_task_status(task_id: int, new_status: str, expected_version: Optional[int] = None,
+                       user_id: Optional[int] = None, board_id: Optional[int] = None,
+                       roles=EDIT_ROLES) -> Optional[int]:
+    return update_task(task_id, expected_version=expected_version, user_id=user_id,
+                       board_id=board_id, roles=roles, status=new_status)
 
 # ===============================
 # Delete a task
 # ===============================
-def delete_task(task_id: int) -> bool:
+def delete_task(task_id: int, user_id: Optional[int] = None, board_id: Optional[int] = None,
+                roles=EDIT_ROLES) -> bool:
+    """
+    Returns True if deleted, False if the task doesn't exist. With user_id +
+    board_id the role check is part of the DELETE (PermissionDenied).
+    """
+    guard, guard_params = _task_guard(board_id, user_id, roles) if user_id is not None else ("", ())
     with get_db() as conn:
-        with conn.cursor() as cur:
-            cur.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
+        with conn.cursor(dictionary=True) as cur:
+            # Board row first (see bump_task_version); undone if nothing matches
+            deleted = False
+            if bump_task_version(cur, board_id=board_id, task_id=task_id):
+                cur.execute(f"DELETE FROM tasks WHERE id = %s{guard}", (task_id, *guard_params))
+                deleted = cur.rowcount > 0
+            if not deleted:
+                conn.rollback()
+                if user_id is not None:
+                    _explain_miss(cur, task_id, board_id, user_id, roles, None)
+                return False
             conn.commit()
-            return cur.rowcount > 0
\ No newline at end of file
+            return True
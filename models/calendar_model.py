@@ -0,0 +1,204 @@
+# models/calendar_model.py
+# Due-date calendar: per-day counts plus the first few tasks of each day,
+# for a project or for one user's assignments.
+#
+# A month is one range scan on tasks.due_date, bucketed here. Months are
+# cached per (scope, id, month) and weeks are cut out of the cached months.
+# Every task write bumps boards.task_version (see bump_task_version), so the
+# cache key carries the scope's board version: a changed due date, assignee
+# or deletion makes the next request miss, in every worker, without any
+# explicit invalidation. CALENDAR_CACHE_TTL bounds staleness for writes that
+# bypass bump_task_version. With project shards a user's calendar is built
+# per shard (each cached on its own) and the days are merged.
+import calendar
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+from config import Config
+from db import current_shard, get_read_db
+from models.task_query import PRIORITIES
+from sharding import project_owners, scatter, shard_ids
+
+SCOPES = ('project', 'user')
+
+_TASKS = {
+    'project': """
+        SELECT t.id, t.title, t.status, t.priority, t.due_date, t.board_id, b.project_id, t.assigned_to
+        FROM tasks t
+        JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+        WHERE b.project_id = %s AND t.due_date BETWEEN %s AND %s
+        ORDER BY t.due_date, t.priority DESC, t.id
+    """,
+    'user': """
+        SELECT t.id, t.title, t.status, t.priority, t.due_date, t.board_id, b.project_id, t.assigned_to
+        FROM tasks t
+        JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+        JOIN projects p ON p.id = b.project_id AND p.is_deleted = FALSE
+        JOIN project_members pm ON pm.project_id = p.id AND pm.user_id = t.assigned_to
+        WHERE t.assigned_to = %s AND t.due_date BETWEEN %s AND %s
+        ORDER BY t.due_date, t.priority DESC, t.id
+    """,
+}
+
+# (live board count, sum of their task_version): changes on any task write
+# and when a board is deleted
+_VERSION = {
+    'project': """
+        SELECT COUNT(*) AS boards, COALESCE(SUM(task_version), 0) AS version
+        FROM boards WHERE project_id = %s AND is_deleted = FALSE
+    """,
+    'user': """
+        SELECT COUNT(*) AS boards, COALESCE(SUM(b.task_version), 0) AS version
+        FROM project_members pm
+        JOIN boards b ON b.project_id = pm.project_id AND b.is_deleted = FALSE
+        WHERE pm.user_id = %s
+    """,
+}
+
+
+class _MonthCache:
+    """Small LRU with a TTL; values are bucketed months."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, days)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, days) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, days)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+month_cache = _MonthCache(Config.CALENDAR_CACHE_SIZE, Config.CALENDAR_CACHE_TTL)
+
+
+# ===============================
+# Windows
+# ===============================
+def month_window(year: int, month: int) -> Tuple[date, date]:
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def week_window(day: date) -> Tuple[date, date]:
+    """Monday..Sunday around `day`."""
+    start = day - timedelta(days=day.weekday())
+    return start, start + timedelta(days=6)
+
+
+def _months(start: date, end: date) -> List[Tuple[int, int]]:
+    months, year, month = [], start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+# ===============================
+# Loading
+# ===============================
+def _bucket(rows: List[Dict[str, Any]], per_day: int) -> Dict[str, Dict[str, Any]]:
+    """{day: {count, tasks (first per_day), projects: {project id: count}}}"""
+    days: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        day = days.setdefault(row['due_date'].isoformat(), {'count': 0, 'tasks': [], 'projects': {}})
+        day['count'] += 1
+        projects = day['projects']
+        projects[row['project_id']] = projects.get(row['project_id'], 0) + 1
+        if len(day['tasks']) < per_day:
+            day['tasks'].append(row)
+    return days
+
+
+def _load_month(cur, scope: str, scope_id: int, year: int, month: int, per_day: int):
+    start, end = month_window(year, month)
+    cur.execute(_TASKS[scope], (scope_id, start, end))
+    return _bucket(cur.fetchall(), per_day)
+
+
+def _shard_days(scope: str, scope_id: int, start: date, end: date, per_day: int) -> Dict[str, Dict[str, Any]]:
+    """Buckets of every month overlapping start..end, from the current shard."""
+    days: Dict[str, Dict[str, Any]] = {}
+    with get_read_db() as conn:
+        with conn.cursor(dictionary=True) as cur:
+            cur.execute(_VERSION[scope], (scope_id,))
+            version = tuple(cur.fetchone().values())
+            for year, month in _months(start, end):
+                key = (current_shard(), scope, scope_id, year, month, per_day, version)
+                month_days = month_cache.get(key)
+                if month_days is None:
+                    month_days = _load_month(cur, scope, scope_id, year, month, per_day)
+                    month_cache.set(key, month_days)
+                days.update(month_days)
+    return days
+
+
+_RANK = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+
+
+def _merge_days(parts: List[Dict[str, Dict[str, Any]]], per_day: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-shard days -> one calendar: counts added, first tasks re-picked in
+    _TASKS order. Only each project's owning shard counts (both copies are
+    live for a while during a move, see sharding.owned); meanwhile a day's
+    preview may show fewer than per_day tasks.
+    """
+    owners = project_owners(project_id for part in parts for bucket in part.values()
+                            for project_id in bucket['projects'])
+    days: Dict[str, Dict[str, Any]] = {}
+    for shard, part in zip(shard_ids(), parts):
+        for day, bucket in part.items():
+            count = sum(n for project_id, n in bucket['projects'].items() if owners[project_id] == shard)
+            if not count:
+                continue
+            merged = days.setdefault(day, {'count': 0, 'tasks': []})
+            merged['count'] += count
+            # cached buckets stay untouched
+            merged['tasks'] = merged['tasks'] + [t for t in bucket['tasks'] if owners[t['project_id']] == shard]
+    for bucket in days.values():
+        bucket['tasks'].sort(key=lambda t: (-_RANK.get(t['priority'], -1), t['id']))
+        del bucket['tasks'][per_day:]
+    return days
+
+
+def get_calendar(scope: str, scope_id: int, start: date, end: date,
+                 per_day: int = None) -> Dict[str, Any]:
+    """
+    {'start', 'end', 'days': {'2025-03-14': {'count': 7, 'tasks': [...first N]}}}
+    Days without tasks are omitted. Raises ValueError for an unknown scope.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"Invalid scope '{scope}' (use one of: {', '.join(SCOPES)})")
+    per_day = Config.CALENDAR_TASKS_PER_DAY if per_day is None else per_day
+
+    if scope == 'user':
+        parts = scatter(lambda: _shard_days(scope, scope_id, start, end, per_day))
+        days = parts[0] if len(parts) == 1 else _merge_days(parts, per_day)
+    else:
+        days = _shard_days(scope, scope_id, start, end, per_day)
+
+    first, last = start.isoformat(), end.isoformat()
+    return {
+        'start': first,
+        'end': last,
+        'days': {day: {'count': bucket['count'], 'tasks': bucket['tasks']}
+                 for day, bucket in sorted(days.items()) if first <= day <= last},
+    }
@@ -0,0 +1,100 @@
+# models/comments_model.py
+# Task comments, newest first, one page at a time.
+#
+# Pages are cut with `id < cursor` on (task_id, id), so old pages of a busy
+# thread cost the same as the first. tasks.comment_count is kept in the same
+# transaction as the insert, which lets board cards show a badge without
+# counting comments.
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from db import get_db, get_read_db
+from models.boards_model import bump_task_version
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_COMMENT_LENGTH = 5000
+
+
+def _authors(cur, user_ids) -> Dict[int, str]:
+    """One lookup for all distinct authors of a page."""
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return {}
+    cur.execute(
+        f"SELECT id, username FROM users WHERE id IN ({', '.join(['%s'] * len(user_ids))})",
+        user_ids
+    )
+    return {row['id']: row['username'] for row in cur.fetchall()}
+
+
+# ===============================
+# List comments (cursor pagination)
+# ===============================
+def list_comments(
+    task_id: int,
+    before: Optional[int] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Returns (comments, next_cursor): newest first, `before` is the id of the
+    oldest comment already shown. next_cursor is None on the last page.
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    sql = "SELECT id, task_id, user_id, comment, created_at FROM task_comments WHERE task_id = %s"
+    params: List[Any] = [task_id]
+    if before is not None:
+        sql += " AND id < %s"
+        params.append(before)
+    sql += " ORDER BY id DESC LIMIT %s"
+    params.append(limit + 1)
+
+    with get_read_db() as conn:
+        with conn.cursor(dictionary=True) as cur:
+            cur.execute(sql, params)
+            comments = cur.fetchall()
+            next_cursor = None
+            if len(comments) > limit:
+                comments = comments[:limit]
+                next_cursor = comments[-1]['id']
+            authors = _authors(cur, (c['user_id'] for c in comments))
+
+    for comment in comments:
+        comment['username'] = authors.get(comment['user_id'])
+    return comments, next_cursor
+
+
+# ===============================
+# Add a comment
+# ===============================
+def add_comment(task_id: int, user_id: int, text: str) -> Optional[Dict[str, Any]]:
+    """
+    Inserts the comment and bumps tasks.comment_count in one transaction.
+    Returns the new comment (without username), or None if the task is gone.
+    """
+    created_at = datetime.now().replace(microsecond=0)
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            # The card badge lives in the cached board column. Bumped first:
+            # the board row is the lock every task write takes first
+            if not bump_task_version(cur, task_id=task_id):
+                conn.rollback()
+                return None
+            cur.execute(
+                "UPDATE tasks SET comment_count = comment_count + 1 WHERE id = %s",
+                (task_id,)
+            )
+            cur.execute(
+                "INSERT INTO task_comments (task_id, user_id, comment, created_at) VALUES (%s, %s, %s, %s)",
+                (task_id, user_id, text, created_at)
+            )
+            comment_id = cur.lastrowid
+            conn.commit()
+
+    return {
+        'id': comment_id,
+        'task_id': task_id,
+        'user_id': user_id,
+        'comment': text,
+        'created_at': created_at,
+    }
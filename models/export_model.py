@@ -0,0 +1,137 @@
+# models/export_model.py
+# Streaming export of all tasks in a project.
+#
+# Rows are read through an unbuffered cursor with fetchmany(), so the result
+# set is pulled from the MySQL socket as the HTTP response is written and
+# memory stays flat no matter how big the project is.
+import csv
+import io
+import json
+from typing import Iterator, Dict, Any, Iterable
+
+import mysql.connector
+
+from config import Config
+from db import get_read_db
+
+EXPORT_COLUMNS = [
+    'id', 'board_id', 'board_name', 'title', 'description', 'status', 'priority',
+    'assigned_to', 'assignee', 'due_date', 'labels', 'comment_count',
+    'created_at', 'updated_at'
+]
+
+# Labels come from a correlated subquery (task_id index) and the comment
+# count is denormalized on tasks, so no GROUP BY result has to be
+# materialised server-side.
+EXPORT_SQL = """
+    SELECT
+        t.id, t.board_id, b.name AS board_name, t.title, t.description,
+        t.status, t.priority, t.assigned_to, u.username AS assignee, t.due_date,
+        (SELECT GROUP_CONCAT(l.name ORDER BY l.name SEPARATOR '|')
+           FROM task_labels tl JOIN labels l ON l.id = tl.label_id
+          WHERE tl.task_id = t.id) AS labels,
+        t.comment_count,
+        t.created_at, t.updated_at
+    FROM tasks t
+    JOIN boards b ON b.id = t.board_id
+    LEFT JOIN users u ON u.id = t.assigned_to
+    WHERE b.project_id = %s AND b.is_deleted = FALSE
+    ORDER BY t.board_id, t.id
+"""
+
+
+# ===============================
+# Row stream
+# ===============================
+def iter_project_tasks(project_id: int, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    Yields one dict per task. The connection stays open until the
+    generator is exhausted or closed (Flask closes it when the client goes).
+    """
+    conn = get_read_db()
+    cur = conn.cursor(dictionary=True, buffered=False)
+    finished = False
+    try:
+        cur.execute(EXPORT_SQL, (project_id,))
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+        finished = True
+    finally:
+        if finished or Config.DB_BACKEND != "mysql":
+            cur.close()
+            conn.close()
+        else:
+            _drop_unread(conn, cur)
+
+
+def _drop_unread(conn, cur) -> None:
+    """
+    Closed mid-stream (client went away): the rest of the result is still
+    on the socket, and a connection in that state fails its next command
+    ("Unread result found") -- pooled connections aren't reset on return.
+    Reading up to millions of rows just to discard them is worse, so the
+    session is closed instead; the pool reconnects it on next checkout.
+    """
+    raw = getattr(conn, "_cnx", conn)  # the physical connection behind a pooled one
+    raw._unread_result = False  # pure-Python driver: let QUIT and cursor close through
+    try:
+        raw.disconnect()
+        cur.close()
+    except mysql.connector.Error:
+        pass
+    try:
+        conn.close()  # back to the pool (a reset, if enabled, fails on the closed session)
+    except mysql.connector.Error:
+        pass
+
+
+# ===============================
+# Encoders
+# ===============================
+def _cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], flush_every: int = 500) -> Iterator[str]:
+    """
+    Encodes rows as CSV, yielding a chunk every `flush_every` rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    pending = 0
+    for row in rows:
+        writer.writerow([_cell(row[col]) for col in EXPORT_COLUMNS])
+        pending += 1
+        if pending >= flush_every:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]], flush_every: int = 500) -> Iterator[str]:
+    """
+    Encodes rows as newline-delimited JSON, labels as a list.
+    """
+    chunk = []
+    for row in rows:
+        record = {col: row[col] for col in EXPORT_COLUMNS}
+        record['labels'] = record['labels'].split('|') if record['labels'] else []
+        chunk.append(json.dumps(record, default=_cell))
+        if len(chunk) >= flush_every:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+
+    if chunk:
+        yield "\n".join(chunk) + "\n"
@@ -0,0 +1,338 @@
+# models/import_model.py
+# Streaming bulk import of tasks from CSV / JSON into a board.
+#
+# Records are read lazily from the file, validated one by one and written in
+# chunks: one batched lookup for assignees, one for labels, one multi-row
+# INSERT for the tasks and one for their label links, then a commit.
+import csv
+import json
+from datetime import datetime
+from typing import Iterator, Dict, Any, Optional, Tuple, Callable, List, TextIO
+
+from db import get_db
+from models.boards_model import bump_task_version
+
+TASK_FIELDS = ['title', 'description', 'status', 'priority', 'assignee', 'due_date', 'labels']
+STATUSES = ['To Do', 'In Progress', 'Review', 'Done']
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+
+# Source column -> task field, used when no mapping is given
+DEFAULT_MAPPING = {field: field for field in TASK_FIELDS}
+
+MAX_REPORTED_ERRORS = 1000
+
+# Largest single JSON item the reader will buffer (characters)
+MAX_ITEM_CHARS = 1024 * 1024
+
+Record = Tuple[int, Dict[str, Any]]  # (line / item number, mapped record)
+
+
+# ===============================
+# Readers
+# ===============================
+def _apply_mapping(raw: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+    return {field: raw.get(column) for column, field in mapping.items() if field in TASK_FIELDS}
+
+
+def iter_csv_records(stream: TextIO, mapping: Optional[Dict[str, str]] = None) -> Iterator[Record]:
+    mapping = mapping or DEFAULT_MAPPING
+    reader = csv.DictReader(stream)
+    for raw in reader:
+        yield reader.line_num, _apply_mapping(raw, mapping)
+
+
+def iter_json_records(stream: TextIO, mapping: Optional[Dict[str, str]] = None,
+                      chunk_size: int = 65536, max_item_chars: int = MAX_ITEM_CHARS) -> Iterator[Record]:
+    """
+    Reads either a top-level JSON array of objects or NDJSON, decoding one
+    object at a time from a sliding buffer (never the whole file). A
+    malformed item (or one over `max_item_chars`) is reported as an error
+    record and skipped up to the next top-level boundary.
+    """
+    mapping = mapping or DEFAULT_MAPPING
+    decoder = json.JSONDecoder()
+    buffer = ""
+    item = 0
+    eof = started = False
+
+    while True:
+        # Skip whitespace, commas and the array's closing ']' between objects
+        buffer = buffer.lstrip(" \t\r\n,]")
+        if not buffer:
+            if eof:
+                return
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        if not started:
+            # A '[' opens the top-level array only at the very start; later
+            # on it begins an item (which is then not an object)
+            started = True
+            if buffer[0] == "[":
+                buffer = buffer[1:]
+                continue
+
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError as err:
+            if not eof and len(buffer) <= max_item_chars and _incomplete(buffer, err):
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            item += 1
+            message = (f"Item is longer than {max_item_chars:,} characters" if len(buffer) > max_item_chars
+                       else f"Malformed JSON: {err.msg.removesuffix(' at')}")
+            yield item, {'_error': message}
+            buffer, eof = _skip_item(buffer, stream, chunk_size, eof)
+            continue
+
+        item += 1
+        buffer = buffer[end:]
+        if isinstance(obj, dict):
+            yield item, _apply_mapping(obj, mapping)
+        else:
+            yield item, {'_error': "Item is not an object"}
+
+
+def _incomplete(buffer: str, err: json.JSONDecodeError) -> bool:
+    """
+    Could more input make this decode? Errors at the very end of the buffer
+    (a token cut short, such as `tru` or `1e`) and strings still open at the end
+    can; anything earlier is a malformed item. JSON strings can't contain a
+    raw newline, so an open string with one after it is malformed too.
+    """
+    if err.msg.startswith("Unterminated string"):
+        return "\n" not in buffer[err.pos:]
+    return err.pos >= len(buffer) - 8
+
+
+def _skip_item(buffer: str, stream: TextIO, chunk_size: int, eof: bool) -> Tuple[str, bool]:
+    """
+    Drops a malformed item: input up to the next top-level ',' or newline,
+    or up to the '}' / ']' that closes the item. A newline inside an open
+    string also ends it (the string can't be valid). Scanned input is
+    discarded as it goes, so skipping never holds more than one chunk.
+    Returns (rest of the buffer, eof).
+    """
+    depth = 0
+    in_string = escaped = False
+    while True:
+        for i, ch in enumerate(buffer):
+            if in_string:
+                if ch == "\n":
+                    return buffer[i + 1:], eof
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+            elif ch in "}]":
+                depth -= 1
+                if depth <= 0:
+                    return buffer[i + 1:], eof
+            elif depth == 0 and ch in ",\n":
+                return buffer[i + 1:], eof
+        if eof:
+            return "", True
+        buffer = stream.read(chunk_size)
+        eof = not buffer
+
+
+# ===============================
+# Validation
+# ===============================
+def validate_record(record: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Returns (clean record, None) or (None, error message).
+    """
+    if record.get('_error'):
+        return None, record['_error']
+
+    title = (record.get('title') or '').strip()
+    if not title:
+        return None, "Title is required"
+    if len(title) > 255:
+        return None, "Title is longer than 255 characters"
+
+    status = (record.get('status') or 'To Do').strip()
+    if status not in STATUSES:
+        return None, f"Invalid status '{status}'"
+
+    priority = (record.get('priority') or 'Medium').strip().capitalize()
+    if priority not in PRIORITIES:
+        return None, f"Invalid priority '{priority}'"
+
+    due_date = record.get('due_date') or None
+    if due_date:
+        try:
+            due_date = datetime.strptime(str(due_date).strip()[:10], "%Y-%m-%d").date()
+        except ValueError:
+            return None, f"Invalid due_date '{record.get('due_date')}' (expected YYYY-MM-DD)"
+
+    labels = record.get('labels') or []
+    if isinstance(labels, str):
+        labels = [l.strip() for l in labels.replace('|', ',').split(',')]
+    labels = sorted({str(l).strip()[:50] for l in labels if str(l).strip()})
+
+    assignee = record.get('assignee')
+    assignee = str(assignee).strip() if assignee not in (None, "") else None
+
+    return {
+        'title': title,
+        'description': record.get('description') or None,
+        'status': status,
+        'priority': priority,
+        'due_date': due_date,
+        'assignee': assignee,
+        'labels': labels,
+    }, None
+
+
+# ===============================
+# Batched lookups
+# ===============================
+def _in_clause(values: List[Any]) -> str:
+    return ", ".join(["%s"] * len(values))
+
+
+def _resolve_users(cur, usernames: List[str], cache: Dict[str, Optional[int]]) -> None:
+    missing = [u for u in usernames if u not in cache]
+    if not missing:
+        return
+    cur.execute(f"SELECT id, username FROM users WHERE username IN ({_in_clause(missing)})", missing)
+    for user_id, username in cur.fetchall():
+        cache[username] = user_id
+    for username in missing:
+        cache.setdefault(username, None)
+
+
+def _resolve_labels(cur, project_id: int, names: List[str], cache: Dict[str, int]) -> None:
+    # Label names are unique case-insensitively (utf8mb4_unicode_ci), so
+    # the cache is keyed on the lowercased name.
+    missing = [n for n in names if n.lower() not in cache]
+    if not missing:
+        return
+    # Create unknown labels in one statement, then read all ids back
+    values = ", ".join(["(%s, %s)"] * len(missing))
+    params = [v for name in missing for v in (name, project_id)]
+    cur.execute(f"INSERT IGNORE INTO labels (name, project_id) VALUES {values}", params)
+    cur.execute(
+        f"SELECT id, name FROM labels WHERE project_id = %s AND name IN ({_in_clause(missing)})",
+        [project_id] + missing
+    )
+    for label_id, name in cur.fetchall():
+        cache[name.lower()] = label_id
+
+
+# ===============================
+# Chunk writer
+# ===============================
+def _write_chunk(conn, cur, board_id: int, project_id: int, created_by: int,
+                 chunk: List[Tuple[int, Dict[str, Any]]], user_cache, label_cache, errors) -> int:
+    _resolve_users(cur, sorted({r['assignee'] for _, r in chunk if r['assignee']}), user_cache)
+
+    rows = []
+    for line, record in chunk:
+        if record['assignee'] and user_cache.get(record['assignee']) is None:
+            errors.append((line, f"Unknown assignee '{record['assignee']}'"))
+            continue
+        rows.append(record)
+    if not rows:
+        return 0
+
+    _resolve_labels(cur, project_id, sorted({n for r in rows for n in r['labels']}), label_cache)
+
+    bump_task_version(cur, board_id=board_id)  # first: the board row is locked before any task
+    values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+    params = []
+    for r in rows:
+        params.extend([
+            board_id, r['title'], r['description'], user_cache.get(r['assignee']) if r['assignee'] else None,
+            r['priority'], r['status'], r['due_date'], created_by
+        ])
+    cur.execute(
+        "INSERT INTO tasks (board_id, title, description, assigned_to, priority, status, due_date, created_by) "
+        f"VALUES {values}",
+        params
+    )
+
+    # A single multi-row INSERT gets consecutive AUTO_INCREMENT ids
+    # (InnoDB allocates them up front for "simple inserts").
+    first_id = cur.lastrowid
+    links = [(first_id + i, label_cache[name.lower()]) for i, r in enumerate(rows) for name in r['labels']]
+    if links:
+        cur.execute(
+            f"INSERT IGNORE INTO task_labels (task_id, label_id) VALUES {', '.join(['(%s, %s)'] * len(links))}",
+            [v for link in links for v in link]
+        )
+
+    conn.commit()
+    return len(rows)
+
+
+# ===============================
+# Import pipeline
+# ===============================
+def import_tasks(
+    board_id: int,
+    records: Iterator[Record],
+    created_by: int,
+    chunk_size: int = 1000,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Imports records into a board. Each chunk is its own transaction, so a
+    failure only loses the chunk in flight. Returns a report:
+    {imported, failed, processed, errors: [(line, message), ...]}
+    """
+    report = {'imported': 0, 'failed': 0, 'processed': 0, 'errors': []}
+    errors = []
+    user_cache = {}
+    label_cache = {}
+
+    def flush_errors():
+        report['failed'] += len(errors)
+        room = MAX_REPORTED_ERRORS - len(report['errors'])
+        report['errors'].extend(errors[:max(room, 0)])
+        errors.clear()
+
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT project_id FROM boards WHERE id = %s AND is_deleted = FALSE", (board_id,))
+            row = cur.fetchone()
+            if not row:
+                raise ValueError(f"Board {board_id} not found")
+            project_id = row[0]
+
+            chunk = []
+            for line, record in records:
+                report['processed'] += 1
+                clean, error = validate_record(record)
+                if error:
+                    errors.append((line, error))
+                else:
+                    chunk.append((line, clean))
+
+                if len(chunk) >= chunk_size:
+                    report['imported'] += _write_chunk(conn, cur, board_id, project_id, created_by,
+                                                       chunk, user_cache, label_cache, errors)
+                    chunk = []
+                    flush_errors()
+                    if progress:
+                        progress(report)
+
+            if chunk:
+                report['imported'] += _write_chunk(conn, cur, board_id, project_id, created_by,
+                                                   chunk, user_cache, label_cache, errors)
+            flush_errors()
+            if progress:
+                progress(report)
+
+    return report
@@ -0,0 +1,363 @@
+# models/jobs_model.py
+# Persistent background jobs. Work too slow for a request (today: purging a
+# deleted board or project) is queued as a row in `jobs` and run by worker
+# threads, inside the app processes (Config.JOB_WORKER_THREADS) and/or in
+# separate `python jobs.py` processes.
+#
+# - Leasing: a worker takes the most urgent due job with SELECT ... FOR
+#   UPDATE SKIP LOCKED, so concurrent workers pass over each other's rows
+#   instead of queueing on them, and stamps it with a lease token. Every
+#   process heartbeats the jobs it is running; one whose heartbeat is older
+#   than JOB_LEASE_SECONDS (worker killed, host lost) is taken again.
+# - Priorities: lower runs first (PRIORITY_HIGH < PRIORITY_NORMAL <
+#   PRIORITY_LOW), FIFO within a priority; idx_claim (status, priority)
+#   plus the implicit primary key serves that order straight from the index.
+# - Retries: a failing job is queued again after an exponential backoff
+#   with jitter, until max_attempts; after that it stays 'failed'.
+# - Handlers are registered per kind with @job_handler('kind') and get the
+#   Job (payload decoded); their return value is stored as the result. A job
+#   can run more than once (retry, expired lease), so handlers must be safe
+#   to repeat.
+# Requests enqueue, preferably inside their own transaction (cur=...), and
+# answer 202 with the job id; GET /jobs/<id> reports progress. The table is
+# global: with project shards (sharding.py) it lives on shard 0.
+import importlib
+import json
+import os
+import random
+import socket
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from config import Config
+from db import HOME_SHARD, get_db, get_read_db
+from models.rows import Job, row, rows
+
+PRIORITY_HIGH = -10
+PRIORITY_NORMAL = 0
+PRIORITY_LOW = 10
+
+# Modules whose @job_handler registrations the workers need
+HANDLER_MODULES = ['models.purge_model']
+
+HANDLERS: Dict[str, Callable[[Job], Any]] = {}
+
+
+class LeaseLost(Exception):
+    """The job was taken over by another worker (our lease expired); stop working on it."""
+
+
+def job_handler(kind: str):
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+def _load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+def _decode(job: Optional[Job]) -> Optional[Job]:
+    if job is not None:
+        job.payload = json.loads(job.payload) if job.payload else {}
+        job.result = json.loads(job.result) if job.result else None
+    return job
+
+
+# ===============================
+# Queueing
+# ===============================
+def enqueue(kind: str, payload: Optional[Dict[str, Any]] = None, priority: int = PRIORITY_NORMAL,
+            dedupe_key: Optional[str] = None, created_by: Optional[int] = None,
+            max_attempts: Optional[int] = None, cur=None) -> int:
+    """
+    Queues a job and returns its id. With `cur`, the row is written in the
+    caller's transaction (it only becomes visible to workers on commit).
+    dedupe_key: at most one job per key; enqueueing it again returns the
+    existing job, re-queued if it had failed.
+    """
+    if cur is None:
+        with get_db(HOME_SHARD) as conn:
+            with conn.cursor() as cur:
+                job_id = enqueue(kind, payload, priority, dedupe_key, created_by, max_attempts, cur)
+                conn.commit()
+                return job_id
+
+    params = (kind, json.dumps(payload or {}), dedupe_key, priority,
+              max_attempts or Config.JOB_MAX_ATTEMPTS, created_by)
+    if dedupe_key is None:
+        cur.execute(
+            "INSERT INTO jobs (kind, payload, dedupe_key, priority, max_attempts, created_by) "
+            "VALUES (%s, %s, %s, %s, %s, %s)",
+            params
+        )
+        return cur.lastrowid
+
+    # attempts is assigned first: MySQL evaluates left to right with the new values
+    cur.execute(
+        """
+        INSERT INTO jobs (kind, payload, dedupe_key, priority, max_attempts, created_by)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            attempts = IF(status = 'failed', 0, attempts),
+            run_after = IF(status = 'failed', NOW(), run_after),
+            status = IF(status = 'failed', 'queued', status)
+        """,
+        params
+    )
+    cur.execute("SELECT id FROM jobs WHERE dedupe_key = %s", (dedupe_key,))
+    return cur.fetchone()[0]
+
+
+# ===============================
+# Status
+# ===============================
+def get_job(job_id: int) -> Optional[Job]:
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT {Job.COLUMNS} FROM jobs j WHERE j.id = %s", (job_id,))
+            return _decode(row(cur, Job))
+
+
+def list_jobs(created_by: Optional[int] = None, kind: Optional[str] = None, limit: int = 50) -> List[Job]:
+    """Most recent first; unfinished ones on top."""
+    where, params = [], []
+    if created_by is not None:
+        where.append("j.created_by = %s")
+        params.append(created_by)
+    if kind is not None:
+        where.append("j.kind = %s")
+        params.append(kind)
+    with get_read_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"SELECT {Job.COLUMNS} FROM jobs j"
+                f"{' WHERE ' + ' AND '.join(where) if where else ''} "
+                "ORDER BY j.status IN ('done', 'failed'), j.id DESC LIMIT %s",
+                (*params, limit)
+            )
+            return [_decode(job) for job in rows(cur, Job)]
+
+
+# ===============================
+# Leasing (safe across processes and hosts)
+# ===============================
+_DUE = "(status = 'queued' AND run_after <= NOW())"
+_EXPIRED = "(status = 'running' AND heartbeat_at < NOW() - INTERVAL %s SECOND AND attempts < max_attempts)"
+
+
+def _kind_filter(kinds: Optional[Sequence[str]]):
+    if not kinds:
+        return "", ()
+    return f" AND kind IN ({', '.join(['%s'] * len(kinds))})", tuple(kinds)
+
+
+def _claim(kinds: Optional[Sequence[str]] = None) -> Optional[Job]:
+    """
+    Leases one job: an expired lease first (that work is the oldest), else
+    the most urgent due one. Returns it, or None when there is nothing to do.
+    """
+    kind_sql, kind_params = _kind_filter(kinds)
+    lease = Config.JOB_LEASE_SECONDS
+    token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:12]}"
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            for condition, params in ((_EXPIRED, (lease,)), (_DUE, ())):
+                cur.execute(
+                    f"SELECT id FROM jobs WHERE {condition}{kind_sql} "
+                    "ORDER BY priority, id LIMIT 1 FOR UPDATE SKIP LOCKED",
+                    (*params, *kind_params)
+                )
+                found = cur.fetchone()
+                if found is None:
+                    continue
+                # The row is locked on MySQL; the repeated condition covers SQLite
+                cur.execute(
+                    f"""
+                    UPDATE jobs
+                    SET status = 'running', leased_by = %s, heartbeat_at = NOW(),
+                        attempts = attempts + 1, started_at = COALESCE(started_at, NOW())
+                    WHERE id = %s AND {condition}
+                    """,
+                    (token, found[0], *params)
+                )
+                claimed = cur.rowcount == 1
+                conn.commit()
+                if claimed:
+                    cur.execute(f"SELECT {Job.COLUMNS} FROM jobs j WHERE j.id = %s", (found[0],))
+                    return _decode(row(cur, Job))
+    return None
+
+
+def _fail_exhausted() -> int:
+    """Jobs whose last allowed attempt lost its worker: nothing will retry them."""
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE jobs
+                SET status = 'failed', leased_by = NULL, finished_at = NOW(),
+                    last_error = COALESCE(last_error, 'worker stopped responding')
+                WHERE status = 'running' AND heartbeat_at < NOW() - INTERVAL %s SECOND
+                  AND attempts >= max_attempts
+                """,
+                (Config.JOB_LEASE_SECONDS,)
+            )
+            conn.commit()
+            return cur.rowcount
+
+
+def record_progress(job: Job, amount: int, cur=None) -> None:
+    """
+    Adds to job.progress and renews the lease; with `cur`, in the caller's
+    transaction. Raises LeaseLost if another worker has taken the job over.
+    """
+    if cur is None:
+        with get_db(HOME_SHARD) as conn:
+            with conn.cursor() as cur:
+                record_progress(job, amount, cur)
+                conn.commit()
+                return
+    cur.execute(
+        "UPDATE jobs SET progress = progress + %s, heartbeat_at = NOW() WHERE id = %s AND leased_by = %s",
+        (amount, job.id, job.leased_by)
+    )
+    if cur.rowcount == 0:
+        raise LeaseLost(f"job {job.id}")
+    job.progress += amount
+
+
+def _backoff(attempts: int) -> int:
+    """Seconds before retry N: base * 2^(N-1), capped, with jitter (half to full)."""
+    delay = min(Config.JOB_RETRY_MAX_SECONDS, Config.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return max(1, round(delay * random.uniform(0.5, 1.0)))
+
+
+def _finish(job: Job, result: Any = None, error: Optional[str] = None) -> None:
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            if error is None:
+                cur.execute(
+                    "UPDATE jobs SET status = 'done', result = %s, last_error = NULL, leased_by = NULL, "
+                    "finished_at = NOW() WHERE id = %s AND leased_by = %s",
+                    (json.dumps(result) if result is not None else None, job.id, job.leased_by)
+                )
+            elif job.attempts >= job.max_attempts:
+                cur.execute(
+                    "UPDATE jobs SET status = 'failed', last_error = %s, leased_by = NULL, "
+                    "finished_at = NOW() WHERE id = %s AND leased_by = %s",
+                    (error, job.id, job.leased_by)
+                )
+            else:
+                cur.execute(
+                    "UPDATE jobs SET status = 'queued', last_error = %s, leased_by = NULL, "
+                    "run_after = NOW() + INTERVAL %s SECOND WHERE id = %s AND leased_by = %s",
+                    (error, _backoff(job.attempts), job.id, job.leased_by)
+                )
+            conn.commit()
+
+
+# ===============================
+# Running
+# ===============================
+_running = {}  # job id -> lease token, for the heartbeat thread
+_running_lock = threading.Lock()
+
+
+def run_job(job: Job) -> bool:
+    """Runs a leased job and records the outcome. Returns True if it succeeded."""
+    handler = HANDLERS.get(job.kind)
+    if handler is None:
+        job.attempts = job.max_attempts  # retrying won't help
+        _finish(job, error=f"No handler for job kind '{job.kind}'")
+        return False
+
+    with _running_lock:
+        _running[job.id] = job.leased_by
+    try:
+        result = handler(job)
+    except LeaseLost:
+        print(f"Job {job.id} ({job.kind}) was taken over by another worker")
+        return False
+    except Exception as e:
+        print(f"Job {job.id} ({job.kind}) attempt {job.attempts}/{job.max_attempts} failed: {e}")
+        _finish(job, error=f"{type(e).__name__}: {e}")
+        return False
+    finally:
+        with _running_lock:
+            _running.pop(job.id, None)
+    _finish(job, result)
+    return True
+
+
+def run_pending(kinds: Optional[Sequence[str]] = None, stop_event: Optional[threading.Event] = None) -> int:
+    """Runs jobs until none is due. Returns the number of jobs handled."""
+    _load_handlers()
+    _fail_exhausted()
+    handled = 0
+    while stop_event is None or not stop_event.is_set():
+        job = _claim(kinds)
+        if job is None:
+            break
+        run_job(job)
+        handled += 1
+    return handled
+
+
+def _heartbeat(stop_event: threading.Event) -> None:
+    """Renews the leases of every job this process is running."""
+    while not stop_event.wait(max(1, Config.JOB_LEASE_SECONDS / 3)):
+        with _running_lock:
+            tokens = list(_running.values())
+        if not tokens:
+            continue
+        try:
+            with get_db(HOME_SHARD) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"UPDATE jobs SET heartbeat_at = NOW() "
+                        f"WHERE leased_by IN ({', '.join(['%s'] * len(tokens))})",
+                        tokens
+                    )
+                    conn.commit()
+        except Exception as e:
+            print(f"Job heartbeat error: {e}")
+
+
+def run_job_worker(stop_event: Optional[threading.Event] = None,
+                   kinds: Optional[Sequence[str]] = None) -> None:
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        try:
+            run_pending(kinds, stop_event)
+        except Exception as e:
+            print(f"Job worker error: {e}")
+        stop_event.wait(Config.JOB_POLL_SECONDS)
+
+
+_worker_threads: List[threading.Thread] = []
+_heartbeat_pid = None
+
+
+def start_job_workers(threads: Optional[int] = None, kinds: Optional[Sequence[str]] = None,
+                      stop_event: Optional[threading.Event] = None) -> List[threading.Thread]:
+    """
+    Starts `threads` worker threads (Config.JOB_WORKER_THREADS by default)
+    plus the heartbeat thread, once per process.
+    """
+    global _heartbeat_pid
+    threads = Config.JOB_WORKER_THREADS if threads is None else threads
+    stop_event = stop_event or threading.Event()
+    _worker_threads[:] = [t for t in _worker_threads if t.is_alive()]
+    if _heartbeat_pid != os.getpid():
+        threading.Thread(target=_heartbeat, args=(stop_event,), name="job-heartbeat", daemon=True).start()
+        _heartbeat_pid = os.getpid()
+    for n in range(len(_worker_threads), threads):
+        worker = threading.Thread(target=run_job_worker, args=(stop_event, kinds),
+                                  name=f"job-worker-{n}", daemon=True)
+        worker.start()
+        _worker_threads.append(worker)
+    return _worker_threads
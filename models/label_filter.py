@@ -0,0 +1,178 @@
+# models/label_filter.py
+# In-memory label filtering over per-project label bitsets.
+#
+# Each label of a project gets one bit; each task carries an int mask of
+# its labels. A filter such as "bug AND NOT wontfix" compiles once into a
+# predicate on that int, so filtering a 10k-card board is a loop of integer
+# ops with no SQL.
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Predicate = Callable[[int], bool]
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+
+class LabelIndex:
+    """
+    Label id -> bit for one project (one bit per label), and lowercased
+    name -> the bits of every label with that name: names are matched
+    case-insensitively, and "Bug" and "bug" can both exist.
+    """
+
+    __slots__ = ("bits", "names")
+
+    def __init__(self):
+        self.bits: Dict[int, int] = {}
+        self.names: Dict[str, int] = {}
+
+    def add(self, label_id: int, name: str) -> None:
+        if label_id not in self.bits:
+            bit = 1 << len(self.bits)
+            self.bits[label_id] = bit
+            key = name.lower()
+            self.names[key] = self.names.get(key, 0) | bit
+
+    def mask(self, label_ids: Iterable[int]) -> int:
+        mask = 0
+        for label_id in label_ids:
+            mask |= self.bits.get(label_id, 0)
+        return mask
+
+    def bit_for(self, name: str) -> int:
+        # A task "has" the name if it has any of these bits. Unknown names
+        # get none: "x" never matches, "NOT x" always does
+        return self.names.get(name.lower(), 0)
+
+
+# ===============================
+# Parser: expr := term (OR term)* ; term := factor (AND? factor)* ;
+#         factor := NOT factor | ( expr ) | label
+# ===============================
+def _tokenize(text: str) -> List[str]:
+    tokens, pos = [], 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Unexpected character at {pos} in label filter")
+        lparen, rparen, quoted, word = match.groups()
+        if lparen:
+            tokens.append("(")
+        elif rparen:
+            tokens.append(")")
+        elif quoted is not None:
+            tokens.append(("label", quoted))
+        elif word.upper() in ("AND", "OR", "NOT"):
+            tokens.append(word.upper())
+        else:
+            tokens.append(("label", word))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens, index: LabelIndex):
+        self.tokens = tokens
+        self.pos = 0
+        self.index = index
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def expr(self) -> Predicate:
+        terms = [self.term()]
+        while self.peek() == "OR":
+            self.take()
+            terms.append(self.term())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda m: any(t(m) for t in terms)
+
+    def term(self) -> Predicate:
+        # Conjunctions of plain / negated labels collapse into two masks
+        required, forbidden, others = 0, 0, []
+        impossible = False  # requires a label the project doesn't have
+        operands = 0
+        while True:
+            token = self.peek()
+            if token is None or token in (")", "OR"):
+                break
+            if token == "AND":
+                self.take()
+                continue
+            operands += 1
+            literal = self.literal()
+            if literal is not None:
+                negated, bits = literal
+                if negated:
+                    forbidden |= bits
+                elif not bits:
+                    impossible = True
+                elif bits & (bits - 1) == 0:  # one label
+                    required |= bits
+                else:  # several labels share the name: any of them will do
+                    others.append(lambda m, bits=bits: bool(m & bits))
+            else:
+                others.append(self.factor())
+
+        if not operands:
+            raise ValueError("Empty label filter expression")
+        if impossible:
+            return lambda m: False
+
+        def conj(m, required=required, forbidden=forbidden):
+            return (m & required) == required and not (m & forbidden) and all(o(m) for o in others)
+        return conj
+
+    def literal(self):
+        """(negated, bits) for `label` / `NOT label`, else None (no tokens used)."""
+        token = self.peek()
+        if isinstance(token, tuple):
+            self.take()
+            return False, self.index.bit_for(token[1])
+        nxt = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
+        if token == "NOT" and isinstance(nxt, tuple):
+            self.pos += 2
+            return True, self.index.bit_for(nxt[1])
+        return None
+
+    def factor(self) -> Predicate:
+        token = self.take()
+        if token == "NOT":
+            inner = self.factor()
+            return lambda m: not inner(m)
+        if token == "(":
+            inner = self.expr()
+            if self.take() != ")":
+                raise ValueError("Missing ')' in label filter")
+            return inner
+        if isinstance(token, tuple):
+            bit = self.index.bit_for(token[1])
+            return lambda m: bool(m & bit)
+        raise ValueError(f"Unexpected '{token or 'end of filter'}' in label filter")
+
+
+def compile_label_filter(expression: str, index: LabelIndex) -> Predicate:
+    """
+    Compiles e.g. 'bug AND NOT wontfix', 'bug OR "good first issue"',
+    '(ui OR ux) AND NOT blocked' into a predicate on a task's label mask.
+    Raises ValueError on syntax errors.
+    """
+    parser = _Parser(_tokenize(expression), index)
+    predicate = parser.expr()
+    if parser.peek() is not None:
+        raise ValueError(f"Unexpected '{parser.peek()}' in label filter")
+    return predicate
+
+
+def filter_by_labels(tasks: List[Any], expression: Optional[str], index: LabelIndex) -> List[Any]:
+    if not expression:
+        return tasks
+    predicate = compile_label_filter(expression, index)
+    return [t for t in tasks if predicate(t.label_mask)]
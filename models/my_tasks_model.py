@@ -0,0 +1,196 @@
+# models/my_tasks_model.py
+# "My Tasks": everything assigned to one user across all projects, in a
+# single indexed query with keyset (seek) pagination.
+#
+# The cursor is the sort key of the last row returned, so page N costs the
+# same as page 1 (no OFFSET, no sort over all of the user's tasks). The
+# query reads a few index-ordered runs (see my_tasks_query) that are
+# merged here, as are the pages of every shard with project shards:
+#   due      -> idx_assignee_status_due (assigned_to, status, due_date), per status
+#   priority -> idx_assignee_priority   (assigned_to, priority)
+#   updated  -> idx_assignee_updated    (assigned_to, updated_at)
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from db import get_read_db
+from models.task_query import PRIORITIES, STATUSES
+from sharding import owned, scatter
+
+SORT_MODES = ('due', 'priority', 'updated')
+OPEN_STATUSES = ['To Do', 'In Progress', 'Review']
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+_SELECT = """
+    SELECT t.id, t.title, t.status, t.priority, t.due_date, t.updated_at,
+           t.board_id, b.name AS board_name, b.project_id, p.name AS project_name,
+           p.color AS project_color
+    FROM tasks t
+    JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+    JOIN projects p ON p.id = b.project_id AND p.is_deleted = FALSE
+    JOIN project_members pm ON pm.project_id = p.id AND pm.user_id = t.assigned_to
+    WHERE t.assigned_to = %s AND {where}
+    ORDER BY {order} LIMIT %s
+"""
+
+# NULL due dates / priorities go last in every mode. NULLs sort first
+# ascending (MySQL and SQLite alike), so undated tasks are read as a separate
+# tail (see my_tasks_query); descending they already come last.
+_ORDER = {
+    'priority': "t.priority DESC, t.id DESC",
+    'updated': "t.updated_at DESC, t.id DESC",
+}
+
+# _ORDER in Python, (key, reverse), for merging the shards' pages
+_RANK = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+_MERGE = {
+    'due': (lambda t: (t['due_date'] is None, t['due_date'] or date.min, t['id']), False),
+    'priority': (lambda t: (t['priority'] is not None, _RANK.get(t['priority'], -1), t['id']), True),
+    'updated': (lambda t: (t['updated_at'], t['id']), True),
+}
+
+
+# ===============================
+# Cursor encoding
+# ===============================
+def encode_cursor(sort: str, task: Dict[str, Any]) -> str:
+    if sort == 'due':
+        key = task['due_date'].isoformat() if task['due_date'] else None
+    elif sort == 'priority':
+        key = task['priority']
+    else:
+        key = task['updated_at'].isoformat()
+    raw = json.dumps({"s": sort, "k": key, "id": task['id']}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort: str, cursor: str) -> Tuple[Any, int]:
+    """(sort key, id) of the last row seen. Raises ValueError if invalid."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        key, task_id = data["k"], int(data["id"])
+        if data["s"] != sort:
+            raise ValueError
+        if key is not None:
+            if sort == 'due':
+                key = date.fromisoformat(key)
+            elif sort == 'updated':
+                key = datetime.fromisoformat(key)
+            elif key not in PRIORITIES:
+                raise ValueError
+        elif sort == 'updated':
+            raise ValueError
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    return key, task_id
+
+
+def _seek(sort: str, key: Any, task_id: int) -> Tuple[str, List[Any]]:
+    """WHERE fragment selecting the rows after (key, id) in `sort` order (priority / updated)."""
+    if sort == 'priority':
+        if key is None:
+            return "t.priority IS NULL AND t.id < %s", [task_id]
+        # ENUMs compare as strings against literals, so spell out the lower ones
+        lower = PRIORITIES[:PRIORITIES.index(key)]
+        clauses = ["(t.priority = %s AND t.id < %s)", "t.priority IS NULL"]
+        params: List[Any] = [key, task_id]
+        if lower:
+            clauses.insert(0, f"t.priority IN ({', '.join(['%s'] * len(lower))})")
+            params = lower + params
+        return f"({' OR '.join(clauses)})", params
+
+    return "(t.updated_at < %s OR (t.updated_at = %s AND t.id < %s))", [key, key, task_id]
+
+
+def my_tasks_query(user_id: int, sort: str, statuses: List[str],
+                   after: Optional[Tuple[Any, int]], limit: int) -> Tuple[str, List[Any]]:
+    """
+    (sql, params) reading up to `limit` rows per part, after the decoded
+    cursor `after` (None: from the start). Every part is one range of an
+    index read in index order, so nothing is sorted but the parts' rows
+    (the caller merges them, see _MERGE):
+      due       per status on (assigned_to, status, due_date): the dated
+                tasks past the cursor, then the undated tail
+      priority  (assigned_to, priority) / (assigned_to, updated_at), with
+      updated   the status checked per row
+    Also EXPLAINed by tests/test_my_tasks.py.
+    """
+    parts = []  # (where, params, order)
+    if sort == 'due':
+        key, task_id = after or (None, None)
+        for status in statuses:
+            if after is None or key is not None:
+                where, params = "t.status = %s AND t.due_date IS NOT NULL", [status]
+                if after:
+                    where += " AND (t.due_date > %s OR (t.due_date = %s AND t.id > %s))"
+                    params += [key, key, task_id]
+                parts.append((where, params, "t.due_date ASC, t.id ASC"))
+            where, params = "t.status = %s AND t.due_date IS NULL", [status]
+            if after and key is None:
+                where += " AND t.id > %s"
+                params.append(task_id)
+            parts.append((where, params, "t.id ASC"))
+    else:
+        where, params = f"t.status IN ({', '.join(['%s'] * len(statuses))})", list(statuses)
+        if after:
+            clause, seek_params = _seek(sort, *after)
+            where += f" AND {clause}"
+            params += seek_params
+        parts.append((where, params, _ORDER[sort]))
+
+    selects, all_params = [], []
+    for where, params, order in parts:
+        selects.append(_SELECT.format(where=where, order=order))
+        all_params += [user_id, *params, limit]
+    if len(selects) == 1:
+        return selects[0], all_params
+    # Each part keeps its own ORDER BY / LIMIT inside a derived table
+    sql = " UNION ALL ".join(f"SELECT * FROM ({select}) AS part{i}" for i, select in enumerate(selects))
+    return sql, all_params
+
+
+# ===============================
+# Feed
+# ===============================
+def get_my_tasks(
+    user_id: int,
+    sort: str = 'due',
+    statuses: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Returns (tasks, next_cursor); next_cursor is None on the last page.
+    `statuses` defaults to the open ones. Raises ValueError for an unknown
+    sort mode, status or a cursor that doesn't belong to this sort.
+    """
+    if sort not in SORT_MODES:
+        raise ValueError(f"Invalid sort '{sort}' (use one of: {', '.join(SORT_MODES)})")
+    statuses = statuses or OPEN_STATUSES
+    bad = [s for s in statuses if s not in STATUSES]
+    if bad:
+        raise ValueError(f"Invalid status '{bad[0]}'")
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+    after = decode_cursor(sort, cursor) if cursor else None
+    # one extra row tells us whether there is a next page
+    sql, params = my_tasks_query(user_id, sort, statuses, after, limit + 1)
+
+    def page():
+        with get_read_db() as conn:
+            with conn.cursor(dictionary=True) as cur:
+                cur.execute(sql, params)
+                return cur.fetchall()
+
+    tasks = [task for part in owned(scatter(page), lambda t: t['project_id']) for task in part]
+    key, reverse = _MERGE[sort]
+    tasks.sort(key=key, reverse=reverse)
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(sort, tasks[-1])
+    return tasks, next_cursor
@@ -1,19 +1,64 @@
 # models/project_model.py
-from db import get_db
+from db import get_read_db
+from models.purge_model import soft_delete_project
+from models.rows import Member, Project, row, rows
+from sharding import owned, scatter
 
 def get_project_by_id(project_id):
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
-            cur.execute("SELECT * FROM projects WHERE id = %s", (project_id,))
-            return cur.fetchone()
+    with get_read_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT {Project.COLUMNS} FROM projects p WHERE p.id = %s AND p.is_deleted = FALSE", (project_id,))
+            return row(cur, Project)
 
 def get_project_members(project_id):
-    with get_db() as conn:
-        with conn.cursor(dictionary=True) as cur:
-            cur.execute("""
-                SELECT u.id AS user_id, u.username, pm.role 
+    with get_read_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"""
+                SELECT {Member.COLUMNS}
                 FROM project_members pm
                 JOIN users u ON pm.user_id = u.id
                 WHERE pm.project_id = %s
             """, (project_id,))
-            return cur.fetchall()
\ No newline at end of file
+            return rows(cur, Member)
+
+def get_user_projects(user_id):
+    """Projects the user is a member of, by name (from every shard)."""
+    def load():
+        with get_read_db() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {Project.COLUMNS}
+                    FROM projects p
+                    JOIN project_members pm ON pm.project_id = p.id AND pm.user_id = %s
+                    WHERE p.is_deleted = FALSE
+                    ORDER BY p.name
+                """, (user_id,))
+                return rows(cur, Project)
+    parts = owned(scatter(load), lambda project: project.id)
+    if len(parts) == 1:
+        return parts[0]
+    return sorted((project for part in parts for project in part), key=lambda p: p.name.lower())
+
+def get_user_task_counts(user_id):
+    """{status: tasks} over the live boards of the user's projects (from every shard)."""
+    def load():
+        with get_read_db() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT p.id, t.status, COUNT(*)
+                    FROM tasks t
+                    JOIN boards b ON b.id = t.board_id AND b.is_deleted = FALSE
+                    JOIN projects p ON p.id = b.project_id AND p.is_deleted = FALSE
+                    JOIN project_members pm ON pm.project_id = p.id AND pm.user_id = %s
+                    GROUP BY p.id, t.status
+                """, (user_id,))
+                return cur.fetchall()
+    counts = {}
+    for part in owned(scatter(load), lambda r: r[0]):
+        for _, status, count in part:
+            counts[status] = counts.get(status, 0) + count
+    return counts
+
+def delete_project(project_id, user_id=None):
+    """Soft delete; boards, tasks and labels are purged by a background job, whose id is returned."""
+    return soft_delete_project(project_id, user_id)
@@ -0,0 +1,195 @@
+# models/purge_model.py
+# Soft delete + background purge of boards and projects.
+#
+# Deleting a board used to be one big `DELETE FROM boards` that let
+# ON DELETE CASCADE walk every task, comment and label link inside a single
+# transaction. Now the request only flips `is_deleted` and queues a 'purge'
+# job (models/jobs_model.py); a worker removes the rows in small batches,
+# one short transaction each, reporting rows deleted as the job's progress.
+import time
+from typing import Dict, Any, Optional
+
+from db import HOME_SHARD, current_shard, get_db
+from config import Config
+from models.jobs_model import PRIORITY_LOW, enqueue, job_handler, record_progress
+from sharding import forget_board, forget_project, on_board, on_project
+
+# Child tables keyed by task_id, purged before the tasks themselves
+TASK_CHILD_TABLES = ['task_labels', 'task_comments', 'task_history']
+
+
+# ===============================
+# Queue a board / project for purge
+# ===============================
+def _enqueue(cur, entity_type: str, entity_id: int, user_id: Optional[int]) -> int:
+    # cur=None: the jobs table is on another shard, so a separate transaction
+    return enqueue(
+        'purge', {'entity_type': entity_type, 'entity_id': entity_id}, priority=PRIORITY_LOW,
+        dedupe_key=f"purge:{entity_type}:{entity_id}", created_by=user_id, cur=cur
+    )
+
+
+def soft_delete_board(board_id: int, user_id: Optional[int] = None) -> Optional[int]:
+    """
+    Hides the board immediately and queues its rows for background purge.
+    Returns the purge job id, or None if the board did not exist.
+    """
+    with get_db() as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE boards SET is_deleted = TRUE, deleted_at = NOW() "
+                    "WHERE id = %s AND is_deleted = FALSE",
+                    (board_id,)
+                )
+                if cur.rowcount == 0:
+                    conn.rollback()
+                    return None
+                if current_shard() == HOME_SHARD:
+                    job_id = _enqueue(cur, 'board', board_id, user_id)
+                    conn.commit()
+                    return job_id
+                conn.commit()
+            return _enqueue(None, 'board', board_id, user_id)
+        except Exception as e:
+            print(f"Error deleting board {board_id}: {e}")
+            conn.rollback()
+            return None
+
+
+def soft_delete_project(project_id: int, user_id: Optional[int] = None) -> Optional[int]:
+    """
+    Hides the project and all its boards, then queues the project for purge.
+    Returns the purge job id, or None if the project did not exist.
+    """
+    with get_db() as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE projects SET is_deleted = TRUE WHERE id = %s AND is_deleted = FALSE",
+                    (project_id,)
+                )
+                if cur.rowcount == 0:
+                    conn.rollback()
+                    return None
+                cur.execute(
+                    "UPDATE boards SET is_deleted = TRUE, deleted_at = NOW() "
+                    "WHERE project_id = %s AND is_deleted = FALSE",
+                    (project_id,)
+                )
+                if current_shard() == HOME_SHARD:
+                    job_id = _enqueue(cur, 'project', project_id, user_id)
+                    conn.commit()
+                    return job_id
+                conn.commit()
+            return _enqueue(None, 'project', project_id, user_id)
+        except Exception as e:
+            print(f"Error deleting project {project_id}: {e}")
+            conn.rollback()
+            return None
+
+
+def _record_batch(conn, cur, job, deleted: int) -> None:
+    """Commits the batch, together with the job's progress (and lease renewal) when both are on one database."""
+    if current_shard() == HOME_SHARD:
+        record_progress(job, deleted, cur)
+        conn.commit()
+    else:
+        conn.commit()
+        record_progress(job, deleted)
+
+
+# ===============================
+# Batched deletes
+# ===============================
+def _purge_task_batch(cur, board_id: int, batch_size: int) -> int:
+    """
+    Deletes up to `batch_size` tasks of a board together with their child
+    rows. Returns number of rows removed (0 = board has no tasks left).
+    Idempotent, so a crash between batches simply resumes here.
+    """
+    cur.execute(
+        "SELECT id FROM tasks WHERE board_id = %s ORDER BY id LIMIT %s",
+        (board_id, batch_size)
+    )
+    task_ids = [row[0] for row in cur.fetchall()]
+    if not task_ids:
+        return 0
+
+    placeholders = ", ".join(["%s"] * len(task_ids))
+    deleted = 0
+    for table in TASK_CHILD_TABLES:
+        cur.execute(f"DELETE FROM {table} WHERE task_id IN ({placeholders})", task_ids)
+        deleted += cur.rowcount
+    cur.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", task_ids)
+    deleted += cur.rowcount
+    return deleted
+
+
+def _purge_limited(cur, table: str, column: str, value: int, batch_size: int) -> int:
+    cur.execute(f"DELETE FROM {table} WHERE {column} = %s LIMIT %s", (value, batch_size))
+    return cur.rowcount
+
+
+def _purge_board(conn, cur, job, board_id: int, batch_size: int, pause: float) -> None:
+    while True:
+        deleted = _purge_task_batch(cur, board_id, batch_size)
+        if deleted == 0:
+            break
+        _record_batch(conn, cur, job, deleted)
+        time.sleep(pause)
+
+    cur.execute("DELETE FROM boards WHERE id = %s AND is_deleted = TRUE", (board_id,))
+    _record_batch(conn, cur, job, cur.rowcount)
+
+
+def _purge_project(conn, cur, job, project_id: int, batch_size: int, pause: float) -> None:
+    cur.execute("SELECT id FROM boards WHERE project_id = %s ORDER BY id", (project_id,))
+    board_ids = [row[0] for row in cur.fetchall()]
+    for board_id in board_ids:
+        _purge_board(conn, cur, job, board_id, batch_size, pause)
+
+    # Task links went with the boards; labels and memberships are small but
+    # are still removed in bounded chunks.
+    for table, column in (('labels', 'project_id'), ('project_members', 'project_id')):
+        while True:
+            deleted = _purge_limited(cur, table, column, project_id, batch_size)
+            if deleted == 0:
+                break
+            _record_batch(conn, cur, job, deleted)
+            time.sleep(pause)
+
+    cur.execute("DELETE FROM projects WHERE id = %s AND is_deleted = TRUE", (project_id,))
+    _record_batch(conn, cur, job, cur.rowcount)
+
+
+# ===============================
+# Job handler
+# ===============================
+@job_handler('purge')
+def purge_job(job, batch_size: Optional[int] = None, pause: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Purges the board / project in job.payload. Every batch is idempotent, so
+    a retry or a worker taking over an expired lease resumes where it stopped.
+    """
+    batch_size = batch_size or Config.PURGE_BATCH_SIZE
+    pause = Config.PURGE_PAUSE_SECONDS if pause is None else pause
+    entity_type, entity_id = job.payload['entity_type'], job.payload['entity_id']
+
+    # On the entity's shard; during a project move this raises and the job is retried later
+    shard = on_board(entity_id, write=True) if entity_type == 'board' else on_project(entity_id, write=True)
+    with shard, get_db() as conn:
+        try:
+            with conn.cursor() as cur:
+                if entity_type == 'board':
+                    _purge_board(conn, cur, job, entity_id, batch_size, pause)
+                else:
+                    _purge_project(conn, cur, job, entity_id, batch_size, pause)
+        except Exception:
+            conn.rollback()
+            raise
+    if entity_type == 'board':
+        forget_board(entity_id)
+    else:
+        forget_project(entity_id)
+    return {'rows_deleted': job.progress}
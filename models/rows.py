@@ -0,0 +1,229 @@
+# models/rows.py
+# Slotted row objects for the hot read paths (board cards, task detail,
+# boards, projects, members), built straight from tuple cursors.
+#
+# A dict per row costs a hash table plus a key per column; these cost one
+# fixed-size object, and each query selects only the columns its class
+# declares (cards never load the description TEXT). Column lists come from
+# the field order, so a query and its class can't drift apart:
+#     cur.execute(f"SELECT {TaskCard.COLUMNS} FROM tasks t LEFT JOIN users u ...")
+#     tasks = rows(cur, TaskCard)
+# Rows read like attributes (code, Jinja) and like dicts (row['id'],
+# row.get('x')) for older callers; JSON uses to_dict() (see json_provider.py).
+#
+# ?fields= projections: parse_fields() validates the request, and
+# columns(fields) selects only those columns (the rest come back as NULL,
+# never read from the table); to_dict(fields) serializes just them.
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from itertools import starmap
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+
+class Row:
+    __slots__ = ()
+
+    COLUMNS: ClassVar[str] = ""
+    # Fields that are filled in by the model after loading (not columns)
+    EXTRA: ClassVar[Tuple[str, ...]] = ()
+    # Fields never sent to clients
+    PRIVATE: ClassVar[Tuple[str, ...]] = ()
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        setattr(self, name, value)
+
+    def __contains__(self, name: str) -> bool:
+        return hasattr(self, name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return getattr(self, name, default)
+
+    def to_dict(self, only: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        if only is None:
+            return dict(zip(self._json_fields, self._json_values(self)))
+        return {name: getattr(self, name) for name in only}
+
+    @classmethod
+    def columns(cls, only: Optional[Tuple[str, ...]] = None) -> str:
+        """COLUMNS, or with `only` a SELECT list reading just those columns."""
+        if only is None:
+            return cls.COLUMNS
+        key = frozenset(only)
+        select = cls._projections.get(key)
+        if select is None:
+            select = cls._projections[key] = ", ".join(
+                expr if name in key else f"NULL AS {name}" for name, expr in cls._select
+            )
+        return select
+
+
+def _columns(cls, alias: str, **expressions: str) -> List[Tuple[str, str]]:
+    """(field, select expression) in field order: `alias.field` or `expression AS field`."""
+    parts = []
+    for f in fields(cls):
+        if f.name in cls.EXTRA:
+            continue
+        expr = expressions.get(f.name)
+        parts.append((f.name, f"{expr} AS {f.name}" if expr else f"{alias}.{f.name}"))
+    return parts
+
+
+def _finish(cls, alias: str, **expressions: str):
+    cls._select = _columns(cls, alias, **expressions)
+    cls._projections = {}
+    cls.COLUMNS = ", ".join(expr for _, expr in cls._select)
+    cls._json_fields = tuple(f.name for f in fields(cls) if f.name not in cls.PRIVATE)
+    cls._json_values = staticmethod(attrgetter(*cls._json_fields))
+    return cls
+
+
+def parse_fields(spec: Optional[str], cls) -> Optional[Tuple[str, ...]]:
+    """
+    ?fields=id,title,status -> ('id', 'title', 'status') in request order;
+    None when absent (everything). ValueError on a field `cls` doesn't expose.
+    """
+    if spec is None:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in spec.split(",") if name.strip()))
+    if not names:
+        raise ValueError("'fields' is empty")
+    unknown = [name for name in names if name not in cls._json_fields]
+    if unknown:
+        raise ValueError(f"Invalid fields '{', '.join(unknown)}' (use any of: {', '.join(cls._json_fields)})")
+    return names
+
+
+def rows(cur, cls) -> List[Any]:
+    """All remaining rows of a tuple cursor as `cls` objects."""
+    return list(starmap(cls, cur.fetchall()))
+
+
+def row(cur, cls) -> Optional[Any]:
+    r = cur.fetchone()
+    return cls(*r) if r is not None else None
+
+
+# ===============================
+# Tasks
+# ===============================
+@dataclass(slots=True)
+class TaskCard(Row):
+    """A kanban card / task list entry (no description)."""
+    EXTRA: ClassVar[Tuple[str, ...]] = ('labels', 'label_mask')
+    PRIVATE: ClassVar[Tuple[str, ...]] = ('label_mask',)
+
+    id: int
+    title: str
+    assigned_to: Optional[int]
+    assigned_username: Optional[str]
+    priority: Optional[str]
+    due_date: Optional[date]
+    status: str
+    comment_count: int
+    version: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    labels: Optional[List[Dict[str, Any]]] = field(default=None, kw_only=True)
+    label_mask: int = field(default=0, kw_only=True)
+
+
+@dataclass(slots=True)
+class Task(TaskCard):
+    """The full task (detail modal, API): card columns plus the rest of the row."""
+    PRIVATE: ClassVar[Tuple[str, ...]] = ('label_mask', 'labels')
+
+    board_id: Optional[int] = None
+    description: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    order_index: Optional[int] = None
+    is_deleted: Optional[bool] = None
+    created_by: Optional[int] = None
+
+
+_finish(TaskCard, "t", assigned_username="u.username")
+_finish(Task, "t", assigned_username="u.username")
+
+
+# ===============================
+# Boards / projects / members
+# ===============================
+@dataclass(slots=True)
+class Board(Row):
+    EXTRA: ClassVar[Tuple[str, ...]] = ('task_counts',)
+
+    id: int
+    project_id: int
+    name: str
+    description: Optional[str]
+    icon: Optional[str]
+    is_archived: Optional[bool]
+    task_version: int
+    version: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    task_counts: Optional[Dict[str, int]] = field(default=None, kw_only=True)
+
+
+@dataclass(slots=True)
+class Project(Row):
+    id: int
+    name: str
+    description: Optional[str]
+    owner_id: int
+    status: Optional[str]
+    start_date: Optional[date]
+    end_date: Optional[date]
+    color: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class Member(Row):
+    user_id: int
+    username: str
+    role: str
+
+
+_finish(Board, "b")
+_finish(Project, "p")
+_finish(Member, "pm", user_id="u.id", username="u.username")
+
+
+# ===============================
+# Background jobs
+# ===============================
+@dataclass(slots=True)
+class Job(Row):
+    """A jobs row; payload and result hold the decoded JSON (see jobs_model)."""
+    PRIVATE: ClassVar[Tuple[str, ...]] = ('payload', 'dedupe_key', 'leased_by')
+
+    id: int
+    kind: str
+    payload: Any
+    dedupe_key: Optional[str]
+    priority: int
+    status: str
+    attempts: int
+    max_attempts: int
+    run_after: Optional[datetime]
+    leased_by: Optional[str]
+    heartbeat_at: Optional[datetime]
+    progress: int
+    result: Any
+    last_error: Optional[str]
+    created_by: Optional[int]
+    created_at: Optional[datetime]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+_finish(Job, "j")
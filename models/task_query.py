@@ -0,0 +1,146 @@
+# models/task_query.py
+# Compiles request parameters into a parameterized WHERE / ORDER BY for
+# board task queries.
+#
+# Only allow-listed parameters are accepted, values are always bound as
+# parameters, and every filter maps onto an index of `tasks` (see
+# migrations/create_tables.py), so none of them degrades to a full scan:
+#   assignee   -> idx_board_assignee (board_id, assigned_to)
+#   priority   -> idx_board_priority (board_id, priority)
+#   status     -> idx_board_status   (board_id, status)
+#   due_from/to-> idx_board_due      (board_id, due_date)
+#   label      -> task_labels PRIMARY (task_id, label_id) per candidate row
+#   q          -> ft_title_description FULLTEXT (title, description)
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+STATUSES = ['To Do', 'In Progress', 'Review', 'Done']
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+
+# ?sort=due / ?sort=-priority ...  (name -> column)
+SORT_FIELDS = {
+    'created': 't.created_at',
+    'updated': 't.updated_at',
+    'due': 't.due_date',
+    'priority': 't.priority',  # ENUM sorts by declaration order: Low < ... < Critical
+    'title': 't.title',
+}
+DEFAULT_SORT = '-created'
+
+FILTER_PARAMS = {'assignee', 'priority', 'status', 'due_from', 'due_to', 'label', 'q', 'sort'}
+MAX_IN_VALUES = 50
+
+
+class TaskFilter:
+    """WHERE fragments + params and an ORDER BY, all for alias `t` (tasks)."""
+
+    __slots__ = ("where", "params", "order_by")
+
+    def __init__(self):
+        self.where: List[str] = []
+        self.params: List[Any] = []
+        self.order_by = ""
+
+    def sql(self) -> str:
+        """' AND ...' to append after the board condition."""
+        return "".join(f" AND {clause}" for clause in self.where)
+
+
+def _values(args, name) -> List[str]:
+    values = []
+    for raw in args.getlist(name) if hasattr(args, "getlist") else [args.get(name)]:
+        if raw:
+            values.extend(v.strip() for v in str(raw).split(",") if v.strip())
+    if len(values) > MAX_IN_VALUES:
+        raise ValueError(f"Too many values for '{name}'")
+    return values
+
+
+def _in(column: str, values: List[Any], f: TaskFilter) -> None:
+    f.where.append(f"{column} IN ({', '.join(['%s'] * len(values))})")
+    f.params.extend(values)
+
+
+def _date(name: str, value: str):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"'{name}' must be YYYY-MM-DD")
+
+
+def compile_task_filters(args: Dict[str, Any], current_user_id: Optional[int] = None) -> TaskFilter:
+    """
+    args: request.args (or a dict). Raises ValueError for unknown
+    parameters or invalid values (the route turns that into a 400).
+    """
+    unknown = set(args.keys()) - FILTER_PARAMS - {'labels', 'fields'}
+    if unknown:
+        raise ValueError(f"Unsupported parameter(s): {', '.join(sorted(unknown))}")
+
+    f = TaskFilter()
+
+    # assignee=12,7 | assignee=me | assignee=none
+    assignees = _values(args, 'assignee')
+    if assignees:
+        ids, unassigned = [], False
+        for value in assignees:
+            if value == 'none':
+                unassigned = True
+            elif value == 'me' and current_user_id:
+                ids.append(current_user_id)
+            elif value.isdigit():
+                ids.append(int(value))
+            else:
+                raise ValueError(f"Invalid assignee '{value}'")
+        clauses = []
+        if ids:
+            clauses.append(f"t.assigned_to IN ({', '.join(['%s'] * len(ids))})")
+            f.params.extend(ids)
+        if unassigned:
+            clauses.append("t.assigned_to IS NULL")
+        f.where.append(clauses[0] if len(clauses) == 1 else f"({' OR '.join(clauses)})")
+
+    for name, allowed, column in (('priority', PRIORITIES, 't.priority'), ('status', STATUSES, 't.status')):
+        values = _values(args, name)
+        if values:
+            bad = [v for v in values if v not in allowed]
+            if bad:
+                raise ValueError(f"Invalid {name} '{bad[0]}'")
+            _in(column, values, f)
+
+    due_from = args.get('due_from')
+    if due_from:
+        f.where.append("t.due_date >= %s")
+        f.params.append(_date('due_from', due_from))
+    due_to = args.get('due_to')
+    if due_to:
+        f.where.append("t.due_date <= %s")
+        f.params.append(_date('due_to', due_to))
+
+    # label=bug&label=ui -> task must carry every listed label
+    for name in _values(args, 'label'):
+        f.where.append(
+            "EXISTS (SELECT 1 FROM task_labels tl JOIN labels l ON l.id = tl.label_id "
+            "WHERE tl.task_id = t.id AND l.name = %s)"
+        )
+        f.params.append(name)
+
+    q = (args.get('q') or '').strip()
+    if q:
+        if len(q) > 200:
+            raise ValueError("Search text is too long")
+        words = re.findall(r"\w+", q)
+        if words:
+            # Every word must match, prefix search on each
+            f.where.append("MATCH (t.title, t.description) AGAINST (%s IN BOOLEAN MODE)")
+            f.params.append(" ".join(f"+{word}*" for word in words))
+
+    sort = args.get('sort') or DEFAULT_SORT
+    direction = "DESC" if sort.startswith('-') else "ASC"
+    column = SORT_FIELDS.get(sort.lstrip('-'))
+    if not column:
+        raise ValueError(f"Invalid sort '{sort}' (use one of: {', '.join(SORT_FIELDS)})")
+    f.order_by = f"{column} {direction}, t.id {direction}"
+
+    return f
@@ -1,9 +1,11 @@
-from db import get_db
+from db import HOME_SHARD, get_db
+from sharding import copy_user, is_sharded
 
 
 
 def create_user(username, email, password_hash, role='user'):
-    with get_db() as conn:
+    # users lives on shard 0; other shards get a copy (sharding.py)
+    with get_db(HOME_SHARD) as conn:
         try:
             with conn.cursor() as cur:
                 cur.execute("""
@@ -11,6 +13,8 @@ def create_user(username, email, password_hash, role='user'):
                     VALUES (%s, %s, %s, %s)
                 """, (username, email, password_hash, role))
                 conn.commit()
+                if is_sharded():
+                    copy_user(cur.lastrowid)
                 return cur.lastrowid  # ← Return user ID
         except Exception as e:
             print(f"Create user error: {e}")
@@ -18,7 +22,7 @@ def create_user(username, email, password_hash, role='user'):
             return None
 
 def get_user_by_username(username):
-    conn = get_db()
+    conn = get_db(HOME_SHARD)
     with conn.cursor(dictionary=True) as cur:
         cur.execute("SELECT * FROM users WHERE username=%s", (username,))
         user = cur.fetchone()
@@ -26,7 +30,7 @@ def get_user_by_username(username):
     return user
 
 def get_user_by_id(user_id):
-    conn = get_db()
+    conn = get_db(HOME_SHARD)
     with conn.cursor(dictionary=True) as cur:
         cur.execute("SELECT * FROM users WHERE id=%s", (user_id,))
         user = cur.fetchone()
@@ -0,0 +1,14 @@
+# ==============================================================
+# FILE: purge.py
+# PURPOSE: Run / inspect the background purge of deleted boards & projects
+# ==============================================================
+#   python purge.py            -> keep purging (separate worker process)
+#   python purge.py --once     -> purge what is queued now, then exit
+#   python purge.py --status   -> show purge jobs and rows deleted so far
+#
+# Purges are 'purge' jobs; this is `python jobs.py --kind purge`.
+
+from jobs import main
+
+if __name__ == "__main__":
+    main(kinds_default=["purge"])
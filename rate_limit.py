@@ -0,0 +1,253 @@
+# ==============================================================
+# FILE: rate_limit.py
+# PURPOSE: Per-user / per-IP token buckets shared by all gunicorn workers
+# ==============================================================
+# Rules are per endpoint (Config.RATE_LIMITS), e.g.
+#   auth.login:POST=10/60:ip            10 requests per 60s per client IP
+#   boards.move_task_route=60/10:user   60 per 10s per logged-in user
+# Each bucket holds up to `count` tokens and refills at count/period per
+# second; a request takes one token or gets 429 with Retry-After.
+#
+# Buckets live in a memory-mapped file (Config.RATE_LIMIT_PATH), so every
+# worker on the host sees the same counts. The file is a fixed table of
+# slots split into stripes; a request locks one stripe (fcntl byte-range
+# lock + a thread lock), probes a few slots and updates one in place. No
+# syscalls besides the lock, no allocation worth mentioning: a few
+# microseconds per limited request (benchmarks/rate_limit_benchmark.py).
+# Without fcntl (Windows) or with RATE_LIMIT_PATH="" the buckets are kept
+# per process instead, i.e. limits apply per worker.
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from flask import jsonify, make_response, request, session
+
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: per-process buckets only
+    fcntl = None
+
+KEY_TYPES = ('user', 'ip')
+
+
+class Rule(NamedTuple):
+    count: int       # bucket size (burst)
+    period: float    # seconds to refill a full bucket
+    key: str         # 'user' (falls back to IP when logged out) or 'ip'
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.period
+
+
+def parse_rules(spec: str) -> Dict[Tuple[str, Optional[str]], Rule]:
+    """
+    "endpoint[:METHOD]=count/seconds:user|ip, ..." -> {(endpoint, method): Rule}
+    method None = every method. Raises ValueError on a malformed entry.
+    """
+    rules = {}
+    for entry in filter(None, (e.strip() for e in spec.split(","))):
+        try:
+            target, _, limit = entry.partition("=")
+            endpoint, _, method = target.strip().partition(":")
+            amount, _, key = limit.partition(":")
+            count, _, period = amount.partition("/")
+            rule = Rule(int(count), float(period), key.strip() or 'user')
+            if rule.count < 1 or rule.period <= 0 or rule.key not in KEY_TYPES:
+                raise ValueError
+        except ValueError:
+            raise ValueError(f"Invalid rate limit '{entry}' (use endpoint[:METHOD]=count/seconds:user|ip)")
+        rules[(endpoint, method.upper() or None)] = rule
+    return rules
+
+
+def bucket_key(name: str) -> int:
+    """Stable 64-bit key (hash() differs between worker processes); 0 marks a free slot."""
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little") or 1
+
+
+def _take(tokens: float, stamp: float, now: float, rate: float, burst: int) -> Tuple[float, float]:
+    """Token bucket step -> (tokens left, seconds to wait; 0 = allowed)."""
+    tokens = min(burst, tokens + (now - stamp) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+# ================================
+# STORES
+# ================================
+class LocalBuckets:
+    """Per-process buckets: the stand-in when no shared file is available."""
+
+    shared = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._buckets = {}  # key -> [tokens, stamp]
+        self._lock = threading.Lock()
+
+    def take(self, key: int, rate: float, burst: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_entries:
+                    # Drop buckets idle for longer than a full refill (they hold no state)
+                    self._buckets = {k: b for k, b in self._buckets.items() if now - b[1] < burst / rate}
+                bucket = self._buckets[key] = [float(burst), now]
+            bucket[0], wait = _take(bucket[0], bucket[1], now, rate, burst)
+            bucket[1] = now
+            return wait
+
+
+class SharedBuckets:
+    """
+    Buckets in a memory-mapped file shared by every process on the host.
+    Layout: 16-byte header, then `slots` records of (key u64, tokens f64,
+    stamp f64). A key lives in one stripe of STRIPE_SLOTS slots and is
+    found within PROBE slots of its home; when all of those are taken the
+    least recently used one is recycled (a recycled bucket starts full).
+    """
+
+    shared = True
+    HEADER = struct.Struct("<4sIQ")
+    SLOT = struct.Struct("<Qdd")
+    MAGIC = b"GBRL"
+    STRIPE_SLOTS = 256
+    PROBE = 8
+
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = max(self.STRIPE_SLOTS, slots - slots % self.STRIPE_SLOTS)
+        self.size = self.HEADER.size + self.slots * self.SLOT.size
+        self._lock = threading.Lock()
+        self._pid = None
+        self._open()
+
+    def _open(self):
+        # Like the DB pools: one mapping per process, never reused across a fork
+        if self._pid is not None:
+            self._map.close()
+            os.close(self._fd)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Check, create and open under one lock (a sidecar file: the table
+        # itself may be replaced), or a worker starting alongside another
+        # could open a table that is renamed over right after
+        lock_fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            if (os.fstat(fd).st_size != self.size
+                    or os.pread(fd, self.HEADER.size, 0) != self.HEADER.pack(self.MAGIC, 1, self.slots)):
+                os.close(fd)
+                self._create()
+                fd = os.open(self.path, os.O_RDWR)
+        finally:
+            os.close(lock_fd)  # releases the flock
+        self._fd = fd
+        self._map = mmap.mmap(fd, self.size)
+        self._pid = os.getpid()
+
+    def _create(self):
+        # Built aside and renamed into place: processes still mapping a table
+        # of another size keep their (old) file instead of faulting on it
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, self.size)
+            os.pwrite(fd, self.HEADER.pack(self.MAGIC, 1, self.slots), 0)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.path)
+
+    def take(self, key: int, rate: float, burst: int, now: Optional[float] = None) -> float:
+        if self._pid != os.getpid():
+            self._open()
+        now = time.time() if now is None else now
+        home = key % self.slots
+        stripe = home - home % self.STRIPE_SLOTS
+        stripe_bytes = self.STRIPE_SLOTS * self.SLOT.size
+        stripe_offset = self.HEADER.size + stripe * self.SLOT.size
+        mem, slot_struct = self._map, self.SLOT
+
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, stripe_bytes, stripe_offset)
+            try:
+                target, oldest = None, None
+                for i in range(self.PROBE):
+                    offset = stripe_offset + ((home - stripe + i) % self.STRIPE_SLOTS) * slot_struct.size
+                    slot_key, tokens, stamp = slot_struct.unpack_from(mem, offset)
+                    if slot_key == key:
+                        target = offset
+                        break
+                    if slot_key == 0:
+                        target, tokens, stamp = offset, float(burst), now
+                        break
+                    if oldest is None or stamp < oldest[2]:
+                        oldest = (offset, tokens, stamp)
+                if target is None:
+                    target, tokens, stamp = oldest[0], float(burst), now
+                tokens, wait = _take(tokens, stamp, now, rate, burst)
+                slot_struct.pack_into(mem, target, key, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, stripe_bytes, stripe_offset)
+        return wait
+
+
+def open_store():
+    """SharedBuckets at Config.RATE_LIMIT_PATH, or LocalBuckets if that can't be used."""
+    if fcntl is not None and Config.RATE_LIMIT_PATH:
+        try:
+            return SharedBuckets(Config.RATE_LIMIT_PATH, Config.RATE_LIMIT_SLOTS)
+        except OSError as e:
+            print(f"Rate limit file unavailable ({e}); limiting per worker")
+    return LocalBuckets(Config.RATE_LIMIT_SLOTS)
+
+
+# ================================
+# FLASK HOOK
+# ================================
+def _too_many(wait: float):
+    retry_after = max(1, math.ceil(wait))
+    message = f"Too many requests. Try again in {retry_after} seconds."
+    if request.is_json or request.accept_mimetypes.best == "application/json":
+        response = jsonify(error=message, retry_after=retry_after)
+    else:
+        response = make_response(message)
+        response.mimetype = "text/plain"
+    response.status_code = 429
+    response.headers["Retry-After"] = str(retry_after)
+    return response
+
+
+def init_rate_limits(app):
+    if not Config.RATE_LIMIT_ENABLED:
+        return
+    rules = parse_rules(Config.RATE_LIMITS)
+    if not rules:
+        return
+    store = open_store()
+    app.extensions["rate_limit"] = store
+
+    @app.before_request
+    def check_rate_limit():
+        endpoint = request.endpoint
+        method = request.method
+        rule = rules.get((endpoint, method))
+        if rule is None:
+            rule, method = rules.get((endpoint, None)), "*"
+            if rule is None:
+                return None
+        user_id = session.get("user_id") if rule.key == 'user' else None
+        who = f"u:{user_id}" if user_id else f"ip:{request.remote_addr}"
+        wait = store.take(bucket_key(f"{endpoint}|{method}|{who}"), rule.rate, rule.count)
+        return _too_many(wait) if wait else None
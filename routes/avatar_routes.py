@@ -0,0 +1,130 @@
+# routes/avatar_routes.py
+# Initials avatars rendered locally as SVG (replaces ui-avatars.com).
+# Output depends only on the username, so responses are cached forever;
+# AVATAR_VERSION is part of every URL and must be bumped if the look changes.
+import hashlib
+import re
+from functools import lru_cache
+
+from flask import Blueprint, Response, request, url_for
+from markupsafe import Markup, escape
+
+from config import Config
+
+avatars_bp = Blueprint("avatars", __name__)
+
+AVATAR_VERSION = "1"
+AVATAR_SIZE = 64
+MAX_SPRITE_USERS = 200
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+# ========================================
+# RENDERING
+# ========================================
+def initials(username):
+    parts = [p for p in re.split(r"[\s._\-]+", username.strip()) if p]
+    if not parts:
+        return "?"
+    if len(parts) == 1:
+        return parts[0][:2].upper()
+    return (parts[0][0] + parts[1][0]).upper()
+
+
+def avatar_color(username):
+    """Stable background colour: hue from a hash of the username."""
+    digest = hashlib.md5(username.encode("utf-8")).digest()
+    hue = int.from_bytes(digest[:2], "big") % 360
+    return f"hsl({hue}, 55%, 45%)"
+
+
+def avatar_id(username):
+    """
+    Element id of a user's <symbol> inside a sprite; one id per username:
+    anything but letters, digits and '-' (the escape '_' included) is
+    written as _<hex code point>_, so a.b and a_b don't share an id.
+    """
+    return "avatar-" + re.sub(r"[^A-Za-z0-9-]", lambda m: f"_{ord(m.group()):x}_", username)
+
+
+def _avatar_body(username):
+    half = AVATAR_SIZE // 2
+    return (
+        f'<circle cx="{half}" cy="{half}" r="{half}" fill="{avatar_color(username)}"/>'
+        f'<text x="50%" y="50%" dy=".35em" text-anchor="middle" fill="#fff" '
+        f'font-family="Inter, Arial, sans-serif" font-size="{AVATAR_SIZE * 0.4:.0f}" font-weight="600">'
+        f'{escape(initials(username))}</text>'
+    )
+
+
+@lru_cache(maxsize=Config.AVATAR_CACHE_SIZE)
+def render_avatar(username):
+    """Returns (svg bytes, etag) for one user."""
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{AVATAR_SIZE}" height="{AVATAR_SIZE}" '
+        f'viewBox="0 0 {AVATAR_SIZE} {AVATAR_SIZE}" role="img" aria-label="{escape(username)}">'
+        f'{_avatar_body(username)}</svg>'
+    ).encode("utf-8")
+    return svg, hashlib.sha1(svg).hexdigest()[:16]
+
+
+@lru_cache(maxsize=Config.AVATAR_CACHE_SIZE)
+def render_sprite(usernames):
+    """Returns (svg bytes, etag) with one <symbol> per username (tuple, sorted)."""
+    symbols = "".join(
+        f'<symbol id="{avatar_id(u)}" viewBox="0 0 {AVATAR_SIZE} {AVATAR_SIZE}">{_avatar_body(u)}</symbol>'
+        for u in usernames
+    )
+    svg = f'<svg xmlns="http://www.w3.org/2000/svg" style="display:none">{symbols}</svg>'.encode("utf-8")
+    return svg, hashlib.sha1(svg).hexdigest()[:16]
+
+
+def _svg_response(svg, etag):
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(svg, mimetype="image/svg+xml")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = IMMUTABLE
+    return response
+
+
+# ========================================
+# ROUTES
+# ========================================
+@avatars_bp.route("/<path:username>.svg")
+def avatar(username):
+    return _svg_response(*render_avatar(username[:100]))
+
+
+# No .svg suffix: every /avatars/<name>.svg is a user's avatar (user "sprite" too)
+@avatars_bp.route("/sprite")
+def sprite():
+    """
+    /avatars/sprite?u=alice&u=bob -> one request for many avatars,
+    used as <svg><use href="/avatars/sprite?u=alice&u=bob#avatar-alice"/></svg>
+    """
+    usernames = tuple(sorted({u[:100] for u in request.args.getlist("u") if u}))[:MAX_SPRITE_USERS]
+    return _svg_response(*render_sprite(usernames))
+
+
+# ========================================
+# TEMPLATE HELPERS
+# ========================================
+def avatar_url(username):
+    return url_for("avatars.avatar", username=username or "?", v=AVATAR_VERSION)
+
+
+@avatars_bp.app_template_filter("avatar_id")
+def avatar_id_filter(username):
+    return avatar_id(username or "?")
+
+
+@avatars_bp.app_template_global("avatar_sprite")
+def avatar_sprite(usernames):
+    """
+    Inline sprite for a page: cards then reference avatars with
+    <svg><use href="#avatar-…"/></svg>, no request per user at all.
+    """
+    svg, _ = render_sprite(tuple(sorted({u for u in usernames if u})))
+    return Markup(svg.decode("utf-8"))
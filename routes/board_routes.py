@@ -1,14 +1,31 @@
 # routes/boards.py
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify
-from functools import wraps
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from flask import (
+    Blueprint, render_template, request, redirect, url_for, session, flash, jsonify, current_app, make_response
+)
+from functools import lru_cache, wraps
 from models.boards_model import (
     get_boards_by_project, get_board, create_board, update_board, delete_board,
-    get_tasks_by_board, create_task, get_task, update_task, delete_task, update_task_status
+    get_tasks_by_board, get_board_tasks, create_task, get_task, update_task, delete_task, update_task_status,
+    get_task_state, get_board_state, ConflictError, PermissionDenied, EDITABLE_TASK_FIELDS, MEMBER_ROLES
+)
+from models.project_model import get_project_by_id, get_project_members, delete_project
+from models.label_filter import LabelIndex, compile_label_filter
+from models.task_query import compile_task_filters
+from models.rows import Task, TaskCard, parse_fields
+from models.comments_model import (
+    list_comments, add_comment, DEFAULT_PAGE_SIZE as DEFAULT_COMMENT_PAGE, MAX_COMMENT_LENGTH
 )
-from models.project_model import get_project_by_id, get_project_members
+from fragment_cache import fragment_cache
 
 boards_bp = Blueprint("boards", __name__, template_folder="../templates/boards")
 
+TASK_STATUSES = ['To Do', 'In Progress', 'Review', 'Done']
+
 # ==============================================================  
 # AUTH & PERMISSION HELPERS
 # ==============================================================
@@ -58,6 +75,105 @@ def project_access_required(roles=None):
     return decorator
 
 
+# ==============================================================
+# OPTIMISTIC CONCURRENCY (ETag "v<version>" / If-Match)
+# ==============================================================
+_IF_MATCH = re.compile(r'(?:W/)?"?v?(\d+)(?:\.\d+)?"?')
+
+
+def expected_version():
+    """
+    Version the client last saw, from If-Match: "v3.1" (as sent in ETag),
+    "v3", W/"v3", v3 and 3 are all accepted. None without the header or
+    for *. Raises ValueError for anything else.
+    """
+    header = request.headers.get("If-Match", "").strip()
+    if not header or header == "*":
+        return None
+    match = _IF_MATCH.fullmatch(header.split(",")[0].strip())
+    if not match:
+        raise ValueError("Invalid If-Match header (expected \"v<version>\")")
+    return int(match.group(1))
+
+
+def versioned(response, version):
+    response.set_etag(f"v{version}")
+    return response
+
+
+def conflict(error, current):
+    """409 with the task as it is now, so the client can merge and retry."""
+    response = jsonify(error=error, current=current)
+    response.set_etag(task_etag(current))
+    return response, 409
+
+
+def wants_json():
+    """API clients (JSON body or Accept: application/json) rather than a form post."""
+    return request.is_json or request.accept_mimetypes.best == "application/json"
+
+
+def accepted(job_id):
+    """202 for work handed to a background job: poll Location (GET /jobs/<id>)."""
+    status_url = url_for("jobs.get_job_route", job_id=job_id)
+    response = jsonify(job_id=job_id, status_url=status_url)
+    response.headers["Location"] = status_url
+    return response, 202
+
+
+# ==============================================================
+# CONDITIONAL GET (ETag / If-None-Match -> 304)
+# ==============================================================
+# Validators are built from version columns fetched in one small query
+# (get_task_state / get_board_state), so a client whose copy is current
+# costs that query and an empty 304. Everything here is per user, so
+# private; clients revalidate on every use (no-cache), which keeps polling
+# and back/forward navigation correct and cheap. A page showing a one-off
+# flash message gets no validator and is not stored.
+CACHE_CONTROL = {
+    'task': "private, no-cache",
+    'tasks': "private, no-cache",
+    'board': "private, no-cache",
+    'flash': "no-store",
+}
+
+
+def task_etag(task):
+    """"v<version>.<comment_count>": comments change the JSON but not the edit version."""
+    return f"v{task['version']}.{task['comment_count']}"
+
+
+@lru_cache(maxsize=1)
+def _deploy_token():
+    """Changes with any template or built asset; the same in every worker."""
+    digest = hashlib.blake2b(digest_size=8)
+    for root, dirs, files in os.walk(os.path.join(current_app.root_path, "templates")):
+        dirs.sort()
+        for name in sorted(files):
+            stat = os.stat(os.path.join(root, name))
+            digest.update(f"{root}/{name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    digest.update(json.dumps(current_app.extensions.get("asset_manifest", {}), sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def state_etag(prefix, *parts):
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f"{prefix}{digest}"
+
+
+def not_modified(etag, policy):
+    """An empty 304 if the client already has `etag`, else None."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return cacheable(current_app.response_class(status=304), etag, policy)
+
+
+def cacheable(response, etag, policy):
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL[policy]
+    return response
+
+
 # ========================================
 # DELETE BOARD
 # ========================================
@@ -74,19 +190,40 @@ def delete_board_route(board_id):
     user_role = next((m['role'] for m in members if m['user_id'] == session['user_id']), None)
 
     if user_role not in ['owner'] and not session.get('is_admin'):
+        if wants_json():
+            return jsonify(error="Permission denied"), 403
         flash("You don't have permission to delete this board.", "error")
         return redirect(url_for("boards.board_view", board_id=board_id))
 
-    # Perform delete
-    success = delete_board(board_id)
-    if success:
+    # Perform delete (board disappears now, rows are purged by a background job)
+    job_id = delete_board(board_id, session['user_id'])
+    if wants_json():
+        return accepted(job_id) if job_id else (jsonify(error="Failed to delete board"), 404)
+    if job_id:
         flash("Board deleted successfully.", "success")
-        return redirect(url_for("projects.list_projects"))
+        return redirect(url_for("boards.list_boards", project_id=board['project_id']))
     else:
         flash("Failed to delete board.", "error")
         return redirect(url_for("boards.board_view", board_id=board_id))
 
 
+# ========================================
+# DELETE PROJECT
+# ========================================
+@boards_bp.route("/projects/<int:project_id>/delete", methods=["POST"])
+@login_required
+@project_access_required(roles=['owner'])
+def delete_project_route(project_id, **kwargs):
+    job_id = delete_project(project_id, session['user_id'])
+    if wants_json():
+        return accepted(job_id) if job_id else (jsonify(error="Failed to delete project"), 404)
+    if job_id:
+        flash("Project deleted successfully.", "success")
+        return redirect(url_for("dashboard.dashboard"))
+    flash("Failed to delete project.", "error")
+    return redirect(url_for("boards.list_boards", project_id=project_id))
+
+
 # ==============================================================  
 # BOARD ROUTES
 # ==============================================================
@@ -150,10 +287,17 @@ def edit_board_route(board_id):
             flash("Name is required.", "error")
             return redirect(request.url)
 
-        if update_board(board_id, name, description):
-            flash("Board updated!", "success")
-            return redirect(url_for("boards.board_view", board_id=board_id))
-        flash("Update failed.", "error")
+        try:
+            if update_board(board_id, name, description,
+                            expected_version=request.form.get("version", type=int)):
+                flash("Board updated!", "success")
+                return redirect(url_for("boards.board_view", board_id=board_id))
+            flash("Update failed.", "error")
+        except ConflictError as e:
+            # Show what is saved now; the user re-applies their change
+            flash("Someone else changed this board while you were editing. "
+                  "Review the current version and save again.", "error")
+            board = e.current
 
     return render_template("boards/edit.html", board=board, project=project)
 
@@ -164,6 +308,19 @@ def edit_board_route(board_id):
 @boards_bp.route("/boards/<int:board_id>")
 @login_required
 def board_view(board_id):
+    # Pending flashes are rendered (and consumed) by this page: never 304 it
+    etag = None
+    if not session.get("_flashes"):
+        state = get_board_state(board_id, session['user_id'])
+        if state and state['role']:
+            etag = state_etag(
+                "b", state, session['user_id'], session.get('username'),
+                request.query_string, datetime.utcnow().year, _deploy_token()
+            )
+            cached = not_modified(etag, 'board')
+            if cached:
+                return cached
+
     board = get_board(board_id)
     if not board:
         flash("Board not found.", "error")
@@ -175,24 +332,90 @@ def board_view(board_id):
         flash("Access denied.", "error")
         return redirect(url_for("projects.list_projects"))
 
-    tasks = get_tasks_by_board(board_id)
     project = get_project_by_id(board['project_id'])
 
     can_edit = user_role in ['owner', 'editor']
 
-    return render_template(
+    # Columns are cached per (board, status, task_version, role); tasks are
+    # only loaded when at least one column has to be rendered again.
+    # Optional label filter, e.g. ?labels=bug AND NOT wontfix (evaluated in memory)
+    label_filter = request.args.get("labels", "").strip() or None
+    if label_filter:
+        try:
+            compile_label_filter(label_filter, LabelIndex())
+        except ValueError as e:
+            flash(f"Invalid label filter: {e}", "error")
+            label_filter = None
+            etag = None
+
+    tasks = {}
+
+    def render_column(status):
+        if not tasks:
+            tasks.update(get_tasks_by_board(board_id, label_filter=label_filter))
+        return render_template("boards/_column.html", status=status, tasks=tasks, board=board, can_edit=can_edit)
+
+    columns = {
+        status: fragment_cache.render(
+            ("board-column", board_id, status, board['task_version'], user_role, label_filter),
+            lambda status=status: render_column(status)
+        )
+        for status in TASK_STATUSES
+    }
+
+    response = make_response(render_template(
         "boards/board_view.html",
         board=board,
-        tasks=tasks,
+        columns=columns,
         project=project,
         user_role=user_role,
-        can_edit=can_edit
-    )
+        can_edit=can_edit,
+        label_filter=label_filter,
+        avatar_usernames=[m['username'] for m in members] + ['Unassigned']
+    ))
+    if etag is None:
+        response.headers["Cache-Control"] = CACHE_CONTROL['flash']
+        return response
+    return cacheable(response, etag, 'board')
 
 
 # ==============================================================  
 # TASK API (JSON) — Drag & Drop + CRUD
 # ==============================================================
+@boards_bp.route("/boards/<int:board_id>/tasks", methods=["GET"])
+@login_required
+def list_tasks_route(board_id):
+    """
+    GET /boards/1/tasks?assignee=me&priority=High,Critical&due_from=2025-01-01
+        &due_to=2025-01-31&label=bug&q=login&sort=-due&fields=id,title,status
+    Flat list of matching tasks (only `fields` of each, if given); unknown
+    parameters or bad values -> 400.
+    """
+    state = get_board_state(board_id, session['user_id'])
+    if not state:
+        return jsonify(error="Board not found"), 404
+    if not state['role']:
+        return jsonify(error="Permission denied"), 403
+
+    etag = state_etag("t", state['task_version'], state['members_updated_at'],
+                      session['user_id'], request.query_string)
+    cached = not_modified(etag, 'tasks')
+    if cached:
+        return cached
+
+    try:
+        filters = compile_task_filters(request.args, current_user_id=session['user_id'])
+        fields = parse_fields(request.args.get('fields'), TaskCard)
+        tasks = get_board_tasks(board_id, label_filter=request.args.get('labels') or None,
+                                filters=filters, fields=fields)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    if fields:
+        tasks = [task.to_dict(fields) for task in tasks]
+    return cacheable(jsonify(tasks=tasks, count=len(tasks)), etag, 'tasks')
+
+
 @boards_bp.route("/boards/<int:board_id>/tasks", methods=["POST"])
 @login_required
 def create_task_route(board_id):
@@ -258,64 +481,122 @@ def create_task_route(board_id):
 @boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>", methods=["GET"])
 @login_required
 def get_task_route(board_id, task_id):
-    task = get_task(task_id)
+    """GET /boards/1/tasks/7[?fields=title,description]"""
+    try:
+        fields = parse_fields(request.args.get('fields'), Task)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    state = get_task_state(task_id, board_id, session['user_id'])
+    if not state:
+        return jsonify(error="Task not found"), 404
+    if not state['role']:
+        return jsonify(error="Permission denied"), 403
+    cached = not_modified(task_etag(state), 'task')
+    if cached:
+        return cached
+
+    task = get_task(task_id, fields=fields)
     if not task or task['board_id'] != board_id:
         return jsonify(error="Task not found"), 404
-    return jsonify(task)
+    return cacheable(jsonify(task.to_dict(fields) if fields else task), task_etag(task), 'task')
 
 
-@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>", methods=["PUT"])
+# ========================================
+# TASK COMMENTS (loaded lazily by the detail modal)
+# ========================================
+# The task, its board and the user's role come from get_task_state: one
+# query, like the guarded writes below.
+@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>/comments", methods=["GET"])
 @login_required
-def update_task_route(board_id, task_id):
-    task = get_task(task_id)
-    if not task or task['board_id'] != board_id:
-        return jsonify(error="Not found"), 404
+def list_comments_route(board_id, task_id):
+    """?before=<comment id>&limit=20 — newest first; follow next_cursor for older ones."""
+    state = get_task_state(task_id, board_id, session['user_id'])
+    if not state:
+        return jsonify(error="Task not found"), 404
+    if not state['role']:
+        return jsonify(error="Permission denied"), 403
 
-    members = get_project_members(task['board_id'])
-    user_role = next((m['role'] for m in members if m['user_id'] == session['user_id']), None)
-    if user_role not in ['owner', 'editor']:
-        return jsonify(error="No permission"), 403
+    comments, next_cursor = list_comments(
+        task_id,
+        before=request.args.get("before", type=int),
+        limit=request.args.get("limit", DEFAULT_COMMENT_PAGE, type=int),
+    )
+    return jsonify(comments=comments, next_cursor=next_cursor, total=state['comment_count'])
 
-    data = request.get_json() or {}
-    if update_task(task_id, **data):
-        return jsonify(success=True)
-    return jsonify(error="Update failed"), 500
 
+@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>/comments", methods=["POST"])
+@login_required
+def add_comment_route(board_id, task_id):
+    state = get_task_state(task_id, board_id, session['user_id'])
+    if not state:
+        return jsonify(error="Task not found"), 404
+    if state['role'] not in ['owner', 'editor']:
+        return jsonify(error="Permission denied"), 403
+
+    text = ((request.get_json(silent=True) or {}).get('comment') or '').strip()
+    if not text:
+        return jsonify(error="Comment is required"), 400
+    if len(text) > MAX_COMMENT_LENGTH:
+        return jsonify(error=f"Comment is longer than {MAX_COMMENT_LENGTH} characters"), 400
 
-@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>/move", methods=["POST"])
+    comment = add_comment(task_id, session['user_id'], text)
+    if not comment:
+        return jsonify(error="Task not found"), 404
+    comment['username'] = session.get('username')
+    return jsonify(comment), 201
+
+
+# Task writes: the role check is part of the UPDATE / DELETE itself (see
+# _TASK_GUARD in models/boards_model.py), so a move is a single statement
+# and nothing can change between the check and the write.
+@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>", methods=["PUT"])
 @login_required
-def move_task_route(board_id, task_id):
-    board = get_board(board_id)
-    if not board:
+def update_task_route(board_id, task_id):
+    data = request.get_json() or {}
+    fields = {k: v for k, v in data.items() if k in EDITABLE_TASK_FIELDS}
+    try:
+        version = update_task(task_id, expected_version=expected_version(),
+                              user_id=session['user_id'], board_id=board_id, **fields)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    except PermissionDenied:
+        return jsonify(error="No permission"), 403
+    except ConflictError as e:
+        return conflict("Task was changed by someone else", e.current)
+    if version is None:
         return jsonify(error="Not found"), 404
+    return versioned(jsonify(success=True, version=version), version)
 
-    members = get_project_members(board['project_id'])
-    user_role = next((m['role'] for m in members if m['user_id'] == session['user_id']), None)
-    if not user_role:
-        return jsonify(error="Access denied"), 403
 
+@boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>/move", methods=["POST"])
+@login_required
+def move_task_route(board_id, task_id):
     data = request.get_json() or {}
     new_status = data.get("status")
-    if new_status not in ['To Do', 'In Progress', 'Review', 'Done']:
+    if new_status not in TASK_STATUSES:
         return jsonify(error="Invalid status"), 400
 
-    if update_task_status(task_id, new_status):
-        return jsonify(success=True)
-    return jsonify(error="Move failed"), 500
+    try:
+        version = update_task_status(task_id, new_status, expected_version=expected_version(),
+                                     user_id=session['user_id'], board_id=board_id, roles=MEMBER_ROLES)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    except PermissionDenied:
+        return jsonify(error="Access denied"), 403
+    except ConflictError as e:
+        return conflict("Task was changed by someone else", e.current)
+    if version is None:
+        return jsonify(error="Not found"), 404
+    return versioned(jsonify(success=True, version=version), version)
 
 
 @boards_bp.route("/boards/<int:board_id>/tasks/<int:task_id>", methods=["DELETE"])
 @login_required
 def delete_task_route(board_id, task_id):
-    board = get_board(board_id)
-    if not board:
-        return jsonify(error="Not found"), 404
-
-    members = get_project_members(board['project_id'])
-    user_role = next((m['role'] for m in members if m['user_id'] == session['user_id']), None)
-    if user_role not in ['owner', 'editor']:
+    try:
+        deleted = delete_task(task_id, user_id=session['user_id'], board_id=board_id)
+    except PermissionDenied:
         return jsonify(error="Permission denied"), 403
-
-    if delete_task(task_id):
+    if deleted:
         return jsonify(success=True)
-    return jsonify(error="Delete failed"), 500
+    return jsonify(error="Not found"), 404
@@ -0,0 +1,48 @@
+# routes/calendar_routes.py
+from datetime import date, datetime
+
+from flask import Blueprint, jsonify, request, session
+from routes.board_routes import login_required, project_access_required
+from models.calendar_model import get_calendar, month_window, week_window
+
+calendar_bp = Blueprint("calendar", __name__)
+
+MAX_TASKS_PER_DAY = 20
+
+
+def _window():
+    """?month=2025-03 (default: this month) or ?week=2025-03-14 (any day of it)."""
+    if request.args.get("week"):
+        return week_window(datetime.strptime(request.args["week"], "%Y-%m-%d").date())
+    if request.args.get("month"):
+        month = datetime.strptime(request.args["month"], "%Y-%m")
+        return month_window(month.year, month.month)
+    today = date.today()
+    return month_window(today.year, today.month)
+
+
+def _calendar(scope, scope_id):
+    try:
+        start, end = _window()
+    except (ValueError, OverflowError):  # OverflowError: a week past 9999-12-31
+        return jsonify(error="Use ?month=YYYY-MM or ?week=YYYY-MM-DD"), 400
+    per_day = request.args.get("per_day", type=int)
+    if per_day is not None:
+        per_day = max(0, min(per_day, MAX_TASKS_PER_DAY))
+    return jsonify(get_calendar(scope, scope_id, start, end, per_day=per_day))
+
+
+# ========================================
+# CALENDARS
+# ========================================
+@calendar_bp.route("/projects/<int:project_id>")
+@login_required
+@project_access_required(roles=['owner', 'editor', 'viewer'])
+def project_calendar(project_id, **kwargs):
+    return _calendar("project", project_id)
+
+
+@calendar_bp.route("/me")
+@login_required
+def my_calendar():
+    return _calendar("user", session["user_id"])
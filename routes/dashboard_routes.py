@@ -1,7 +1,6 @@
 # routes/dashboard_routes.py
 from flask import Blueprint, render_template, session, redirect, url_for, flash
-from models.project_model import get_project_members
-from models.boards_model import get_boards_by_project, get_tasks_by_board
+from models.project_model import get_user_projects, get_user_task_counts
 
 dashboard_bp = Blueprint('dashboard', __name__, template_folder='../templates')
 
@@ -12,15 +11,13 @@ def dashboard():
         return redirect(url_for('auth.login'))
 
     user_id = session['user_id']
-    projects = get_project_members(user_id)
+    # Cross-project: one query each per shard, merged (see sharding.scatter)
+    projects = get_user_projects(user_id)
 
     # Task stats
     stats = {'To Do': 0, 'In Progress': 0, 'Review': 0, 'Done': 0}
-    for project in projects:
-        boards = get_boards_by_project(project['id'])
-        for board in boards:
-            tasks = get_tasks_by_board(board['id'])
-            for status, task_list in tasks.items():
-                stats[status] += len(task_list)
+    for status, count in get_user_task_counts(user_id).items():
+        if status in stats:
+            stats[status] += count
 
     return render_template('dashboard/dashboard.html', projects=projects, stats=stats)
\ No newline at end of file
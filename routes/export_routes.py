@@ -0,0 +1,38 @@
+# routes/export_routes.py
+from flask import Blueprint, Response, stream_with_context
+from routes.board_routes import login_required, project_access_required
+from models.export_model import iter_project_tasks, iter_csv, iter_ndjson
+from sharding import on_request_shard
+
+exports_bp = Blueprint("exports", __name__)
+
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv; charset=utf-8"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
+
+
+# ========================================
+# EXPORT PROJECT TASKS (streamed)
+# ========================================
+@exports_bp.route("/projects/<int:project_id>/tasks.<fmt>")
+@login_required
+@project_access_required(roles=['owner', 'editor', 'viewer'])
+def export_project_tasks(project_id, fmt, **kwargs):
+    if fmt not in EXPORT_FORMATS:
+        return {"error": "Unsupported format"}, 400
+
+    encoder, mimetype = EXPORT_FORMATS[fmt]
+    filename = f"project-{project_id}-tasks.{fmt}"
+
+    # The body is read after the view returns: keep the request (session,
+    # replica choice) and its shard for it
+    return Response(
+        stream_with_context(on_request_shard(encoder(iter_project_tasks(project_id)))),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",  # don't let nginx buffer the stream
+        },
+    )
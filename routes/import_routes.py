@@ -0,0 +1,65 @@
+# routes/import_routes.py
+import io
+import json
+from flask import Blueprint, request, session, jsonify
+from routes.board_routes import login_required
+from models.boards_model import get_board
+from models.project_model import get_project_members
+from models.import_model import iter_csv_records, iter_json_records, import_tasks
+
+imports_bp = Blueprint("imports", __name__)
+
+IMPORT_READERS = {
+    "csv": iter_csv_records,
+    "json": iter_json_records,
+}
+
+
+# ========================================
+# IMPORT TASKS INTO A BOARD
+# ========================================
+# multipart/form-data:
+#   file     -> the CSV / JSON (array or NDJSON) file
+#   format   -> csv | json (default: from file extension)
+#   mapping  -> optional JSON object {"Source Column": "title", ...}
+@imports_bp.route("/boards/<int:board_id>/tasks", methods=["POST"])
+@login_required
+def import_board_tasks(board_id):
+    board = get_board(board_id)
+    if not board:
+        return jsonify(error="Board not found"), 404
+
+    members = get_project_members(board['project_id'])
+    user_role = next((m['role'] for m in members if m['user_id'] == session['user_id']), None)
+    if user_role not in ['owner', 'editor']:
+        return jsonify(error="Permission denied"), 403
+
+    upload = request.files.get('file')
+    if not upload:
+        return jsonify(error="No file uploaded"), 400
+
+    fmt = request.form.get('format') or upload.filename.rsplit('.', 1)[-1].lower()
+    if fmt == 'ndjson':
+        fmt = 'json'
+    if fmt not in IMPORT_READERS:
+        return jsonify(error="Unsupported format (use csv or json)"), 400
+
+    mapping = None
+    if request.form.get('mapping'):
+        try:
+            mapping = json.loads(request.form['mapping'])
+        except ValueError:
+            return jsonify(error="Invalid mapping JSON"), 400
+        if not isinstance(mapping, dict) or not all(
+                isinstance(column, str) and isinstance(field, str) for column, field in mapping.items()):
+            return jsonify(error="Mapping must be a JSON object of column name -> task field"), 400
+
+    # Werkzeug spools large uploads to a temp file; read it as a text stream
+    stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+    try:
+        report = import_tasks(board_id, IMPORT_READERS[fmt](stream, mapping), created_by=session['user_id'])
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    report['errors'] = [{'line': line, 'error': message} for line, message in report['errors']]
+    return jsonify(report), 200
@@ -0,0 +1,41 @@
+# routes/jobs_routes.py
+from flask import Blueprint, jsonify, request, session
+from routes.board_routes import login_required
+from models.jobs_model import get_job, list_jobs
+
+jobs_bp = Blueprint("jobs", __name__)
+
+
+def _no_store(response):
+    # Status changes while the client polls: never serve it from a cache
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+# ========================================
+# JOB STATUS (target of 202 Location headers)
+# ========================================
+@jobs_bp.route("/<int:job_id>")
+@login_required
+def get_job_route(job_id):
+    """
+    GET /jobs/<id> -> {job: {status, progress, attempts, result, last_error, ...}}
+    status: queued | running | done | failed. Visible to whoever started it
+    (and admins); 404 for everyone else.
+    """
+    job = get_job(job_id)
+    if job is None or (job.created_by != session["user_id"] and not session.get("is_admin")):
+        return jsonify(error="Job not found"), 404
+    return _no_store(jsonify(job=job))
+
+
+@jobs_bp.route("")
+@login_required
+def list_jobs_route():
+    """GET /jobs?kind=purge&limit=20 -> your recent jobs, unfinished first."""
+    jobs = list_jobs(
+        created_by=session["user_id"],
+        kind=request.args.get("kind") or None,
+        limit=max(1, min(request.args.get("limit", 20, type=int), 100)),
+    )
+    return _no_store(jsonify(jobs=jobs))
@@ -0,0 +1,30 @@
+# routes/me_routes.py
+from flask import Blueprint, jsonify, request, session
+from routes.board_routes import login_required
+from models.my_tasks_model import get_my_tasks, DEFAULT_PAGE_SIZE
+
+me_bp = Blueprint("me", __name__)
+
+
+# ========================================
+# MY TASKS (across all projects)
+# ========================================
+@me_bp.route("/tasks")
+@login_required
+def my_tasks():
+    """
+    GET /me/tasks?sort=due|priority|updated&status=To Do,Review&limit=50&cursor=...
+    Follow `next_cursor` for the next page; it is null on the last one.
+    """
+    statuses = [s.strip() for s in request.args.get("status", "").split(",") if s.strip()]
+    try:
+        tasks, next_cursor = get_my_tasks(
+            session["user_id"],
+            sort=request.args.get("sort", "due"),
+            statuses=statuses or None,
+            cursor=request.args.get("cursor") or None,
+            limit=request.args.get("limit", DEFAULT_PAGE_SIZE, type=int),
+        )
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    return jsonify(tasks=tasks, next_cursor=next_cursor)
@@ -0,0 +1,337 @@
+# ==============================================================
+# FILE: schema.py
+# PURPOSE: The GitBoard schema, shared by the MySQL and SQLite backends
+# ==============================================================
+# TABLES holds the MySQL DDL, which stays the single source of truth:
+# migrations/create_tables.py runs it as is, and sqlite_statements()
+# translates it for the embedded SQLite backend (sqlite_backend.py):
+#   INT AUTO_INCREMENT PRIMARY KEY -> INTEGER PRIMARY KEY AUTOINCREMENT
+#   VARCHAR(n)                     -> TEXT COLLATE NOCASE (like utf8mb4_unicode_ci)
+#   ENUM('a', 'b')                 -> TEXT + CHECK, collated in declaration order
+#   DEFAULT CURRENT_TIMESTAMP      -> local time, like MySQL's NOW()
+#   ON UPDATE CURRENT_TIMESTAMP    -> AFTER UPDATE trigger
+#   INDEX / UNIQUE KEY             -> CREATE [UNIQUE] INDEX <table>_<name>
+#   FULLTEXT INDEX                 -> dropped (MATCH ... AGAINST runs as a function)
+# Schema changes on MySQL go through migrate.py; add them here as well.
+
+import re
+
+TABLES = [
+    # Users
+    ("users", """
+    CREATE TABLE users (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        username VARCHAR(100) NOT NULL UNIQUE,
+        email VARCHAR(150) NOT NULL UNIQUE,
+        password_hash VARCHAR(255) NOT NULL,
+        role ENUM('admin', 'manager', 'member') DEFAULT 'member',
+        avatar_url VARCHAR(500),
+        is_active BOOLEAN DEFAULT TRUE,
+        is_deleted BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        INDEX idx_username (username),
+        INDEX idx_email (email)
+    ) ENGINE=InnoDB
+    """),
+
+    # Projects
+    ("projects", """
+    CREATE TABLE projects (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(150) NOT NULL,
+        description TEXT,
+        owner_id INT NOT NULL,
+        status ENUM('active', 'archived', 'completed') DEFAULT 'active',
+        start_date DATE,
+        end_date DATE,
+        color VARCHAR(7) DEFAULT '#3B82F6',
+        is_deleted BOOLEAN DEFAULT FALSE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE RESTRICT,
+        INDEX idx_owner (owner_id),
+        INDEX idx_status (status)
+    ) ENGINE=InnoDB
+    """),
+
+    # Project Members
+    ("project_members", """
+    CREATE TABLE project_members (
+        project_id INT NOT NULL,
+        user_id INT NOT NULL,
+        role ENUM('owner', 'editor', 'viewer') DEFAULT 'viewer',
+        joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (project_id, user_id),
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        INDEX idx_user (user_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Boards
+    ("boards", """
+    CREATE TABLE boards (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        project_id INT NOT NULL,
+        name VARCHAR(150) NOT NULL,
+        description TEXT,
+        icon VARCHAR(50) DEFAULT 'clipboard-check',
+        is_archived BOOLEAN DEFAULT FALSE,
+        task_version INT NOT NULL DEFAULT 0,
+        version INT NOT NULL DEFAULT 1,
+        is_deleted BOOLEAN DEFAULT FALSE,
+        deleted_at TIMESTAMP NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+        INDEX idx_project (project_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Labels
+    ("labels", """
+    CREATE TABLE labels (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(50) NOT NULL,
+        color VARCHAR(7) DEFAULT '#10B981',
+        project_id INT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+        UNIQUE KEY uniq_label_project (name, project_id),
+        INDEX idx_project (project_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Tasks
+    ("tasks", """
+    CREATE TABLE tasks (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        board_id INT NOT NULL,
+        title VARCHAR(255) NOT NULL,
+        description TEXT,
+        assigned_to INT,
+        priority ENUM('Low', 'Medium', 'High', 'Critical') DEFAULT 'Medium',
+        status ENUM('To Do', 'In Progress', 'Review', 'Done') DEFAULT 'To Do',
+        due_date DATE,
+        completed_at TIMESTAMP NULL,
+        order_index INT DEFAULT 0,
+        is_deleted BOOLEAN DEFAULT FALSE,
+        comment_count INT NOT NULL DEFAULT 0,
+        version INT NOT NULL DEFAULT 1,
+        created_by INT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        FOREIGN KEY (board_id) REFERENCES boards(id) ON DELETE CASCADE,
+        FOREIGN KEY (assigned_to) REFERENCES users(id) ON DELETE SET NULL,
+        FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE RESTRICT,
+        INDEX idx_board_status (board_id, status),
+        INDEX idx_board_assignee (board_id, assigned_to),
+        INDEX idx_board_priority (board_id, priority),
+        INDEX idx_board_due (board_id, due_date),
+        INDEX idx_assignee_status_due (assigned_to, status, due_date),
+        INDEX idx_assignee_priority (assigned_to, priority),
+        INDEX idx_assignee_updated (assigned_to, updated_at),
+        INDEX idx_due_date (due_date),
+        INDEX idx_priority (priority),
+        FULLTEXT INDEX ft_title_description (title, description)
+    ) ENGINE=InnoDB
+    """),
+
+    # Task Labels
+    ("task_labels", """
+    CREATE TABLE task_labels (
+        task_id INT NOT NULL,
+        label_id INT NOT NULL,
+        PRIMARY KEY (task_id, label_id),
+        FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        FOREIGN KEY (label_id) REFERENCES labels(id) ON DELETE CASCADE,
+        INDEX idx_label (label_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Task Comments
+    ("task_comments", """
+    CREATE TABLE task_comments (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        task_id INT NOT NULL,
+        user_id INT NOT NULL,
+        comment TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        INDEX idx_task_id (task_id, id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Task History
+    ("task_history", """
+    CREATE TABLE task_history (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        task_id INT NOT NULL,
+        user_id INT,
+        field_changed VARCHAR(50) NOT NULL,
+        old_value TEXT,
+        new_value TEXT,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL,
+        INDEX idx_task (task_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Audit Logs
+    ("audit_logs", """
+    CREATE TABLE audit_logs (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        user_id INT,
+        action VARCHAR(100) NOT NULL,
+        entity_id INT,
+        details TEXT,
+        ip_address VARCHAR(45),
+        user_agent VARCHAR(255),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL,
+        INDEX idx_action (action)
+    ) ENGINE=InnoDB
+    """),
+
+    # Shard directory (sharding.py), read on shard 0 only: where a project
+    # lives (no row = shard 0) and which project a board belongs to
+    ("project_shards", """
+    CREATE TABLE project_shards (
+        project_id INT PRIMARY KEY,
+        shard_id INT NOT NULL,
+        status ENUM('active', 'moving') NOT NULL DEFAULT 'active',
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_shard (shard_id)
+    ) ENGINE=InnoDB
+    """),
+
+    ("board_projects", """
+    CREATE TABLE board_projects (
+        board_id INT PRIMARY KEY,
+        project_id INT NOT NULL,
+        INDEX idx_project (project_id)
+    ) ENGINE=InnoDB
+    """),
+
+    # Background jobs (models/jobs_model.py): leased by workers, retried with backoff
+    ("jobs", """
+    CREATE TABLE jobs (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        kind VARCHAR(50) NOT NULL,
+        payload TEXT,
+        dedupe_key VARCHAR(150),
+        priority INT NOT NULL DEFAULT 0,
+        status ENUM('queued', 'running', 'done', 'failed') NOT NULL DEFAULT 'queued',
+        attempts INT NOT NULL DEFAULT 0,
+        max_attempts INT NOT NULL DEFAULT 5,
+        run_after TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        leased_by VARCHAR(150),
+        heartbeat_at TIMESTAMP NULL,
+        progress INT NOT NULL DEFAULT 0,
+        result TEXT,
+        last_error TEXT,
+        created_by INT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP NULL,
+        finished_at TIMESTAMP NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        UNIQUE KEY uniq_dedupe (dedupe_key),
+        INDEX idx_claim (status, priority),
+        INDEX idx_created_by (created_by, id)
+    ) ENGINE=InnoDB
+    """),
+]
+
+# Children first, so foreign keys never block a drop
+DROP_ORDER = [
+    'project_members', 'jobs', 'purge_queue',  # purge_queue: replaced by jobs
+    'project_shards', 'board_projects',
+    'task_labels', 'labels',
+    'task_history', 'audit_logs',
+    'task_comments', 'tasks',
+    'boards', 'projects', 'users',
+]
+
+_ENUM = re.compile(r"^(\w+)\s+ENUM\((.*?)\)", re.I)
+
+
+def _split_definitions(body):
+    """Top-level comma split of a CREATE TABLE body."""
+    parts, depth, current = [], 0, ""
+    for char in body:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _parse(ddl):
+    match = re.search(r"CREATE TABLE (\w+)\s*\((.*)\)[^)]*$", ddl.strip(), re.S)
+    return match.group(1), _split_definitions(match.group(2))
+
+
+def enum_orders():
+    """{collation name: [values in declaration order]} for every ENUM column."""
+    orders = {}
+    for table, ddl in TABLES:
+        for definition in _parse(ddl)[1]:
+            match = _ENUM.match(definition)
+            if match:
+                values = [v.strip().strip("'") for v in match.group(2).split(",")]
+                orders[f"enum_{table}_{match.group(1)}"] = values
+    return orders
+
+
+def sqlite_statements():
+    """CREATE TABLE / INDEX / TRIGGER statements for SQLite (all IF NOT EXISTS)."""
+    statements = []
+    for table, ddl in TABLES:
+        _, definitions = _parse(ddl)
+        columns, extra = [], []
+        for definition in definitions:
+            upper = definition.upper()
+            index = re.match(r"(UNIQUE\s+KEY|UNIQUE\s+INDEX|INDEX|KEY)\s+(\w+)\s*\((.*)\)$", definition, re.I)
+            if upper.startswith("FULLTEXT"):
+                continue
+            if index:
+                unique = "UNIQUE " if upper.startswith("UNIQUE") else ""
+                extra.append(f"CREATE {unique}INDEX IF NOT EXISTS {table}_{index.group(2)} "
+                             f"ON {table} ({index.group(3)})")
+                continue
+            if upper.startswith(("PRIMARY KEY", "FOREIGN KEY")):
+                columns.append(definition)
+                continue
+
+            name = definition.split()[0]
+            column = definition
+            if "ON UPDATE CURRENT_TIMESTAMP" in upper:
+                column = re.sub(r"\s+ON UPDATE CURRENT_TIMESTAMP", "", column, flags=re.I)
+                extra.append(
+                    f"CREATE TRIGGER IF NOT EXISTS {table}_{name}_on_update AFTER UPDATE ON {table} "
+                    f"FOR EACH ROW WHEN NEW.{name} IS OLD.{name} BEGIN "
+                    f"UPDATE {table} SET {name} = datetime('now', 'localtime') WHERE id = NEW.id; END"
+                )
+            column = re.sub(r"INT AUTO_INCREMENT PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT", column, flags=re.I)
+            column = re.sub(r"VARCHAR\(\d+\)", "TEXT COLLATE NOCASE", column, flags=re.I)
+            column = _ENUM.sub(
+                lambda m: f"{m.group(1)} TEXT COLLATE enum_{table}_{m.group(1)} CHECK ({m.group(1)} IN ({m.group(2)}))",
+                column
+            )
+            column = re.sub(r"DEFAULT CURRENT_TIMESTAMP", "DEFAULT (datetime('now', 'localtime'))", column, flags=re.I)
+            column = re.sub(r"(?<!NOT)\s+NULL\b", "", column, flags=re.I)
+            columns.append(column)
+
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table} (\n    " + ",\n    ".join(columns) + "\n)")
+        statements.extend(extra)
+    return statements
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 # Load config
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from config import Config
+from db import use_pure
 
 
 def seed_data():
@@ -30,7 +31,7 @@ def seed_data():
             database=Config.MYSQL_DB,
             port=Config.MYSQL_PORT,
             connection_timeout=10,
-            use_pure=True
+            use_pure=use_pure()
         )
         cursor = conn.cursor()
         print("Connected to MySQL!")
@@ -55,7 +56,7 @@ def seed_data():
                 INSERT INTO users (username, email, password_hash, role, avatar_url)
                 VALUES (%s, %s, %s, %s, %s)
                 ON DUPLICATE KEY UPDATE id=id
-            """, (username, email, hashed, role, f"https://ui-avatars.com/api/?name={username}&background=random"))
+            """, (username, email, hashed, role, f"/avatars/{username}.svg"))
             cursor.execute("SELECT id FROM users WHERE username=%s", (username,))
             user_ids[username] = cursor.fetchone()[0]
 
@@ -234,6 +235,7 @@ def seed_data():
                 INSERT INTO task_comments (task_id, user_id, comment)
                 VALUES (%s, %s, %s)
             """, (task_id, user_id, comment))
+            cursor.execute("UPDATE tasks SET comment_count = comment_count + 1 WHERE id = %s", (task_id,))
 
         # ==================================================
         # TASK HISTORY
@@ -0,0 +1,611 @@
+# ==============================================================
+# FILE: sharding.py
+# PURPOSE: Route projects to database shards; move projects between them
+# ==============================================================
+#   python sharding.py --status               -> shards, projects and id ranges
+#   python sharding.py --init                 -> id ranges + users on every shard
+#   python sharding.py --sync-users           -> copy users to every shard again
+#   python sharding.py --move 42 --to 2       -> move project 42 onto shard 2, online
+#
+# A shard holds whole projects: the projects row, members, labels, boards,
+# tasks and their label links, comments and history, so every query about
+# one project runs unchanged (joins included) on one database. users is a
+# reference table: written on shard 0 and copied to every shard, because
+# the foreign keys and username joins need it locally. Everything else that
+# is global (jobs, this directory) stays on shard 0.
+#
+# Routing: the directory on shard 0 maps project -> shard (no row = shard 0)
+# and board -> project; lookups are cached per process for
+# SHARD_DIRECTORY_TTL seconds. Requests are routed from their URL
+# (project_id / board_id) before the view runs, so the models' get_db()
+# lands on the right database without knowing about shards. Code outside a
+# request wraps its calls in `with on_project(id):` / `with on_board(id):`.
+# Reads that span projects (dashboard, My Tasks, the personal calendar) run
+# on every shard in parallel and merge the results: scatter(), keeping
+# each project's rows from the shard the directory names only: owned().
+# With Config.SHARDS empty none of this is installed: no lookups, no threads.
+#
+# Ids: shard n hands out ids from n * SHARD_ID_STRIDE (set by --init), so
+# board / task ids stay unique across shards and rows keep their ids when
+# a project moves.
+#
+# Moving a project (move_project): copy its rows while it stays writable
+# (the copy is hidden, is_deleted, from cross-shard reads), mark it
+# 'moving' (writes get 503 + Retry-After, reads go on), wait until every
+# process has seen that, copy what changed meanwhile, switch the directory,
+# then delete the old copy in batches.
+
+import argparse
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from flask import g, jsonify, request
+
+from config import Config
+from db import HOME_SHARD, current_shard, get_db, use_shard
+from schema import TABLES
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Tables with AUTO_INCREMENT ids that shards hand out in their own range
+ID_TABLES = ['projects', 'boards', 'labels', 'tasks', 'task_comments', 'task_history']
+TASK_CHILD_TABLES = ['task_labels', 'task_comments', 'task_history']
+
+
+class ProjectMoving(Exception):
+    """The project is being moved to another shard; writes have to wait."""
+
+
+def is_sharded() -> bool:
+    return bool(Config.SHARDS)
+
+
+def shard_ids() -> List[int]:
+    return [HOME_SHARD, *sorted(shard for shard in Config.SHARDS if shard != HOME_SHARD)]
+
+
+# ===============================
+# Directory
+# ===============================
+_LOCATE = {
+    'project': "SELECT shard_id, status FROM project_shards WHERE project_id = %s",
+    'board': """
+        SELECT ps.shard_id, ps.status FROM board_projects bp
+        LEFT JOIN project_shards ps ON ps.project_id = bp.project_id
+        WHERE bp.board_id = %s
+    """,
+}
+_directory: Dict[Tuple[str, int], Tuple[float, int, bool]] = {}  # (kind, id) -> (expires, shard, moving)
+MAX_DIRECTORY_ENTRIES = 100_000
+
+
+def _locate(kind: str, entity_id: int, fresh: bool = False) -> Tuple[int, bool]:
+    if not Config.SHARDS:
+        return HOME_SHARD, False
+    key = (kind, entity_id)
+    now = time.monotonic()
+    cached = _directory.get(key)
+    if cached is not None and cached[0] > now and not fresh:
+        return cached[1], cached[2]
+
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute(_LOCATE[kind], (entity_id,))
+            found = cur.fetchone()
+    shard, status = found if found and found[0] is not None else (HOME_SHARD, 'active')
+    _remember(key, shard, status, now)
+    return shard, status == 'moving'
+
+
+def _remember(key: Tuple[str, int], shard: int, status: str, now: float) -> None:
+    if len(_directory) >= MAX_DIRECTORY_ENTRIES:
+        _directory.clear()
+    _directory[key] = (now + Config.SHARD_DIRECTORY_TTL, shard, status == 'moving')
+
+
+def locate_project(project_id: int, fresh: bool = False) -> Tuple[int, bool]:
+    """(shard, moving) for a project; shard 0 for unknown ones."""
+    return _locate('project', project_id, fresh)
+
+
+def locate_board(board_id: int, fresh: bool = False) -> Tuple[int, bool]:
+    """(shard, moving) of the board's project."""
+    return _locate('board', board_id, fresh)
+
+
+def project_owners(project_ids: Iterable[int]) -> Dict[int, int]:
+    """{project id: shard} like locate_project, with one query for all the uncached ones."""
+    ids = set(project_ids)
+    if not Config.SHARDS:
+        return dict.fromkeys(ids, HOME_SHARD)
+    now = time.monotonic()
+    owners, missing = {}, []
+    for project_id in ids:
+        cached = _directory.get(('project', project_id))
+        if cached is not None and cached[0] > now:
+            owners[project_id] = cached[1]
+        else:
+            missing.append(project_id)
+    for i in range(0, len(missing), 1000):
+        chunk = missing[i:i + 1000]
+        with get_db(HOME_SHARD) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT project_id, shard_id, status FROM project_shards "
+                    f"WHERE project_id IN ({', '.join(['%s'] * len(chunk))})",
+                    chunk
+                )
+                found = {project_id: (shard, status) for project_id, shard, status in cur.fetchall()}
+        for project_id in chunk:
+            shard, status = found.get(project_id, (HOME_SHARD, 'active'))
+            _remember(('project', project_id), shard, status, now)
+            owners[project_id] = shard
+    return owners
+
+
+@contextmanager
+def _on(shard: int, moving: bool, write: bool, what: str):
+    if write and moving:
+        raise ProjectMoving(what)
+    with use_shard(shard):
+        yield shard
+
+
+def on_project(project_id: int, write: bool = False):
+    """Runs the block on the project's shard; write=True raises ProjectMoving during a move."""
+    return _on(*locate_project(project_id), write, f"project {project_id}")
+
+
+def on_board(board_id: int, write: bool = False):
+    return _on(*locate_board(board_id), write, f"board {board_id}")
+
+
+def register_board(board_id: int, project_id: int) -> None:
+    """Adds a new board to the directory (a no-op without shards)."""
+    if not Config.SHARDS:
+        return
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute("INSERT IGNORE INTO board_projects (board_id, project_id) VALUES (%s, %s)",
+                        (board_id, project_id))
+            conn.commit()
+    _directory.pop(('board', board_id), None)
+
+
+def forget_board(board_id: int) -> None:
+    """Drops a purged board from the directory."""
+    if not Config.SHARDS:
+        return
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM board_projects WHERE board_id = %s", (board_id,))
+            conn.commit()
+
+
+def forget_project(project_id: int) -> None:
+    """Drops a purged project and its boards from the directory."""
+    if not Config.SHARDS:
+        return
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM board_projects WHERE project_id = %s", (project_id,))
+            cur.execute("DELETE FROM project_shards WHERE project_id = %s", (project_id,))
+            conn.commit()
+
+
+# ===============================
+# Request routing
+# ===============================
+def init_sharding(app):
+    if not Config.SHARDS:
+        return
+
+    @app.before_request
+    def route_to_shard():
+        args = request.view_args or {}
+        if 'project_id' in args:
+            shard, moving = locate_project(args['project_id'])
+        elif 'board_id' in args:
+            shard, moving = locate_board(args['board_id'])
+        else:
+            return None
+        if moving and request.method not in SAFE_METHODS:
+            response = jsonify(error="This project is being moved; try again in a few seconds")
+            response.status_code = 503
+            response.headers["Retry-After"] = str(max(1, round(Config.SHARD_DIRECTORY_TTL)))
+            return response
+        g._shard_scope = ExitStack()
+        g._shard_scope.enter_context(use_shard(shard))
+        return None
+
+    @app.teardown_request
+    def leave_shard(exc):
+        scope = g.pop('_shard_scope', None)
+        if scope is not None:
+            scope.close()
+
+
+def on_request_shard(body: Iterable[Any]) -> Iterator[Any]:
+    """
+    A streamed response body that reads from the request's shard. The body
+    is iterated after the view returns, when the shard set by
+    route_to_shard may already be undone (teardown), so the shard is taken
+    now and entered again around the iteration. Use together with
+    flask.stream_with_context.
+    """
+    shard = current_shard()
+
+    def run():
+        with use_shard(shard):
+            yield from body
+    return run()
+
+
+# ===============================
+# Scatter-gather
+# ===============================
+_executor = None
+_executor_pid = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Threads don't survive fork(): one pool per process
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(max_workers=min(32, 4 * len(shard_ids())),
+                                       thread_name_prefix="shard-scatter")
+        _executor_pid = os.getpid()
+    return _executor
+
+
+def scatter(fn: Callable[[], Any], shards: Optional[Sequence[int]] = None) -> List[Any]:
+    """
+    Calls fn() once per shard (all of them by default), each with that
+    shard's connections, in parallel; returns the results in shard order.
+    With a single shard it is a plain call on this thread. Each call runs
+    in a copy of the caller's context, so inside a request it sees the
+    request, its session and g: replica choice and read-your-writes (see
+    db.get_read_db) are the same as on the request's own thread.
+    """
+    shards = shard_ids() if shards is None else list(shards)
+    if len(shards) == 1:
+        with use_shard(shards[0]):
+            return [fn()]
+
+    def run(shard):
+        with use_shard(shard):
+            return fn()
+    # one copy per call: a Context can't be entered by two threads at once
+    contexts = [contextvars.copy_context() for _ in shards]
+    return list(_get_executor().map(lambda context, shard: context.run(run, shard), contexts, shards))
+
+
+def owned(parts: List[List[Any]], project_of: Callable[[Any], int],
+          shards: Optional[Sequence[int]] = None) -> List[List[Any]]:
+    """
+    scatter() results (rows per shard) without the rows of projects their
+    shard doesn't own. A move leaves both copies live for a while (routed
+    reads may still reach the old one until every directory cache has
+    expired), so a scatter read would see such a project twice.
+    project_of(row) -> the row's project id.
+    """
+    shards = shard_ids() if shards is None else list(shards)
+    if len(shards) == 1:
+        return parts
+    owners = project_owners(project_of(r) for part in parts for r in part)
+    return [[r for r in part if owners[project_of(r)] == shard] for shard, part in zip(shards, parts)]
+
+
+# ===============================
+# Shard setup / reference data
+# ===============================
+def _upsert(cur, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    if not rows:
+        return
+    names = ", ".join(columns)
+    updates = ", ".join(f"{column} = VALUES({column})" for column in columns)
+    cur.executemany(
+        f"INSERT INTO {table} ({names}) VALUES ({', '.join(['%s'] * len(columns))}) "
+        f"ON DUPLICATE KEY UPDATE {updates}",
+        [tuple(row) for row in rows]
+    )
+
+
+def sync_users(shard: int, user_ids: Optional[Sequence[int]] = None, batch_size: int = 1000) -> int:
+    """Copies users (all, or `user_ids`) from shard 0 to `shard`. Returns rows copied."""
+    if shard == HOME_SHARD:
+        return 0
+    copied = 0
+    with get_db(HOME_SHARD) as home, get_db(shard) as conn:
+        with home.cursor() as src, conn.cursor() as dst:
+            if user_ids is not None:
+                for i in range(0, len(user_ids), batch_size):
+                    copied += _copy(src, dst, "users", f"id IN ({', '.join(['%s'] * len(user_ids[i:i + batch_size]))})",
+                                    user_ids[i:i + batch_size])
+                    conn.commit()
+                return copied
+            last_id = 0
+            while True:
+                src.execute("SELECT * FROM users WHERE id > %s ORDER BY id LIMIT %s", (last_id, batch_size))
+                rows = src.fetchall()
+                if not rows:
+                    return copied
+                _upsert(dst, "users", src.column_names, rows)
+                conn.commit()
+                copied += len(rows)
+                last_id = rows[-1][0]
+
+
+def copy_user(user_id: int) -> None:
+    """A user just created on shard 0, copied to the other shards (best effort: --sync-users repairs)."""
+    for shard in shard_ids()[1:]:
+        try:
+            sync_users(shard, [user_id])
+        except Exception as e:
+            print(f"Copying user {user_id} to shard {shard} failed: {e}")
+
+
+def init_shard(shard: int) -> None:
+    """Schema, id range and users for one shard (its MySQL database must exist)."""
+    start = shard * Config.SHARD_ID_STRIDE
+    with get_db(shard) as conn:
+        with conn.cursor() as cur:
+            if Config.DB_BACKEND == "sqlite":  # schema is created on connect
+                for table in ID_TABLES:
+                    cur.execute(
+                        "INSERT INTO sqlite_sequence (name, seq) SELECT %s, 0 "
+                        "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = %s)",
+                        (table, table)
+                    )
+                    cur.execute("UPDATE sqlite_sequence SET seq = MAX(seq, %s) WHERE name = %s", (start, table))
+            else:
+                for _, ddl in TABLES:
+                    cur.execute(ddl.replace("CREATE TABLE", "CREATE TABLE IF NOT EXISTS", 1))
+                if shard != HOME_SHARD:
+                    for table in ID_TABLES:
+                        # MySQL keeps max(id) + 1 if that is higher
+                        cur.execute(f"ALTER TABLE {table} AUTO_INCREMENT = {start + 1}")
+            conn.commit()
+    sync_users(shard)
+
+
+# ===============================
+# Moving a project
+# ===============================
+_PROJECT_TASKS = "SELECT t.id FROM tasks t JOIN boards b ON b.id = t.board_id WHERE b.project_id = %s"
+
+
+def _copy(src, dst, table: str, where: str, params: Sequence[Any]) -> int:
+    src.execute(f"SELECT * FROM {table} WHERE {where}", params)
+    rows = src.fetchall()
+    _upsert(dst, table, src.column_names, rows)
+    return len(rows)
+
+
+def _copy_project(src, dst, project_id: int) -> None:
+    """The small per-project tables; the copy stays hidden (is_deleted) until cutover."""
+    _copy(src, dst, "projects", "id = %s", (project_id,))
+    dst.execute("UPDATE projects SET is_deleted = TRUE WHERE id = %s", (project_id,))
+    dst.execute("DELETE FROM project_members WHERE project_id = %s", (project_id,))
+    _copy(src, dst, "project_members", "project_id = %s", (project_id,))
+    _copy(src, dst, "labels", "project_id = %s", (project_id,))
+    _copy(src, dst, "boards", "project_id = %s", (project_id,))
+
+
+def _copy_tasks(conn, src, dst, project_id: int, since=None, batch_size: int = 500,
+                pause: float = 0.0) -> int:
+    """Tasks (all, or changed since `since`) with their children, one transaction per batch."""
+    copied, last_id = 0, 0
+    changed = " AND t.updated_at >= %s" if since is not None else ""
+    while True:
+        src.execute(
+            f"SELECT t.* FROM tasks t JOIN boards b ON b.id = t.board_id "
+            f"WHERE b.project_id = %s AND t.id > %s{changed} ORDER BY t.id LIMIT %s",
+            (project_id, last_id, *((since,) if since is not None else ()), batch_size)
+        )
+        rows = src.fetchall()
+        if not rows:
+            return copied
+        _upsert(dst, "tasks", src.column_names, rows)
+        task_ids = [row[0] for row in rows]
+        placeholders = ", ".join(["%s"] * len(task_ids))
+        dst.execute(f"DELETE FROM task_labels WHERE task_id IN ({placeholders})", task_ids)
+        for table in TASK_CHILD_TABLES:
+            _copy(src, dst, table, f"task_id IN ({placeholders})", task_ids)
+        conn.commit()
+        copied += len(rows)
+        last_id = task_ids[-1]
+        time.sleep(pause)
+
+
+def _catch_up(conn, src, dst, project_id: int, since) -> None:
+    """With writes stopped: everything that changed on the source since `since`."""
+    _copy_project(src, dst, project_id)
+    src.execute("SELECT id FROM labels WHERE project_id = %s", (project_id,))
+    labels = [label_id for (label_id,) in src.fetchall()]
+    dst.execute(
+        f"DELETE FROM labels WHERE project_id = %s"
+        f"{' AND id NOT IN (' + ', '.join(['%s'] * len(labels)) + ')' if labels else ''}",
+        (project_id, *labels)
+    )
+    _copy_tasks(conn, src, dst, project_id, since, batch_size=5000)
+
+    # Deleted tasks; label links and comments that don't touch the task row
+    src.execute(_PROJECT_TASKS, (project_id,))
+    live = {task_id for (task_id,) in src.fetchall()}
+    dst.execute(_PROJECT_TASKS, (project_id,))
+    gone = [task_id for (task_id,) in dst.fetchall() if task_id not in live]
+    for i in range(0, len(gone), 1000):
+        chunk = gone[i:i + 1000]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        for table in TASK_CHILD_TABLES:
+            dst.execute(f"DELETE FROM {table} WHERE task_id IN ({placeholders})", chunk)
+        dst.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", chunk)
+    dst.execute(f"DELETE FROM task_labels WHERE task_id IN ({_PROJECT_TASKS})", (project_id,))
+    _copy(src, dst, "task_labels", f"task_id IN ({_PROJECT_TASKS})", (project_id,))
+    for table in ('task_comments', 'task_history'):
+        dst.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table} WHERE task_id IN ({_PROJECT_TASKS})", (project_id,))
+        _copy(src, dst, table, f"id > %s AND task_id IN ({_PROJECT_TASKS})", (dst.fetchone()[0], project_id))
+    conn.commit()
+
+
+def _set_location(project_id: int, shard: int, status: str) -> None:
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO project_shards (project_id, shard_id, status, updated_at)
+                VALUES (%s, %s, %s, NOW())
+                ON DUPLICATE KEY UPDATE shard_id = VALUES(shard_id), status = VALUES(status), updated_at = NOW()
+                """,
+                (project_id, shard, status)
+            )
+            conn.commit()
+    _directory.pop(('project', project_id), None)
+
+
+def _delete_project_rows(shard: int, project_id: int, batch_size: int, pause: float) -> int:
+    """Removes a moved project's old copy in small transactions (children first)."""
+    deleted = 0
+    with get_db(shard) as conn:
+        with conn.cursor() as cur:
+            cur.execute("UPDATE projects SET is_deleted = TRUE WHERE id = %s", (project_id,))
+            conn.commit()
+            while True:
+                cur.execute(f"{_PROJECT_TASKS} ORDER BY t.id LIMIT %s", (project_id, batch_size))
+                task_ids = [task_id for (task_id,) in cur.fetchall()]
+                if not task_ids:
+                    break
+                placeholders = ", ".join(["%s"] * len(task_ids))
+                for table in TASK_CHILD_TABLES + ['tasks']:
+                    column = "id" if table == 'tasks' else "task_id"
+                    cur.execute(f"DELETE FROM {table} WHERE {column} IN ({placeholders})", task_ids)
+                    deleted += cur.rowcount
+                conn.commit()
+                time.sleep(pause)
+            for table, column in (('boards', 'project_id'), ('labels', 'project_id'),
+                                  ('project_members', 'project_id'), ('projects', 'id')):
+                cur.execute(f"DELETE FROM {table} WHERE {column} = %s", (project_id,))
+                deleted += cur.rowcount
+            conn.commit()
+    return deleted
+
+
+def move_project(project_id: int, target: int, batch_size: Optional[int] = None,
+                 pause: Optional[float] = None, log=print) -> Dict[str, Any]:
+    """
+    Moves a project and all its rows to shard `target` while the app keeps
+    serving it; writes are refused only between the freeze and the switch
+    (about SHARD_DIRECTORY_TTL + the catch-up copy).
+    """
+    batch_size = batch_size or Config.PURGE_BATCH_SIZE
+    pause = Config.PURGE_PAUSE_SECONDS if pause is None else pause
+    if target not in shard_ids():
+        raise ValueError(f"Unknown shard {target} (configured: {', '.join(map(str, shard_ids()))})")
+    source, moving = locate_project(project_id, fresh=True)
+    if source == target:
+        return {'project_id': project_id, 'shard': target, 'moved': False}
+    if moving:
+        raise ProjectMoving(f"project {project_id} is already being moved")
+    settle = Config.SHARD_DIRECTORY_TTL + 1  # every process has re-read the directory
+
+    started = time.time()
+    with get_db(source) as src_conn, get_db(target) as conn:
+        with src_conn.cursor() as src, conn.cursor() as dst:
+            src.execute("SELECT NOW() FROM projects WHERE id = %s AND is_deleted = FALSE", (project_id,))
+            found = src.fetchone()
+            if found is None:
+                raise ValueError(f"Project {project_id} not found on shard {source}")
+            since = found[0]
+            src_conn.commit()  # end the snapshot: every batch below reads fresh rows
+
+            sync_users(target)
+            _copy_project(src, dst, project_id)
+            conn.commit()
+            copied = _copy_tasks(conn, src, dst, project_id, batch_size=batch_size, pause=pause)
+            log(f"Copied project {project_id} ({copied} tasks) to shard {target} in {time.time() - started:.1f}s")
+
+            _set_location(project_id, source, 'moving')
+            try:
+                log(f"Writes to project {project_id} paused; waiting {settle:.0f}s for every process to notice...")
+                time.sleep(settle)
+                frozen = time.time()
+                src_conn.commit()
+                _catch_up(conn, src, dst, project_id, since)
+                src.execute("SELECT is_deleted FROM projects WHERE id = %s", (project_id,))
+                dst.execute("UPDATE projects SET is_deleted = %s WHERE id = %s", (src.fetchone()[0], project_id))
+                dst.execute("SELECT id FROM boards WHERE project_id = %s", (project_id,))
+                board_ids = [board_id for (board_id,) in dst.fetchall()]
+                conn.commit()
+            except BaseException:
+                _set_location(project_id, source, 'active')
+                raise
+
+    with get_db(HOME_SHARD) as home:
+        with home.cursor() as cur:
+            cur.executemany("INSERT IGNORE INTO board_projects (board_id, project_id) VALUES (%s, %s)",
+                            [(board_id, project_id) for board_id in board_ids])
+            home.commit()
+    _set_location(project_id, target, 'active')
+    log(f"Project {project_id} now on shard {target}; writes resumed after {time.time() - frozen:.1f}s")
+
+    time.sleep(settle)  # nobody reads the old copy any more
+    deleted = _delete_project_rows(source, project_id, batch_size, pause)
+    log(f"Removed {deleted} rows from shard {source}")
+    return {'project_id': project_id, 'shard': target, 'moved': True, 'tasks': copied,
+            'seconds': round(time.time() - started, 1)}
+
+
+# ===============================
+# CLI
+# ===============================
+def print_status():
+    stride = Config.SHARD_ID_STRIDE
+    for shard in shard_ids():
+        def counts():
+            with get_db() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COUNT(*) FROM projects WHERE is_deleted = FALSE")
+                    projects = cur.fetchone()[0]
+                    cur.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM tasks")
+                    return (projects, *cur.fetchone())
+        projects, tasks, max_id = scatter(counts, [shard])[0]
+        target = Config.SHARDS.get(shard, Config.SQLITE_PATH if Config.DB_BACKEND == "sqlite" else Config.MYSQL_HOST)
+        in_range = shard * stride <= max_id < (shard + 1) * stride or max_id == 0
+        print(f"shard {shard:<3} {target:<40} projects={projects:<7} tasks={tasks:<10} "
+              f"max task id={max_id}{'' if in_range else '  (outside its id range!)'}")
+    with get_db(HOME_SHARD) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT project_id, shard_id FROM project_shards WHERE status = 'moving'")
+            for project_id, shard in cur.fetchall():
+                print(f"project {project_id} is being moved away from shard {shard}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project shards")
+    parser.add_argument("--status", action="store_true", help="show shards")
+    parser.add_argument("--init", action="store_true", help="prepare every shard (id ranges, users)")
+    parser.add_argument("--sync-users", action="store_true", help="copy users to every shard")
+    parser.add_argument("--move", type=int, metavar="PROJECT_ID", help="project to move")
+    parser.add_argument("--to", type=int, metavar="SHARD", help="shard to move it to")
+    args = parser.parse_args()
+
+    if not Config.SHARDS:
+        print("No shards configured (SHARDS is empty): everything is on the main database.")
+    elif args.init:
+        for shard in shard_ids():
+            init_shard(shard)
+            print(f"Shard {shard} ready (ids from {shard * Config.SHARD_ID_STRIDE + 1})")
+    elif args.sync_users:
+        for shard in shard_ids()[1:]:
+            print(f"Shard {shard}: {sync_users(shard)} users copied")
+    elif args.move is not None:
+        if args.to is None:
+            parser.error("--move needs --to SHARD")
+        print(move_project(args.move, args.to))
+    else:
+        print_status()
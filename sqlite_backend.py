@@ -0,0 +1,262 @@
+# ==============================================================
+# FILE: sqlite_backend.py
+# PURPOSE: Embedded SQLite backend behind db.get_db()
+# ==============================================================
+# DB_BACKEND=sqlite runs the whole model layer without a MySQL server (small
+# installs, local development, benchmarks). Connections look like
+# mysql.connector ones as far as models/ is concerned:
+#   with get_db() as conn:
+#       with conn.cursor(dictionary=True) as cur:
+#           cur.execute("... WHERE id = %s", (task_id,))
+# and the MySQL dialect the models use is rewritten per statement (cached):
+# %s placeholders, INSERT IGNORE, ON DUPLICATE KEY UPDATE, IF(), NOW() -/+
+# INTERVAL n SECOND, GROUP_CONCAT(... SEPARATOR ...), MATCH ... AGAINST and
+# row-locking suffixes. The schema comes from schema.py and is created on
+# first use.
+#
+# The database runs in WAL mode, so readers never block the single writer.
+# synchronous=NORMAL is durable against application crashes (a power cut
+# can lose the last transactions, never corrupt the file).
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from functools import lru_cache
+
+from config import Config
+from schema import enum_orders, sqlite_statements
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",      # 64 MB page cache per connection
+    "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped reads
+)
+
+_ENUM_ORDERS = enum_orders()
+_schema_ready = set()  # database paths whose schema exists (this process)
+_schema_lock = threading.Lock()
+_idle = threading.local()  # per-thread stack of idle raw connections
+MAX_IDLE = 8  # per thread, over all database files
+
+
+# ================================
+# TYPES / FUNCTIONS
+# ================================
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(" "))
+sqlite3.register_converter("DATE", lambda b: date.fromisoformat(b.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda b: datetime.fromisoformat(b.decode()))
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _mysql_match(query, *columns):
+    """MATCH (cols) AGAINST (query IN BOOLEAN MODE) for '+word* +word' queries."""
+    words = re.findall(r"\w+", " ".join(c for c in columns if c).lower())
+    required, optional = [], []
+    for term in (query or "").lower().split():
+        prefix = term.endswith("*")
+        word = term.strip("+-*\"()<>~")
+        if word:
+            (required if term.startswith("+") else optional).append((word, prefix))
+
+    def found(word, prefix):
+        return any(w.startswith(word) if prefix else w == word for w in words)
+
+    if not all(found(*t) for t in required):
+        return 0
+    return 1 if required or any(found(*t) for t in optional) else 0
+
+
+def _enum_collation(values):
+    order = {value: i for i, value in enumerate(values)}
+
+    def compare(a, b):
+        ka, kb = (order.get(a, len(order)), a), (order.get(b, len(order)), b)
+        return (ka > kb) - (ka < kb)
+    return compare
+
+
+# ================================
+# DIALECT
+# ================================
+_PLACEHOLDER = re.compile(r"'(?:[^']|'')*'|%s|%%")
+_REWRITES = [
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+    (re.compile(r"\bIF\s*\(", re.I), "IIF("),
+    (re.compile(r"\bNOW\(\)\s*([-+])\s*INTERVAL\s+(%s|\d+)\s+(SECOND|MINUTE|HOUR|DAY)\b", re.I),
+     r"datetime(NOW(), '\1' || \2 || ' \3')"),
+    # SQLite < 3.44 has no ORDER BY inside aggregates
+    (re.compile(r"GROUP_CONCAT\(\s*(.+?)(?:\s+ORDER BY\s+[^)]+?)?\s+SEPARATOR\s+('[^']*')\s*\)", re.I),
+     r"GROUP_CONCAT(\1, \2)"),
+    (re.compile(r"MATCH\s*\(([^)]*)\)\s*AGAINST\s*\(\s*(%s|'[^']*')\s+IN\s+BOOLEAN\s+MODE\s*\)", re.I),
+     r"MYSQL_MATCH(\2, \1)"),
+    (re.compile(r"\s+FOR\s+UPDATE(\s+(SKIP\s+LOCKED|NOWAIT))?|\s+LOCK\s+IN\s+SHARE\s+MODE", re.I), ""),
+]
+_UPSERT = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b(.*)$", re.I | re.S)
+
+
+@lru_cache(maxsize=1024)
+def translate(sql):
+    """MySQL-dialect statement -> SQLite statement."""
+    for pattern, replacement in _REWRITES:
+        sql = pattern.sub(replacement, sql)
+    upsert = _UPSERT.search(sql)
+    if upsert:
+        assignments = re.sub(r"\bVALUES\((\w+)\)", r"excluded.\1", upsert.group(1), flags=re.I)
+        sql = sql[:upsert.start()] + "ON CONFLICT DO UPDATE SET" + assignments
+    return _PLACEHOLDER.sub(lambda m: "?" if m.group() == "%s" else "%" if m.group() == "%%" else m.group(), sql)
+
+
+# ================================
+# CONNECTION WRAPPERS
+# ================================
+class SQLiteCursor:
+    def __init__(self, raw, dictionary=False):
+        self._raw = raw
+        self._dictionary = dictionary
+        self.lastrowid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, sql, params=None):
+        self._raw.execute(translate(sql), tuple(params) if params is not None else ())
+        if self._raw.lastrowid and sql.lstrip()[:6].upper() in ("INSERT", "REPLAC"):
+            # MySQL reports the FIRST id of a multi-row INSERT, SQLite the last
+            self.lastrowid = self._raw.lastrowid - max(self._raw.rowcount, 1) + 1
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._raw.executemany(translate(sql), [tuple(p) for p in seq_of_params])
+        return self
+
+    @property
+    def rowcount(self):
+        return self._raw.rowcount
+
+    @property
+    def description(self):
+        return self._raw.description
+
+    @property
+    def column_names(self):
+        return tuple(d[0] for d in self._raw.description)
+
+    def _rows(self, rows):
+        if not self._dictionary:
+            return rows
+        names = self.column_names
+        return [dict(zip(names, row)) for row in rows]
+
+    def fetchone(self):
+        row = self._raw.fetchone()
+        return row if row is None else self._rows([row])[0]
+
+    def fetchmany(self, size=1):
+        return self._rows(self._raw.fetchmany(size))
+
+    def fetchall(self):
+        return self._rows(self._raw.fetchall())
+
+    def __iter__(self):
+        while True:
+            rows = self.fetchmany(500)
+            if not rows:
+                return
+            yield from rows
+
+    def close(self):
+        self._raw.close()
+
+
+class SQLiteConnection:
+    """One checked-out raw connection; close() returns it to this thread's idle stack."""
+
+    def __init__(self, raw, path):
+        self._raw = raw
+        self._path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def cursor(self, dictionary=False, **_):
+        return SQLiteCursor(self._raw.cursor(), dictionary)
+
+    def commit(self):
+        self._raw.commit()
+
+    def rollback(self):
+        self._raw.rollback()
+
+    def is_connected(self):
+        return self._raw is not None
+
+    def close(self):
+        if self._raw is None:
+            return
+        # Like pool_reset_session: nothing uncommitted survives a checkout
+        if self._raw.in_transaction:
+            self._raw.rollback()
+        stack = _idle_stack()
+        stack.append((self._path, self._raw))
+        if len(stack) > MAX_IDLE:
+            stack.pop(0)[1].close()
+        self._raw = None
+
+
+def _idle_stack():
+    # Connections must not cross a fork or a thread
+    if getattr(_idle, "pid", None) != os.getpid():
+        _idle.pid = os.getpid()
+        _idle.stack = []
+    return _idle.stack
+
+
+def _open(path):
+    raw = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES, timeout=5)
+    for pragma in PRAGMAS:
+        raw.execute(pragma)
+    raw.create_function("NOW", 0, _now)
+    raw.create_function("MYSQL_MATCH", -1, _mysql_match, deterministic=True)
+    for name, values in _ENUM_ORDERS.items():
+        raw.create_collation(name, _enum_collation(values))
+    return raw
+
+
+def ensure_schema(raw, path):
+    if path in _schema_ready:
+        return
+    with _schema_lock:
+        if path not in _schema_ready:
+            for statement in sqlite_statements():
+                raw.execute(statement)
+            raw.commit()
+            _schema_ready.add(path)
+
+
+def connect(path=None):
+    """A connection to the SQLite database (Config.SQLITE_PATH by default)."""
+    path = path or Config.SQLITE_PATH
+    stack = _idle_stack()
+    for i in range(len(stack) - 1, -1, -1):
+        if stack[i][0] == path:  # several databases with SQLITE shards
+            return SQLiteConnection(stack.pop(i)[1], path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    raw = _open(path)
+    ensure_schema(raw, path)
+    return SQLiteConnection(raw, path)
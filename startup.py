@@ -0,0 +1,66 @@
+# ==============================================================
+# FILE: startup.py
+# PURPOSE: Cold-start helpers – template caching, pre-warming, fork safety
+# ==============================================================
+
+import os
+import time
+
+from jinja2 import FileSystemBytecodeCache
+
+from config import Config
+
+
+# ================================
+# TEMPLATES
+# ================================
+def configure_templates(app):
+    """
+    Persist compiled template bytecode on disk (shared by every worker and
+    every restart) and compile all templates now instead of on first hit.
+    """
+    if Config.JINJA_CACHE_DIR:
+        os.makedirs(Config.JINJA_CACHE_DIR, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(Config.JINJA_CACHE_DIR)
+
+    if Config.PRECOMPILE_TEMPLATES:
+        precompile_templates(app)
+
+
+def precompile_templates(app):
+    """
+    Loads every template into the environment's in-memory cache.
+    Returns (count, seconds).
+    """
+    start = time.perf_counter()
+    env = app.jinja_env
+    names = [n for n in env.list_templates() if n.endswith(".html")]
+
+    # Keep every template resident, not just the default 400
+    if env.cache is not None and env.cache.capacity < len(names):
+        env.cache.capacity = len(names) * 2
+
+    for name in names:
+        env.get_template(name)
+    return len(names), time.perf_counter() - start
+
+
+# ================================
+# PER-PROCESS RESOURCES
+# ================================
+def start_background_workers():
+    """Threads never survive fork(): start them in the process that serves."""
+    if Config.JOB_WORKER_THREADS > 0:
+        from models.jobs_model import start_job_workers
+        start_job_workers()
+
+
+def warm_worker():
+    """
+    Run in every freshly forked worker: open its DB pool and start its
+    background threads before it accepts the first request.
+    """
+    from db import warm_pool
+    opened = warm_pool()
+    start_background_workers()
+    return opened
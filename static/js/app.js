@@ -0,0 +1,11 @@
+// static/js/app.js – navbar dropdowns (layout.html)
+document.querySelectorAll('.dropdown').forEach(d => {
+  d.addEventListener('click', (e) => {
+    e.stopPropagation();
+    d.querySelector('.dropdown-menu').classList.toggle('hidden');
+  });
+});
+
+document.addEventListener('click', () => {
+  document.querySelectorAll('.dropdown-menu').forEach(m => m.classList.add('hidden'));
+});
@@ -0,0 +1,163 @@
+# tests/conftest.py
+# Shared fixtures. Most tests run the real app and models against a
+# throwaway SQLite file (DB_BACKEND=sqlite); tests that need MySQL itself
+# (query plans, locking) use the `mysql_db` fixture, which is skipped unless a
+# server is reachable with the MYSQL_* settings. It builds the schema in
+# MYSQL_TEST_DB (default: <MYSQL_DB>_test), dropping whatever is there.
+#   python -m pytest -q
+#   MYSQL_HOST=127.0.0.1 MYSQL_PASSWORD=... python -m pytest -q
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import mysql.connector
+
+import db
+import sharding
+from config import Config
+from db import get_db, use_pure
+from fragment_cache import fragment_cache
+from models.calendar_model import month_cache
+from schema import TABLES, DROP_ORDER
+
+MYSQL_TEST_DB = os.getenv("MYSQL_TEST_DB", f"{Config.MYSQL_DB}_test")
+
+
+def _reset_caches():
+    fragment_cache.clear()
+    month_cache.clear()
+    sharding._directory.clear()
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """A fresh SQLite database for the test; returns its path."""
+    path = str(tmp_path / "gitboard.db")
+    monkeypatch.setattr(Config, "DB_BACKEND", "sqlite")
+    monkeypatch.setattr(Config, "SQLITE_PATH", path)
+    monkeypatch.setattr(Config, "SHARDS", {})
+    monkeypatch.setattr(Config, "MYSQL_REPLICAS", [])
+    monkeypatch.setattr(Config, "JOB_WORKER_THREADS", 0)
+    monkeypatch.setattr(Config, "RATE_LIMIT_ENABLED", False)
+    monkeypatch.setattr(Config, "PRECOMPILE_TEMPLATES", False)
+    monkeypatch.setattr(Config, "JINJA_CACHE_DIR", "")
+    monkeypatch.setattr(Config, "PURGE_PAUSE_SECONDS", 0)
+    _reset_caches()
+    yield path
+    _reset_caches()
+
+
+@pytest.fixture
+def app(sqlite_db):
+    from app import create_app
+    app = create_app(start_background=False)
+    app.config.update(TESTING=True)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def login(client, user):
+    with client.session_transaction() as session:
+        session['user_id'] = user.id
+        session['username'] = user.username
+
+
+# ===============================
+# Rows
+# ===============================
+def make_user():
+    tag = uuid.uuid4().hex[:10]
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
+                (f"user_{tag}", f"user_{tag}@example.com", "x")
+            )
+            user_id = cur.lastrowid
+            conn.commit()
+    return SimpleNamespace(id=user_id, username=f"user_{tag}")
+
+
+def make_board(owner=None):
+    """A project owned by `owner` (a new user by default) with one board."""
+    owner = owner or make_user()
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("INSERT INTO projects (name, owner_id) VALUES (%s, %s)", ("Project", owner.id))
+            project_id = cur.lastrowid
+            cur.execute(
+                "INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, 'owner')",
+                (project_id, owner.id)
+            )
+            cur.execute("INSERT INTO boards (project_id, name) VALUES (%s, %s)", (project_id, "Board"))
+            board_id = cur.lastrowid
+            conn.commit()
+    return SimpleNamespace(owner=owner, project_id=project_id, board_id=board_id)
+
+
+def add_member(project_id, role):
+    user = make_user()
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, %s)",
+                (project_id, user.id, role)
+            )
+            conn.commit()
+    return user
+
+
+# ===============================
+# MySQL
+# ===============================
+def _mysql_connect(**kwargs):
+    return mysql.connector.connect(
+        host=Config.MYSQL_HOST, user=Config.MYSQL_USER, password=Config.MYSQL_PASSWORD,
+        port=Config.MYSQL_PORT, connection_timeout=2, use_pure=use_pure(), **kwargs
+    )
+
+
+@pytest.fixture(scope="session")
+def mysql_schema():
+    try:
+        conn = _mysql_connect()
+    except mysql.connector.Error as err:
+        pytest.skip(f"MySQL not available: {err}")
+    with conn.cursor() as cur:
+        cur.execute(f"CREATE DATABASE IF NOT EXISTS {MYSQL_TEST_DB} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+        cur.execute(f"USE {MYSQL_TEST_DB}")
+        cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in DROP_ORDER:
+            cur.execute(f"DROP TABLE IF EXISTS {table}")
+        cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+        for _, ddl in TABLES:
+            cur.execute(ddl)
+    conn.close()
+    return MYSQL_TEST_DB
+
+
+def point_at_mysql(monkeypatch, schema):
+    """Point the app's MySQL settings at the test schema."""
+    monkeypatch.setattr(Config, "DB_BACKEND", "mysql")
+    monkeypatch.setattr(Config, "MYSQL_DB", schema)
+    monkeypatch.setattr(Config, "SHARDS", {})
+    monkeypatch.setattr(Config, "MYSQL_REPLICAS", [])
+    monkeypatch.setattr(Config, "JOB_WORKER_THREADS", 0)
+    monkeypatch.setattr(db, "_pool", None)
+    _reset_caches()
+
+
+@pytest.fixture
+def mysql_db(mysql_schema, monkeypatch):
+    """The MySQL test schema (shared by the session: rows from other tests remain)."""
+    point_at_mysql(monkeypatch, mysql_schema)
+    yield mysql_schema
+    _reset_caches()
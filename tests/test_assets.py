@@ -0,0 +1,53 @@
+# tests/test_assets.py
+# With a built manifest (python assets.py), url_for('static', ...) emits
+# the hashed name and the hashed file is served with immutable caching;
+# the pages link their CSS/JS that way.
+import re
+
+import pytest
+from flask import url_for
+
+import assets
+
+
+@pytest.fixture
+def built(sqlite_db, tmp_path, monkeypatch):
+    dist = tmp_path / "dist"
+    monkeypatch.setattr(assets, "DIST_DIR", str(dist))
+    monkeypatch.setattr(assets, "MANIFEST_PATH", str(dist / "manifest.json"))
+    monkeypatch.setattr(assets, "vendor_libraries", lambda refresh=False: None)
+    manifest = assets.build_assets()
+    from app import create_app
+    app = create_app(start_background=False)
+    app.config.update(TESTING=True)
+    return app, manifest
+
+
+def test_static_urls_are_hashed(built):
+    app, manifest = built
+    assert re.fullmatch(r"css/style\.[0-9a-f]{10}\.css", manifest['css/style.css'])
+    with app.test_request_context("/"):
+        assert url_for('static', filename='css/style.css') == f"/static/dist/{manifest['css/style.css']}"
+        assert url_for('static', filename='no/such.css') == "/static/no/such.css"
+
+
+def test_pages_link_hashed_assets(built):
+    app, manifest = built
+    client = app.test_client()
+    html = client.get("/auth/login").get_data(as_text=True)
+    for path in ('css/app.css', 'js/app.js'):
+        url = f"/static/dist/{manifest[path]}"
+        assert f'"{url}"' in html
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == assets.IMMUTABLE
+
+
+def test_precompressed_variant_when_accepted(built):
+    app, manifest = built
+    client = app.test_client()
+    url = f"/static/dist/{manifest['css/style.css']}"
+    assert "Content-Encoding" not in client.get(url).headers
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
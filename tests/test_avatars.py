@@ -0,0 +1,25 @@
+# tests/test_avatars.py
+# Every /avatars/<name>.svg is that user's avatar; the sprite lives at
+# /avatars/sprite and gives each username its own symbol id.
+import re
+
+from routes.avatar_routes import avatar_id
+
+NAMES = ["a.b", "a_b", "a b", "a-b", "sprite", "ünï"]
+
+
+def test_every_name_gets_its_own_avatar(client):
+    for name in NAMES:
+        response = client.get(f"/avatars/{name}.svg")
+        assert response.status_code == 200
+        assert f'aria-label="{name}"' in response.get_data(as_text=True)
+
+
+def test_sprite_ids_are_one_per_username(client):
+    ids = {avatar_id(name) for name in NAMES}
+    assert len(ids) == len(NAMES)
+    assert all(re.fullmatch(r"avatar-[A-Za-z0-9_-]+", i) for i in ids)
+
+    response = client.get("/avatars/sprite", query_string=[("u", name) for name in NAMES])
+    assert response.mimetype == "image/svg+xml"
+    assert set(re.findall(r'<symbol id="([^"]+)"', response.get_data(as_text=True))) == ids
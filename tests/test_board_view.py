@@ -0,0 +1,48 @@
+# tests/test_board_view.py
+# The board page's scripts call the JSON API through URLs Flask builds
+# (the `urls` object): every one of them must reach its route.
+import re
+
+from conftest import login, make_board
+from db import get_db
+
+
+def _task(board):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO tasks (board_id, title, status, created_by) VALUES (%s, %s, 'To Do', %s)",
+                (board.board_id, "Card", board.owner.id)
+            )
+            task_id = cur.lastrowid
+            conn.commit()
+    return task_id
+
+
+def _page_urls(client, board):
+    html = client.get(f"/boards/boards/{board.board_id}").get_data(as_text=True)
+    urls = dict(re.findall(r'^\s*(\w+): "([^"]+)",$', html, re.M))
+    assert set(urls) >= {'createTask', 'task', 'move', 'comments', 'addComment', 'deleteTask'}
+    return urls
+
+
+def test_board_page_urls_reach_the_api(client):
+    board = make_board()
+    task_id = _task(board)
+    login(client, board.owner)
+    urls = _page_urls(client, board)
+    for_task = {name: url.replace('/tasks/0', f'/tasks/{task_id}') for name, url in urls.items()}
+
+    assert client.get(for_task['task']).get_json()['id'] == task_id
+
+    posted = client.post(for_task['addComment'], json={'comment': "hello"})
+    assert posted.status_code == 201
+    comments = client.get(for_task['comments']).get_json()['comments']
+    assert [c['comment'] for c in comments] == ["hello"]
+
+    moved = client.post(for_task['move'], json={'status': 'Done'})
+    assert moved.status_code == 200
+    assert client.get(for_task['task']).get_json()['status'] == 'Done'
+
+    assert client.delete(for_task['deleteTask']).status_code == 200
+    assert client.get(for_task['task']).status_code == 404
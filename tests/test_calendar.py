@@ -0,0 +1,25 @@
+# tests/test_calendar.py
+# Calendar windows: a bad or out-of-range ?week / ?month is a 400, the
+# first and last representable months and weeks still work.
+import pytest
+
+from conftest import login, make_user
+
+
+@pytest.mark.parametrize("query,status", [
+    ("week=2025-03-14", 200),
+    ("week=0001-01-01", 200),
+    ("week=9999-12-26", 200),
+    ("week=9999-12-31", 400),
+    ("week=2025-02-30", 400),
+    ("month=0001-01", 200),
+    ("month=9999-12", 200),
+    ("month=2025-13", 400),
+    ("month=10000-01", 400),
+])
+def test_window_bounds(client, query, status):
+    login(client, make_user())
+    response = client.get(f"/calendar/me?{query}")
+    assert response.status_code == status
+    if status == 400:
+        assert response.get_json()['error'] == "Use ?month=YYYY-MM or ?week=YYYY-MM-DD"
@@ -0,0 +1,56 @@
+# tests/test_comments.py
+# Comments API: 404 for a task that isn't on the board, 403 without the
+# role (members read, owners / editors write), newest first with a total.
+# Access is resolved by get_task_state alone, like the other task routes.
+import pytest
+
+from conftest import add_member, login, make_board, make_user
+from db import get_db
+from routes import board_routes
+
+
+def _url(board, task_id):
+    return f"/boards/boards/{board.board_id}/tasks/{task_id}/comments"
+
+
+@pytest.fixture
+def board(client, monkeypatch):
+    board = make_board()
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("INSERT INTO tasks (board_id, title, created_by) VALUES (%s, %s, %s)",
+                        (board.board_id, "Card", board.owner.id))
+            board.task_id = cur.lastrowid
+            conn.commit()
+
+    def unused(*args, **kwargs):
+        raise AssertionError("comments routes resolve access with get_task_state")
+    for name in ('get_task', 'get_board', 'get_project_members'):
+        monkeypatch.setattr(board_routes, name, unused)
+    return board
+
+
+def test_members_read_editors_write(client, board):
+    login(client, board.owner)
+    for text in ("one", "two"):
+        assert client.post(_url(board, board.task_id), json={'comment': text}).status_code == 201
+
+    login(client, add_member(board.project_id, 'viewer'))
+    body = client.get(_url(board, board.task_id)).get_json()
+    assert ([c['comment'] for c in body['comments']], body['total']) == (["two", "one"], 2)
+    assert client.post(_url(board, board.task_id), json={'comment': "x"}).status_code == 403
+
+    login(client, add_member(board.project_id, 'editor'))
+    assert client.post(_url(board, board.task_id), json={'comment': "three"}).status_code == 201
+
+
+def test_strangers_and_other_boards(client, board):
+    login(client, make_user())
+    assert client.get(_url(board, board.task_id)).status_code == 403
+    assert client.post(_url(board, board.task_id), json={'comment': "x"}).status_code == 403
+
+    login(client, board.owner)
+    other = make_board(board.owner)
+    assert client.get(_url(other, board.task_id)).status_code == 404
+    assert client.post(_url(other, board.task_id), json={'comment': "x"}).status_code == 404
+    assert client.get(_url(board, 999999)).status_code == 404
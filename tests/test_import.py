@@ -0,0 +1,82 @@
+# tests/test_import.py
+# The streaming JSON reader: array or NDJSON, read in chunks of any size;
+# a malformed or non-object item is reported under its own number and the
+# items after it still import. The route rejects a bad mapping with 400.
+import io
+import json
+
+import pytest
+
+from conftest import login, make_board
+from models.import_model import iter_json_records
+
+
+def _read(text, chunk_size=65536, **kwargs):
+    records = iter_json_records(io.StringIO(text), chunk_size=chunk_size, **kwargs)
+    return [(item, record.get('_error') or record['title']) for item, record in records]
+
+
+@pytest.fixture(params=[1, 7, 65536], ids=lambda size: f"chunk{size}")
+def read(request):
+    return lambda text, **kwargs: _read(text, chunk_size=request.param, **kwargs)
+
+
+def test_array_and_ndjson(read):
+    expected = [(1, "a"), (2, "b")]
+    assert read('[{"title": "a"}, {"title": "b"}]') == expected
+    assert read('{"title": "a"}\n{"title": "b"}\n') == expected
+    assert read(' \n[\n{"title": "a"},\n{"title": "b"}\n]\n') == expected
+    assert read('') == [] and read('[]') == []
+
+
+def test_nested_array_is_one_item(read):
+    assert read('[[1, 2], {"title": "q"}]') == [(1, "Item is not an object"), (2, "q")]
+    assert read('[{"title": "a"}, [[3]], 4, {"title": "b"}]') == [
+        (1, "a"), (2, "Item is not an object"), (3, "Item is not an object"), (4, "b")]
+
+
+@pytest.mark.parametrize("text", [
+    '[{"title": "a"}, {"title": nope}, {"title": "c"}]',
+    '{"title": "a"}\n{"title": nope, "x": [1, {"y": 2}]}\n{"title": "c"}\n',
+    '{"title": "a"}\n{"title": "open string\n{"title": "c"}\n',
+])
+def test_malformed_item_is_skipped(read, text):
+    records = read(text)
+    assert [item for item, _ in records] == [1, 2, 3]
+    assert records[0] == (1, "a") and records[2] == (3, "c")
+    assert records[1][1].startswith("Malformed JSON")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_oversized_item_is_skipped(chunk_size):
+    # the cap bounds what is buffered: it applies to items longer than a chunk
+    big = json.dumps({"title": "x" * 500})
+    records = _read(f'[{{"title": "a"}}, {big}, {{"title": "c"}}]', chunk_size, max_item_chars=100)
+    assert records == [(1, "a"), (2, "Item is longer than 100 characters"), (3, "c")]
+
+
+# ===============================
+# Route
+# ===============================
+@pytest.mark.parametrize("mapping", ['[1]', '"title"', '{"Name": 1}', '{"Name": null}', '{'])
+def test_bad_mapping_is_400(client, mapping):
+    board = make_board()
+    login(client, board.owner)
+    response = client.post(f"/imports/boards/{board.board_id}/tasks", data={
+        'file': (io.BytesIO(b'[{"Name": "a"}]'), "tasks.json"),
+        'mapping': mapping,
+    })
+    assert response.status_code == 400
+
+
+def test_mapping_renames_columns(client):
+    board = make_board()
+    login(client, board.owner)
+    response = client.post(f"/imports/boards/{board.board_id}/tasks", data={
+        'file': (io.BytesIO(b'[{"Name": "a"}, [1], {"Name": "b"}]'), "tasks.json"),
+        'mapping': '{"Name": "title"}',
+    })
+    assert response.status_code == 200
+    report = response.get_json()
+    assert (report['imported'], report['failed']) == (2, 1)
+    assert report['errors'] == [{'line': 2, 'error': "Item is not an object"}]
@@ -0,0 +1,135 @@
+# tests/test_jobs.py
+# Background jobs: priority order, dedupe, retries with backoff until
+# max_attempts, and leases: a job whose worker stopped heartbeating is
+# claimed again, and the old worker can no longer record anything.
+import pytest
+
+from conftest import login, make_user
+from db import get_db
+from models import jobs_model
+from models.jobs_model import (PRIORITY_HIGH, PRIORITY_LOW, LeaseLost, _claim, _fail_exhausted,
+                               enqueue, get_job, record_progress, run_job, run_pending)
+
+
+@pytest.fixture
+def handlers(sqlite_db, monkeypatch):
+    """Test job kinds: 'echo' returns its payload, 'broken' raises; `ran` lists job ids in run order."""
+    ran = []
+
+    def echo(job):
+        ran.append(job.id)
+        return job.payload
+
+    def broken(job):
+        ran.append(job.id)
+        raise RuntimeError("boom")
+    monkeypatch.setitem(jobs_model.HANDLERS, 'echo', echo)
+    monkeypatch.setitem(jobs_model.HANDLERS, 'broken', broken)
+    return ran
+
+
+def _execute(sql, params=()):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            conn.commit()
+
+
+def _make_due(job_id):
+    _execute("UPDATE jobs SET run_after = NOW() - INTERVAL 1 SECOND WHERE id = %s", (job_id,))
+
+
+def _expire_lease(job_id):
+    _execute("UPDATE jobs SET heartbeat_at = NOW() - INTERVAL 3600 SECOND WHERE id = %s", (job_id,))
+
+
+def test_runs_by_priority_then_fifo(handlers):
+    low = enqueue('echo', {'n': 1}, priority=PRIORITY_LOW)
+    first = enqueue('echo', {'n': 2})
+    second = enqueue('echo', {'n': 3})
+    high = enqueue('echo', {'n': 4}, priority=PRIORITY_HIGH)
+    assert run_pending(['echo']) == 4
+    assert handlers == [high, first, second, low]
+    job = get_job(first)
+    assert (job.status, job.attempts, job.result) == ('done', 1, {'n': 2})
+
+
+def test_kinds_filter(handlers):
+    job_id = enqueue('echo')
+    assert run_pending(['other']) == 0
+    assert get_job(job_id).status == 'queued'
+
+
+def test_dedupe_key_returns_the_same_job(handlers):
+    job_id = enqueue('echo', dedupe_key="echo:1")
+    assert enqueue('echo', dedupe_key="echo:1") == job_id
+    assert run_pending() == 1
+    assert enqueue('echo', dedupe_key="echo:1") == job_id
+    assert get_job(job_id).status == 'done'  # done jobs are not re-run
+
+
+def test_failures_retry_with_backoff_then_fail(handlers):
+    job_id = enqueue('broken', max_attempts=2, dedupe_key="broken:1")
+    assert run_pending() == 1
+    job = get_job(job_id)
+    assert (job.status, job.attempts, job.last_error) == ('queued', 1, "RuntimeError: boom")
+    assert run_pending() == 0  # backing off
+
+    _make_due(job_id)
+    assert run_pending() == 1
+    job = get_job(job_id)
+    assert (job.status, job.attempts) == ('failed', 2)
+    _make_due(job_id)
+    assert run_pending() == 0
+
+    assert enqueue('broken', dedupe_key="broken:1") == job_id  # re-queues a failed job
+    job = get_job(job_id)
+    assert (job.status, job.attempts) == ('queued', 0)
+
+
+def test_unknown_kind_fails_at_once(handlers):
+    job_id = enqueue('nobody-handles-this')
+    assert run_pending() == 1
+    job = get_job(job_id)
+    assert job.status == 'failed' and "No handler" in job.last_error
+
+
+def test_expired_lease_is_reclaimed(handlers):
+    job_id = enqueue('echo')
+    stale = _claim()
+    assert _claim() is None  # leased, still heartbeating
+    _expire_lease(job_id)
+
+    fresh = _claim()
+    assert (fresh.id, fresh.attempts) == (job_id, 2)
+    assert fresh.leased_by != stale.leased_by
+    with pytest.raises(LeaseLost):
+        record_progress(stale, 10)
+    record_progress(fresh, 10)
+
+    assert run_job(fresh)
+    run_job(stale)  # the old worker finishing late changes nothing
+    job = get_job(job_id)
+    assert (job.status, job.progress, job.attempts) == ('done', 10, 2)
+
+
+def test_lost_last_attempt_is_failed(handlers):
+    job_id = enqueue('echo', max_attempts=1)
+    _claim()
+    _expire_lease(job_id)
+    assert _claim() is None
+    assert _fail_exhausted() == 1
+    job = get_job(job_id)
+    assert (job.status, job.last_error) == ('failed', "worker stopped responding")
+
+
+def test_status_route_is_private(client, handlers):
+    owner, other = make_user(), make_user()
+    job_id = enqueue('echo', created_by=owner.id)
+    login(client, owner)
+    response = client.get(f"/jobs/{job_id}")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    assert response.get_json()['job']['status'] == 'queued'
+    login(client, other)
+    assert client.get(f"/jobs/{job_id}").status_code == 404
@@ -0,0 +1,51 @@
+# tests/test_label_filter.py
+# Label filters on bitsets: one bit per label, names matched without
+# regard to case (a name shared by several labels matches any of them).
+import pytest
+
+from models.label_filter import LabelIndex, compile_label_filter
+
+
+@pytest.fixture
+def index():
+    index = LabelIndex()
+    for label_id, name in ((1, "Bug"), (2, "bug"), (3, "ui"), (4, "good first issue")):
+        index.add(label_id, name)
+    return index
+
+
+def _matches(index, expression, tasks):
+    predicate = compile_label_filter(expression, index)
+    return [name for name, label_ids in tasks.items() if predicate(index.mask(label_ids))]
+
+
+TASKS = {
+    "Bug": [1], "bug": [2], "both": [1, 2], "ui": [3], "Bug+ui": [1, 3], "bug+ui": [2, 3],
+    "easy": [4], "none": [],
+}
+
+
+def test_labels_differing_in_case_keep_their_own_bits(index):
+    assert len({index.mask([label_id]) for label_id in (1, 2, 3, 4)}) == 4
+
+
+@pytest.mark.parametrize("expression,expected", [
+    ("bug", ["Bug", "bug", "both", "Bug+ui", "bug+ui"]),
+    ("BUG", ["Bug", "bug", "both", "Bug+ui", "bug+ui"]),
+    ("NOT bug", ["ui", "easy", "none"]),
+    ("bug AND ui", ["Bug+ui", "bug+ui"]),
+    ("bug ui", ["Bug+ui", "bug+ui"]),
+    ("ui AND NOT Bug", ["ui"]),
+    ("bug OR \"good first issue\"", ["Bug", "bug", "both", "Bug+ui", "bug+ui", "easy"]),
+    ("(bug OR ui) AND NOT (bug AND ui)", ["Bug", "bug", "both", "ui"]),
+    ("missing", []),
+    ("NOT missing", list(TASKS)),
+])
+def test_filters(index, expression, expected):
+    assert _matches(index, expression, TASKS) == expected
+
+
+@pytest.mark.parametrize("expression", ["(bug", "bug)", "AND", "bug OR", "\"open"])
+def test_syntax_errors(index, expression):
+    with pytest.raises(ValueError):
+        compile_label_filter(expression, index)
@@ -0,0 +1,107 @@
+# tests/test_my_tasks.py
+# The My Tasks feed: walking every page with the cursor returns each open
+# task exactly once, in sort order (undated / unprioritized tasks last),
+# and on MySQL every part of the page query is an index-ordered range read
+# (no filesort over the user's tasks).
+from datetime import date, timedelta
+
+import pytest
+
+from conftest import add_member, make_board, point_at_mysql
+from db import get_db
+from models.my_tasks_model import get_my_tasks, my_tasks_query, _MERGE, OPEN_STATUSES
+from models.task_query import PRIORITIES, STATUSES
+
+
+def _seed(count):
+    """A member with `count` tasks over two projects, every status, some without due date / priority."""
+    first, second = make_board(), make_board()
+    user = add_member(first.project_id, 'editor')
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO project_members (project_id, user_id, role) VALUES (%s, %s, 'editor')",
+                (second.project_id, user.id)
+            )
+            for i in range(count):
+                board = first if i % 2 else second
+                cur.execute(
+                    "INSERT INTO tasks (board_id, title, assigned_to, priority, status, due_date, created_by) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                    (board.board_id, f"task {i}", user.id,
+                     None if i % 7 == 0 else PRIORITIES[i % len(PRIORITIES)],
+                     STATUSES[i % len(STATUSES)],
+                     None if i % 5 == 0 else date(2025, 1, 1) + timedelta(days=i % 9),
+                     board.owner.id)
+                )
+            conn.commit()
+    return user
+
+
+def _walk(user_id, sort, limit):
+    seen, cursor = [], None
+    while True:
+        tasks, cursor = get_my_tasks(user_id, sort=sort, cursor=cursor, limit=limit)
+        seen.extend(tasks)
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize("sort", ['due', 'priority', 'updated'])
+def test_pages_cover_every_open_task_in_order(sqlite_db, sort):
+    user = _seed(120)
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"SELECT COUNT(*) FROM tasks WHERE assigned_to = %s AND status IN ({', '.join(['%s'] * 3)})",
+                (user.id, *OPEN_STATUSES)
+            )
+            expected = cur.fetchone()[0]
+
+    tasks = _walk(user.id, sort, limit=7)
+    ids = [task['id'] for task in tasks]
+    assert len(ids) == len(set(ids)) == expected
+    key, reverse = _MERGE[sort]
+    assert tasks == sorted(tasks, key=key, reverse=reverse)
+    if sort == 'due':
+        dated = [task['due_date'] is not None for task in tasks]
+        assert dated == sorted(dated, reverse=True)  # undated tail last
+
+
+def test_cursor_from_another_sort_is_rejected(sqlite_db):
+    user = _seed(10)
+    _, cursor = get_my_tasks(user.id, sort='due', limit=2)
+    with pytest.raises(ValueError):
+        get_my_tasks(user.id, sort='priority', cursor=cursor)
+
+
+# ===============================
+# Plans (MySQL)
+# ===============================
+@pytest.fixture(scope="module")
+def busy_user(mysql_schema):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        point_at_mysql(monkeypatch, mysql_schema)
+        user = _seed(5000)
+        with get_db() as conn:
+            with conn.cursor() as cur:
+                cur.execute("ANALYZE TABLE tasks")
+                cur.fetchall()
+    return user
+
+
+@pytest.mark.parametrize("sort,after", [
+    ('due', None), ('due', (date(2025, 1, 5), 1000)), ('due', (None, 1000)),
+    ('priority', None), ('priority', ('High', 1000)),
+    ('updated', None),
+])
+def test_page_query_is_an_index_range_without_filesort(mysql_db, busy_user, sort, after):
+    sql, params = my_tasks_query(busy_user.id, sort, OPEN_STATUSES, after, 51)
+    with get_db() as conn:
+        with conn.cursor(dictionary=True) as cur:
+            cur.execute("EXPLAIN " + sql, params)
+            plan = cur.fetchall()
+
+    tasks = [row for row in plan if row['table'] == 't']
+    assert tasks and all(row['key'] and row['key'].startswith('idx_assignee_') for row in tasks), plan
+    assert not [row for row in plan if 'filesort' in (row['Extra'] or '')], plan
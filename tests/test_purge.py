@@ -0,0 +1,113 @@
+# tests/test_purge.py
+# Soft delete + background purge: the board / project disappears at once,
+# then a 'purge' job removes its rows in batches of PURGE_BATCH_SIZE, one
+# transaction each, counting them as progress. A worker whose lease was
+# taken over stops without committing its batch.
+import pytest
+
+from conftest import login, make_board
+from config import Config
+from db import get_db
+from models import purge_model
+from models.boards_model import get_board
+from models.jobs_model import _claim, get_job, run_job, run_pending
+
+TASKS = 5
+
+
+def _count(sql, params):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchone()[0]
+
+
+def _seed(board, tasks=TASKS):
+    """`tasks` tasks on the board, each with a comment and a label."""
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("INSERT INTO labels (name, project_id) VALUES (%s, %s)", ("bug", board.project_id))
+            label_id = cur.lastrowid
+            for n in range(tasks):
+                cur.execute("INSERT INTO tasks (board_id, title, created_by) VALUES (%s, %s, %s)",
+                            (board.board_id, f"Card {n}", board.owner.id))
+                task_id = cur.lastrowid
+                cur.execute("INSERT INTO task_labels (task_id, label_id) VALUES (%s, %s)", (task_id, label_id))
+                cur.execute("INSERT INTO task_comments (task_id, user_id, comment) VALUES (%s, %s, %s)",
+                            (task_id, board.owner.id, "hi"))
+            conn.commit()
+
+
+def _board_rows(board_id):
+    return (
+        _count("SELECT COUNT(*) FROM boards WHERE id = %s", (board_id,)),
+        _count("SELECT COUNT(*) FROM tasks WHERE board_id = %s", (board_id,)),
+        _count("SELECT COUNT(*) FROM task_comments c JOIN tasks t ON t.id = c.task_id "
+               "WHERE t.board_id = %s", (board_id,)),
+    )
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Records the rows deleted by every committed batch."""
+    monkeypatch.setattr(Config, "PURGE_BATCH_SIZE", 2)
+    committed = []
+    record = purge_model._record_batch
+
+    def counting(conn, cur, job, deleted):
+        record(conn, cur, job, deleted)
+        committed.append(deleted)
+    monkeypatch.setattr(purge_model, "_record_batch", counting)
+    return committed
+
+
+def test_board_is_hidden_then_purged_in_batches(client, batches):
+    board, other = make_board(), make_board()
+    _seed(board)
+    _seed(other)
+    login(client, board.owner)
+
+    response = client.post(f"/boards/boards/{board.board_id}/delete", headers={"Accept": "application/json"})
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+    assert get_board(board.board_id) is None
+    assert _board_rows(board.board_id) == (1, TASKS, TASKS)  # nothing removed yet
+
+    assert run_pending(['purge']) == 1
+    assert _board_rows(board.board_id) == (0, 0, 0)
+    assert _board_rows(other.board_id) == (1, TASKS, TASKS)
+    # 2 + 2 + 1 tasks, each with a label link and a comment, then the board row
+    assert batches == [6, 6, 3, 1]
+    job = get_job(job_id)
+    assert (job.status, job.progress, job.result) == ('done', 16, {'rows_deleted': 16})
+
+
+def test_project_purge_removes_everything(client, batches):
+    board = make_board()
+    _seed(board)
+    login(client, board.owner)
+    response = client.post(f"/boards/projects/{board.project_id}/delete", headers={"Accept": "application/json"})
+    assert response.status_code == 202
+
+    assert run_pending(['purge']) == 1
+    assert _board_rows(board.board_id) == (0, 0, 0)
+    for table, column in (('projects', 'id'), ('labels', 'project_id'), ('project_members', 'project_id')):
+        assert _count(f"SELECT COUNT(*) FROM {table} WHERE {column} = %s", (board.project_id,)) == 0
+
+
+def test_a_worker_that_lost_its_lease_commits_nothing(sqlite_db, batches):
+    board = make_board()
+    _seed(board)
+    job_id = purge_model.soft_delete_board(board.board_id, board.owner.id)
+    job = _claim(['purge'])
+    assert job.id == job_id
+    with get_db() as conn:
+        with conn.cursor() as cur:  # another worker took the job over
+            cur.execute("UPDATE jobs SET leased_by = 'other' WHERE id = %s", (job_id,))
+            conn.commit()
+
+    assert run_job(job) is False
+    assert batches == []
+    assert _board_rows(board.board_id) == (1, TASKS, TASKS)
+    job = get_job(job_id)
+    assert (job.status, job.leased_by, job.progress) == ('running', 'other', 0)
@@ -0,0 +1,113 @@
+# tests/test_rate_limit.py
+# Rate limits: rule parsing, the token bucket (per process and in the
+# memory-mapped file shared by the workers), and the hook answering 429
+# with Retry-After. Processes that start together on a new file all end up
+# on the same table.
+import multiprocessing
+import time
+
+import pytest
+
+from conftest import login, make_user
+from config import Config
+from rate_limit import LocalBuckets, Rule, SharedBuckets, bucket_key, fcntl, parse_rules
+
+needs_fcntl = pytest.mark.skipif(fcntl is None, reason="shared buckets need fcntl")
+
+BURST = 5
+RATE = 1 / 3600  # no refill during the test
+
+
+def test_parse_rules():
+    assert parse_rules("auth.login:post=10/60:ip, boards.move_task_route=60/10") == {
+        ('auth.login', 'POST'): Rule(10, 60.0, 'ip'),
+        ('boards.move_task_route', None): Rule(60, 10.0, 'user'),
+    }
+    assert parse_rules("") == {}
+    for bad in ("auth.login=10", "auth.login=0/60", "auth.login=10/0", "auth.login=10/60:host", "x=a/b"):
+        with pytest.raises(ValueError):
+            parse_rules(bad)
+
+
+@pytest.fixture(params=["local", pytest.param("shared", marks=needs_fcntl)])
+def store(request, tmp_path):
+    if request.param == "local":
+        return LocalBuckets(1000)
+    return SharedBuckets(str(tmp_path / "ratelimit.bin"), 256)
+
+
+def test_bucket_refills_at_its_rate(store):
+    key, rate, burst = bucket_key("a"), 1.0, 3  # 3 at once, then one per second
+    assert [store.take(key, rate, burst, now=100.0) for _ in range(3)] == [0, 0, 0]
+    assert store.take(key, rate, burst, now=100.0) == pytest.approx(1.0)
+    assert store.take(key, rate, burst, now=100.5) == pytest.approx(0.5)
+    assert store.take(key, rate, burst, now=101.0) == 0
+    assert store.take(bucket_key("b"), rate, burst, now=101.0) == 0  # buckets are per key
+    assert [store.take(key, rate, burst, now=200.0) for _ in range(4)][-1] > 0  # refilled to the burst only
+
+
+@needs_fcntl
+def test_shared_buckets_are_seen_by_every_opener(tmp_path):
+    path = str(tmp_path / "ratelimit.bin")
+    first, second = SharedBuckets(path, 256), SharedBuckets(path, 256)
+    key = bucket_key("a")
+    assert first.take(key, RATE, 1, now=100.0) == 0
+    assert second.take(key, RATE, 1, now=100.0) > 0
+
+
+@pytest.fixture
+def limited(sqlite_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(Config, "RATE_LIMITS", "auth.login:POST=2/60:ip, me.my_tasks=1/60:user")
+    monkeypatch.setattr(Config, "RATE_LIMIT_PATH", str(tmp_path / "ratelimit.bin"))
+    from app import create_app
+    app = create_app(start_background=False)
+    app.config.update(TESTING=True)
+    return app.test_client()
+
+
+def test_over_the_limit_is_429_with_retry_after(limited):
+    form = {'username': "nobody", 'password': "x"}
+    assert all(limited.post("/auth/login", data=form).status_code != 429 for _ in range(2))
+    response = limited.post("/auth/login", data=form)
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 30
+    assert response.mimetype == "text/plain"
+    response = limited.post("/auth/login", json=form)
+    assert response.status_code == 429 and response.get_json()['retry_after'] >= 1
+    assert limited.get("/auth/login").status_code == 200  # the rule is for POST only
+
+
+def test_user_rules_count_per_user(limited):
+    for user in (make_user(), make_user()):
+        login(limited, user)
+        assert limited.get("/me/tasks").status_code != 429
+        assert limited.get("/me/tasks").status_code == 429
+
+
+def _worker(path, barrier, results):
+    barrier.wait()
+    store = SharedBuckets(path, 256)
+    results.put(sum(store.take(bucket_key("login|ip:1"), RATE, BURST) == 0 for _ in range(BURST)))
+
+
+@needs_fcntl
+def test_workers_starting_together_share_one_table(tmp_path, monkeypatch):
+    create = SharedBuckets._create
+
+    def slow_create(self):  # widen the gap between the size check and the rename
+        time.sleep(0.05)
+        create(self)
+    monkeypatch.setattr(SharedBuckets, "_create", slow_create)
+
+    context = multiprocessing.get_context("fork")
+    for attempt in range(3):
+        path = str(tmp_path / f"ratelimit{attempt}.bin")
+        barrier, results = context.Barrier(8), context.Queue()
+        workers = [context.Process(target=_worker, args=(path, barrier, results)) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        allowed = sum(results.get(timeout=10) for _ in workers)
+        for worker in workers:
+            worker.join()
+        assert allowed == BURST
@@ -0,0 +1,79 @@
+# tests/test_read_replicas.py
+# Replica routing: one replica per request, round robin across requests,
+# the primary for writes and after a replica fails, and the same choice on
+# scatter()'s shard threads. Connections are replaced by markers; this is
+# about the choice, not the driver.
+import time
+
+import pytest
+from flask import Flask, session
+
+import db
+from config import Config
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    monkeypatch.setattr(Config, "DB_BACKEND", "mysql")
+    monkeypatch.setattr(Config, "SHARDS", {})
+    monkeypatch.setattr(Config, "MYSQL_REPLICAS", [("replica0", 3306), ("replica1", 3306)])
+    monkeypatch.setattr(db, "_replica_next", 0)
+    monkeypatch.setattr(db, "_replica_usable", lambda index: True)
+    monkeypatch.setattr(db, "_replica_connect", lambda index: f"replica{index}")
+    monkeypatch.setattr(db, "get_db", lambda shard=None: "primary")
+    app = Flask(__name__)
+    app.secret_key = "test"
+    return app
+
+
+def test_a_request_reads_one_replica(replicas):
+    seen = []
+    for _ in range(3):
+        with replicas.test_request_context("/boards/boards/1"):
+            seen.append({db.get_read_db() for _ in range(4)})
+    assert seen == [{"replica0"}, {"replica1"}, {"replica0"}]
+
+
+def test_writes_read_the_primary(replicas):
+    with replicas.test_request_context("/boards/boards/1/tasks", method="POST"):
+        assert db.get_read_db() == "primary"
+
+
+def test_a_failed_replica_moves_the_rest_of_the_request_to_the_primary(replicas, monkeypatch):
+    def refuse(index):
+        raise db.mysql.connector.InterfaceError("gone")
+
+    with replicas.test_request_context("/boards/boards/1"):
+        monkeypatch.setattr(db, "_replica_connect", refuse)
+        assert db.get_read_db() == "primary"
+        monkeypatch.setattr(db, "_replica_connect", lambda index: f"replica{index}")
+        assert db.get_read_db() == "primary"
+
+
+# ===============================
+# With shards
+# ===============================
+@pytest.fixture
+def sharded(replicas, monkeypatch):
+    import sharding
+    monkeypatch.setattr(Config, "SHARDS", {1: "shard1:3306"})
+    monkeypatch.setattr(db, "get_db", lambda shard=None: f"primary{db.current_shard() if shard is None else shard}")
+    monkeypatch.setattr(sharding, "get_db", db.get_db)
+    return sharding
+
+
+def test_scatter_reads_the_requests_replica(replicas, sharded):
+    with replicas.test_request_context("/me/tasks"):
+        assert db.get_read_db() == "replica0"
+        assert sharded.scatter(db.get_read_db) == ["replica0", "primary1"]
+    with replicas.test_request_context("/me/tasks"):
+        assert sharded.scatter(db.get_read_db) == ["replica1", "primary1"]
+        assert db.get_read_db() == "replica1"
+
+
+def test_scatter_keeps_read_your_writes(replicas, sharded):
+    with replicas.test_request_context("/me/tasks", method="POST"):
+        assert sharded.scatter(db.get_read_db) == ["primary0", "primary1"]
+    with replicas.test_request_context("/me/tasks"):
+        session["_last_write"] = time.time()
+        assert sharded.scatter(db.get_read_db) == ["primary0", "primary1"]
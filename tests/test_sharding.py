@@ -0,0 +1,89 @@
+# tests/test_sharding.py
+# Two SQLite shards. A moved project is served from its new shard, streamed
+# exports included; while both copies of a project are live (the move
+# window, see sharding.move_project) the cross-shard reads count it once.
+from datetime import date
+
+import pytest
+
+import sharding
+from conftest import login, make_board
+from config import Config
+from db import get_db
+from models.calendar_model import get_calendar
+from models.my_tasks_model import get_my_tasks
+from models.project_model import get_user_projects, get_user_task_counts
+
+
+@pytest.fixture
+def shards(sqlite_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SHARDS", {1: str(tmp_path / "shard1.db")})
+    monkeypatch.setattr(Config, "SHARD_DIRECTORY_TTL", 0)
+    for shard in sharding.shard_ids():
+        sharding.init_shard(shard)
+
+
+@pytest.fixture
+def app(shards):
+    from app import create_app
+    app = create_app(start_background=False)
+    app.config.update(TESTING=True)
+    return app
+
+
+def _tasks(board, titles, due=None):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            for title in titles:
+                cur.execute(
+                    "INSERT INTO tasks (board_id, title, status, assigned_to, due_date, created_by) "
+                    "VALUES (%s, %s, 'To Do', %s, %s, %s)",
+                    (board.board_id, title, board.owner.id, due, board.owner.id)
+                )
+            conn.commit()
+
+
+def test_export_streams_from_the_projects_shard(client):
+    board = make_board()
+    _tasks(board, ["Alpha", "Beta"])
+    assert sharding.move_project(board.project_id, 1, log=lambda message: None)['moved']
+
+    login(client, board.owner)
+    body = client.get(f"/exports/projects/{board.project_id}/tasks.csv").get_data(as_text=True)
+    assert "Alpha" in body and "Beta" in body
+
+
+def _copy_to(shard, project_id):
+    """move_project up to the point where the target copy is live (before the switch)."""
+    sharding.sync_users(shard)
+    with get_db(sharding.HOME_SHARD) as src_conn, get_db(shard) as conn:
+        with src_conn.cursor() as src, conn.cursor() as dst:
+            sharding._copy_project(src, dst, project_id)
+            sharding._copy_tasks(conn, src, dst, project_id)
+            dst.execute("UPDATE projects SET is_deleted = FALSE WHERE id = %s", (project_id,))
+            conn.commit()
+
+
+def _reads(user_id, day):
+    calendar = get_calendar('user', user_id, day, day)
+    return (
+        [project.id for project in get_user_projects(user_id)],
+        get_user_task_counts(user_id),
+        len(get_my_tasks(user_id)[0]),
+        calendar['days'][day.isoformat()]['count'],
+        len(calendar['days'][day.isoformat()]['tasks']),
+    )
+
+
+def test_a_project_live_on_two_shards_is_read_once(shards):
+    day = date(2026, 3, 14)
+    board = make_board()
+    _tasks(board, ["Alpha", "Beta", "Gamma"], due=day)
+    expected = ([board.project_id], {'To Do': 3}, 3, 3, 3)
+    assert _reads(board.owner.id, day) == expected
+
+    _copy_to(1, board.project_id)
+    assert _reads(board.owner.id, day) == expected  # directory: still shard 0
+
+    sharding._set_location(board.project_id, 1, 'active')
+    assert _reads(board.owner.id, day) == expected  # old copy not purged yet
@@ -0,0 +1,78 @@
+# tests/test_task_filter_plans.py
+# Every supported board filter must be served by an index: EXPLAIN the
+# query board_tasks_query() builds for each one and fail on a full scan
+# (access type ALL) of tasks or task_labels. MySQL only (skipped without
+# a server); the schema is seeded with enough boards and tasks that the
+# optimizer has no reason to prefer a scan.
+from datetime import date, timedelta
+
+import pytest
+from werkzeug.datastructures import MultiDict
+
+from conftest import make_board, point_at_mysql
+from db import get_db
+from models.boards_model import board_tasks_query
+from models.import_model import import_tasks
+from models.task_query import compile_task_filters, PRIORITIES, STATUSES
+
+BOARDS = 40
+TASKS_PER_BOARD = 500
+WORDS = ["login", "payment", "report", "search", "upload", "cache", "email", "invoice"]
+
+# One case per supported parameter, plus a combined one
+CASES = [
+    ("default", {}),
+    ("assignee", {"assignee": "me"}),
+    ("assignee=none", {"assignee": "none"}),
+    ("priority", {"priority": "High,Critical"}),
+    ("status", {"status": "In Progress"}),
+    ("due range", {"due_from": "2025-01-01", "due_to": "2025-12-31"}),
+    ("label", {"label": "bug"}),
+    ("text", {"q": "login"}),
+    ("sort=-due", {"sort": "-due"}),
+    ("combined", {"assignee": "me", "priority": "High", "label": "bug", "sort": "priority"}),
+]
+CHECKED_TABLES = {"t", "tl"}
+
+
+def _records(username):
+    start = date(2025, 1, 1)
+    for i in range(TASKS_PER_BOARD):
+        yield i + 1, {
+            'title': f"{WORDS[i % len(WORDS)]} task {i}",
+            'description': f"Fix the {WORDS[(i * 3) % len(WORDS)]} flow",
+            'status': STATUSES[i % len(STATUSES)],
+            'priority': PRIORITIES[i % len(PRIORITIES)],
+            'assignee': username if i % 3 == 0 else None,
+            'due_date': (start + timedelta(days=i % 400)).isoformat(),
+            'labels': "bug" if i % 5 == 0 else "feature",
+        }
+
+
+@pytest.fixture(scope="module")
+def seeded_board(mysql_schema):
+    """(board id, user id): the last of BOARDS seeded boards, analyzed."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        point_at_mysql(monkeypatch, mysql_schema)
+        for _ in range(BOARDS):
+            board = make_board()
+            import_tasks(board.board_id, _records(board.owner.username), board.owner.id)
+        with get_db() as conn:
+            with conn.cursor() as cur:
+                for table in ("tasks", "task_labels", "labels", "boards"):
+                    cur.execute(f"ANALYZE TABLE {table}")
+                    cur.fetchall()
+    return board.board_id, board.owner.id
+
+
+@pytest.mark.parametrize("args", [args for _, args in CASES], ids=[name for name, _ in CASES])
+def test_filter_uses_an_index(mysql_db, seeded_board, args):
+    board_id, user_id = seeded_board
+    sql, params = board_tasks_query(board_id, compile_task_filters(MultiDict(args), current_user_id=user_id))
+    with get_db() as conn:
+        with conn.cursor(dictionary=True) as cur:
+            cur.execute("EXPLAIN " + sql, params)
+            plan = cur.fetchall()
+
+    scans = [row for row in plan if row['table'] in CHECKED_TABLES and row['type'] == 'ALL']
+    assert not scans, "full scan: " + ", ".join(f"{row['table']}:{row['key'] or '-'}" for row in plan)
@@ -0,0 +1,135 @@
+# tests/test_task_writes.py
+# Permission-checked task writes (update, move, delete): the guarded
+# statement either succeeds or the one follow-up query tells 404 (no such
+# task on that board), 403 (role) and 409 (stale If-Match) apart; a write
+# that matched nothing leaves the board's task_version alone. On MySQL,
+# concurrent moves on one board must not deadlock.
+import threading
+
+import pytest
+
+from conftest import add_member, login, make_board, make_user
+from db import get_db
+from models.boards_model import update_task_status
+from models.task_query import STATUSES
+
+
+def _task(board, title="Card"):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO tasks (board_id, title, status, created_by) VALUES (%s, %s, 'To Do', %s)",
+                (board.board_id, title, board.owner.id)
+            )
+            task_id = cur.lastrowid
+            conn.commit()
+    return task_id
+
+
+def _task_version(board_id):
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT task_version FROM boards WHERE id = %s", (board_id,))
+            return cur.fetchone()[0]
+
+
+def _url(board, task_id, suffix=""):
+    return f"/boards/boards/{board.board_id}/tasks/{task_id}{suffix}"
+
+
+@pytest.fixture
+def board(sqlite_db):
+    board = make_board()
+    board.task_id = _task(board)
+    board.viewer = add_member(board.project_id, 'viewer')
+    board.stranger = make_user()
+    return board
+
+
+def test_update_succeeds_and_bumps_versions(client, board):
+    login(client, board.owner)
+    before = _task_version(board.board_id)
+    response = client.put(_url(board, board.task_id), json={'title': "Renamed"})
+    assert response.status_code == 200
+    assert response.get_json()['version'] == 2
+    assert _task_version(board.board_id) == before + 1
+
+
+@pytest.mark.parametrize("method,suffix,body", [
+    ('put', "", {'title': "x"}),
+    ('post', "/move", {'status': 'Done'}),
+    ('delete', "", None),
+])
+def test_missing_task_or_wrong_board_is_404(client, board, method, suffix, body):
+    login(client, board.owner)
+    other = make_board(board.owner)
+    before = _task_version(board.board_id), _task_version(other.board_id)
+    call = getattr(client, method)
+    assert call(_url(board, 999999, suffix), json=body).status_code == 404
+    assert call(_url(other, board.task_id, suffix), json=body).status_code == 404
+    assert (_task_version(board.board_id), _task_version(other.board_id)) == before
+
+
+@pytest.mark.parametrize("who", ['viewer', 'stranger'])
+@pytest.mark.parametrize("method,suffix,body", [
+    ('put', "", {'title': "x"}),
+    ('delete', "", None),
+])
+def test_edit_without_the_role_is_403(client, board, who, method, suffix, body):
+    login(client, getattr(board, who))
+    before = _task_version(board.board_id)
+    assert getattr(client, method)(_url(board, board.task_id, suffix), json=body).status_code == 403
+    assert _task_version(board.board_id) == before
+
+
+def test_viewers_may_move_but_strangers_may_not(client, board):
+    login(client, board.stranger)
+    assert client.post(_url(board, board.task_id, "/move"), json={'status': 'Done'}).status_code == 403
+    login(client, board.viewer)
+    assert client.post(_url(board, board.task_id, "/move"), json={'status': 'Done'}).status_code == 200
+
+
+def test_stale_if_match_is_409_with_the_current_task(client, board):
+    login(client, board.owner)
+    assert client.put(_url(board, board.task_id), json={'title': "First"},
+                      headers={'If-Match': '"v1"'}).status_code == 200
+    before = _task_version(board.board_id)
+    response = client.post(_url(board, board.task_id, "/move"), json={'status': 'Done'},
+                           headers={'If-Match': '"v1"'})
+    assert response.status_code == 409
+    current = response.get_json()['current']
+    assert (current['title'], current['version'], current['status']) == ("First", 2, 'To Do')
+    assert _task_version(board.board_id) == before
+
+
+def test_delete_then_404(client, board):
+    login(client, board.owner)
+    assert client.delete(_url(board, board.task_id)).status_code == 200
+    assert client.delete(_url(board, board.task_id)).status_code == 404
+
+
+# ===============================
+# Lock order (MySQL)
+# ===============================
+def test_concurrent_moves_on_one_board_do_not_deadlock(mysql_db):
+    board = make_board()
+    editor = add_member(board.project_id, 'editor')
+    tasks = [_task(board, f"Card {i}") for i in range(4)]
+    errors = []
+
+    def mover(user, offset):
+        try:
+            for n in range(50):
+                task_id = tasks[(n + offset) % len(tasks)]
+                update_task_status(task_id, STATUSES[n % len(STATUSES)],
+                                   user_id=user.id, board_id=board.board_id)
+        except Exception as err:  # 1213 deadlock, lock wait timeout, ...
+            errors.append(err)
+
+    threads = [threading.Thread(target=mover, args=(user, i))
+               for i, user in enumerate([board.owner, editor] * 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
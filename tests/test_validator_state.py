@@ -0,0 +1,40 @@
+# tests/test_validator_state.py
+# get_task_state / get_board_state (ETags, role checks on reads) return
+# their columns by name on every cursor path: SQLite, and on MySQL both
+# prepared statements and plain cursors with either driver.
+import pytest
+
+from conftest import add_member, make_board
+from config import Config
+from db import get_db
+from models.boards_model import get_board_state, get_task_state
+
+
+def _check(board):
+    viewer = add_member(board.project_id, 'viewer')
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO tasks (board_id, title, created_by) VALUES (%s, %s, %s)",
+                (board.board_id, "Card", board.owner.id)
+            )
+            task_id = cur.lastrowid
+            conn.commit()
+
+    task = get_task_state(task_id, board.board_id, viewer.id)
+    assert (task['role'], task['version'], task['comment_count']) == ('viewer', 1, 0)
+    assert get_board_state(board.board_id, board.owner.id)['role'] == 'owner'
+    assert get_board_state(board.board_id, board.owner.id)['members'] == 2
+    assert get_task_state(task_id, board.board_id + 1, viewer.id) is None
+
+
+def test_state_by_name_sqlite(sqlite_db):
+    _check(make_board())
+
+
+@pytest.mark.parametrize("pure", [True, False], ids=["pure", "cext"])
+@pytest.mark.parametrize("prepared", [True, False], ids=["prepared", "plain"])
+def test_state_by_name_mysql(mysql_db, monkeypatch, pure, prepared):
+    monkeypatch.setattr(Config, "MYSQL_USE_PURE", pure)
+    monkeypatch.setattr(Config, "MYSQL_PREPARED_STATEMENTS", prepared)
+    _check(make_board())
@@ -0,0 +1,14 @@
+# ==============================================================
+# FILE: wsgi.py
+# PURPOSE: Production entry point for gunicorn
+# ==============================================================
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#
+# With preload_app the master imports everything, builds the app and
+# compiles every template once; workers are forked with all of that already
+# in memory. Sockets and threads are created after fork (see post_fork in
+# gunicorn.conf.py), never in the master.
+
+from app import create_app
+
+app = create_app(start_background=False)